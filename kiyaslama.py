@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+anitr-py kıyaslama aracı - Çözümleme yolunu yerel bir sahte AnimeCix/tau-video sunucusuna karşı ölçer
+"""
+
+import argparse
+import atexit
+import builtins
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Dict, Optional, Any
+from unittest import mock
+
+# Kıyaslama gerçek geçmişe, önbelleğe ve yapılandırmaya dokunmasın diye main içe aktarılmadan önce
+# ev dizini geçici bir dizine yönlendirilir
+_EV_DIZINI = tempfile.mkdtemp(prefix="anitr-py-kiyaslama-")
+atexit.register(shutil.rmtree, _EV_DIZINI, ignore_errors=True)
+os.environ["HOME"] = _EV_DIZINI
+os.environ["USERPROFILE"] = _EV_DIZINI
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import main  # noqa: E402
+
+ASAMALAR = ["arama", "baslik", "sezon_tarama", "akis_cozumleme", "altyazi", "bolum_oynat"]
+
+class SahteSunucu:
+    """secure/search, secure/titles, secure/related-videos, bölüm yönlendirmesi ve api/video uçlarını taklit eder"""
+    
+    def __init__(self, gecikme_ms: float = 50, sapma_ms: float = 10, yuk_kb: int = 0,
+                 sezon_sayisi: int = 3, bolum_sayisi: int = 12):
+        self.gecikme = gecikme_ms / 1000
+        self.sapma = sapma_ms / 1000
+        self.dolgu = "x" * (yuk_kb * 1024)
+        self.sezon_sayisi = sezon_sayisi
+        self.bolum_sayisi = bolum_sayisi
+        self.sayaclar: Dict[str, int] = {}
+        self._kilit = threading.Lock()
+        self._rastgele = random.Random(0)
+        self._sunucu: Optional[ThreadingHTTPServer] = None
+    
+    @property
+    def taban_url(self) -> str:
+        return f"http://127.0.0.1:{self._sunucu.server_port}/"
+    
+    def baslat(self) -> None:
+        """Sunucuyu rastgele bir portta arka planda başlat"""
+        sahte = self
+        
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Başlıklar ve gövde ayrı yazılır; Nagle gecikmeli ACK ile birleşip ölçüme ~40 ms eklemesin
+            disable_nagle_algorithm = True
+            
+            def log_message(self, *args) -> None:
+                pass
+            
+            def do_GET(self) -> None:
+                sahte._yanitla(self)
+        
+        self._sunucu = ThreadingHTTPServer(("127.0.0.1", 0), Isleyici, bind_and_activate=False)
+        # Varsayılan dinleme kuyruğu (5) eşzamanlı bağlantı açılışlarında SYN düşürüp ölçüme saniyeler ekler
+        self._sunucu.request_queue_size = 1024
+        self._sunucu.server_bind()
+        self._sunucu.server_activate()
+        self._sunucu.daemon_threads = True
+        threading.Thread(target=self._sunucu.serve_forever, daemon=True).start()
+    
+    def durdur(self) -> None:
+        if self._sunucu is not None:
+            self._sunucu.shutdown()
+            self._sunucu.server_close()
+    
+    def sayaclari_al(self) -> Dict[str, int]:
+        with self._kilit:
+            return dict(self.sayaclar)
+    
+    def _bekle(self) -> None:
+        with self._kilit:
+            sapma = self._rastgele.uniform(-self.sapma, self.sapma)
+        time.sleep(max(0.0, self.gecikme + sapma))
+    
+    def _say(self, islem: str) -> None:
+        with self._kilit:
+            self.sayaclar[islem] = self.sayaclar.get(islem, 0) + 1
+    
+    def _json_gonder(self, isleyici: BaseHTTPRequestHandler, veri: Dict[str, Any]) -> None:
+        if self.dolgu:
+            veri["dolgu"] = self.dolgu
+        govde = json.dumps(veri).encode("utf-8")
+        isleyici.send_response(200)
+        isleyici.send_header("Content-Type", "application/json")
+        isleyici.send_header("Content-Length", str(len(govde)))
+        isleyici.end_headers()
+        isleyici.wfile.write(govde)
+    
+    def _yanitla(self, isleyici: BaseHTTPRequestHandler) -> None:
+        adres = urllib.parse.urlparse(isleyici.path)
+        parametreler = urllib.parse.parse_qs(adres.query)
+        yol = adres.path.lstrip("/")
+        self._bekle()
+        
+        if yol.startswith("secure/search"):
+            self._say("search")
+            self._json_gonder(isleyici, {"results": [
+                {"id": 100 + i, "name": f"Kıyaslama Animesi {i}", "type": "series", "title_type": "anime",
+                 "poster": f"storage/poster{i}.jpg"}
+                for i in range(20)
+            ]})
+        elif yol.startswith("secure/titles"):
+            self._say("titles")
+            self._json_gonder(isleyici, {"title": {"name": "Kıyaslama Animesi 0", "type": "series",
+                                                   "title_type": "anime", "poster": "storage/poster0.jpg"}})
+        elif yol.startswith("secure/related-videos"):
+            self._say("related-videos")
+            sezon = int(parametreler.get("season", ["1"])[0])
+            self._json_gonder(isleyici, {"videos": [
+                {
+                    "name": f"{sezon}. Sezon {bolum}. Bölüm",
+                    "url": f"izle/s{sezon}b{bolum}",
+                    "season_num": sezon,
+                    "title": {"seasons": list(range(1, self.sezon_sayisi + 1))},
+                    "captions": [{"language": "tr", "url": f"{self.taban_url}altyazi/s{sezon}b{bolum}.vtt"}]
+                }
+                for bolum in range(1, self.bolum_sayisi + 1)
+            ]})
+        elif yol.startswith("izle/"):
+            self._say("izle")
+            isleyici.send_response(302)
+            isleyici.send_header("Location", f"/embed/{yol.split('/', 1)[1]}?vid=1")
+            isleyici.send_header("Content-Length", "0")
+            isleyici.end_headers()
+        elif yol.startswith("embed/"):
+            self._say("embed")
+            self._json_gonder(isleyici, {})
+        elif yol.startswith("api/video/"):
+            self._say("api/video")
+            kimlik = yol.rsplit("/", 1)[1]
+            self._json_gonder(isleyici, {"urls": [
+                {"label": etiket, "url": f"{self.taban_url}video/{kimlik}/{etiket}.mp4"}
+                for etiket in ("480p", "720p", "1080p")
+            ]})
+        else:
+            self._say("diger")
+            isleyici.send_response(404)
+            isleyici.send_header("Content-Length", "0")
+            isleyici.end_headers()
+
+class SahteSurec:
+    """bolum_oynat'ın beklediği MPV süreci yerine hemen biten süreç"""
+    
+    def wait(self) -> int:
+        return 0
+    
+    def poll(self) -> int:
+        return 0
+
+def kaynak_olustur(sunucu: SahteSunucu) -> "main.AnimeCix":
+    """Sahte sunucuya yönlendirilmiş, önbelleksiz bir AnimeCix oluştur"""
+    kaynak = main.AnimeCix()
+    kaynak.cekirdek.base_url = sunucu.taban_url
+    kaynak.cekirdek.alternative_url = sunucu.taban_url
+    kaynak.cekirdek.video_api_tabani = sunucu.taban_url
+    return kaynak
+
+def cli_olustur(kaynak: "main.AnimeCix") -> "main.AnimeCLI":
+    """MPV, telemetri ve kalite ölçümü devre dışı bırakılmış, sahte kaynağı kullanan bir AnimeCLI oluştur"""
+    cli = main.AnimeCLI(rpc_devre_disi=True, onbellek_devre_disi=True, servis_kullan=False)
+    cli.config.config["telemetri"] = False
+    cli.kaynak_secici = None
+    cli.anime_kaynak.kapat()
+    cli.anime_kaynak = kaynak
+    cli.onbellek = kaynak.onbellek
+    # Eski kaynağı tutan bileşenler sahte kaynakla yeniden kurulur
+    cli.canli_arama = main.CanliArama(kaynak, cli.baslik_dizini, cli.is_havuzu, bekleme=cli.canli_arama.bekleme)
+    if cli.on_yukleyici is not None:
+        eski = cli.on_yukleyici
+        cli.on_yukleyici = main.OnYukleyici(kaynak, cli.is_havuzu, cli._kalite_sec,
+                                            gecerlilik_suresi=eski.gecerlilik_suresi, isitma_bayt=eski.isitma_bayt)
+    if cli.posterler is not None:
+        cli.posterler.kapat()
+        cli.posterler = None
+    cli.oynatici.oynat = lambda url, altyazi_url, baslik: SahteSurec()
+    cli.oynatici.altyazi_ekle = lambda altyazi_url, zaman_asimi=30.0: None
+    return cli
+
+def yuzdelik(ornekler: List[float], oran: float) -> float:
+    """Sıralı örneklerde en yakın sıra yöntemiyle yüzdelik değeri"""
+    sirali = sorted(ornekler)
+    return sirali[min(len(sirali) - 1, max(0, int(round(oran * len(sirali) + 0.5)) - 1))]
+
+def kiyasla(sunucu: SahteSunucu, tekrar: int, isinma: int = 1) -> Dict[str, Any]:
+    """Her tekrarda yeni bir kaynakla tüm aşamaları çalıştır; aşama başına süreleri ve istek sayılarını topla"""
+    sureler: Dict[str, List[float]] = {asama: [] for asama in ASAMALAR}
+    istekler: Dict[str, Dict[str, int]] = {asama: {} for asama in ASAMALAR}
+    
+    for tur in range(isinma + tekrar):
+        kaynak = kaynak_olustur(sunucu)
+        cli = cli_olustur(kaynak)
+        olcumler: Dict[str, tuple] = {}
+        
+        def olc(asama: str, islem):
+            onceki = sunucu.sayaclari_al()
+            baslangic = time.perf_counter()
+            sonuc = islem()
+            sure = time.perf_counter() - baslangic
+            sonraki = sunucu.sayaclari_al()
+            olcumler[asama] = (sure, {k: sonraki[k] - onceki.get(k, 0) for k in sonraki if sonraki[k] != onceki.get(k, 0)})
+            return sonuc
+        
+        sonuclar = olc("arama", lambda: kaynak.arama_verisi_al("kıyaslama animesi"))
+        anime = olc("baslik", lambda: kaynak.id_ile_anime_al(str(sonuclar[0]["id"])))
+        bolumler = olc("sezon_tarama", lambda: kaynak.bolumler_verisini_al(anime["id"]))
+        bolum = bolumler[len(bolumler) // 2]
+        olc("akis_cozumleme", lambda: kaynak.izleme_verisini_al(bolum["id"]))
+        olc("altyazi", lambda: kaynak.tr_altyazi_al(bolum["ekstra"]["sezon_num"] - 1, 0, anime["id"], bolum["id"]))
+        cikti = io.StringIO()
+        
+        def girdi_yok(istem: str = "") -> str:
+            # Oynatma hatası "Enter'a basın" istemiyle kıyaslamayı askıda bırakmasın
+            raise RuntimeError(f"bolum_oynat kullanıcı girdisi bekledi: {cikti.getvalue().strip()}")
+        
+        with contextlib.redirect_stdout(cikti), mock.patch.object(builtins, "input", girdi_yok):
+            olc("bolum_oynat", lambda: cli.bolum_oynat(anime, bolum, bolumler.index(bolum), len(bolumler)))
+        
+        kaynak.kapat()
+        cli.is_havuzu.shutdown(wait=True)
+        cli.gecmis.kapat()
+        cli.baslik_dizini.kapat()
+        if tur < isinma:
+            continue
+        for asama, (sure, sayac) in olcumler.items():
+            sureler[asama].append(sure * 1000)
+            for islem, adet in sayac.items():
+                istekler[asama][islem] = istekler[asama].get(islem, 0) + adet
+    
+    return {
+        "ayarlar": {
+            "gecikme_ms": sunucu.gecikme * 1000,
+            "sapma_ms": sunucu.sapma * 1000,
+            "yuk_kb": len(sunucu.dolgu) // 1024,
+            "sezon_sayisi": sunucu.sezon_sayisi,
+            "bolum_sayisi": sunucu.bolum_sayisi,
+            "tekrar": tekrar
+        },
+        "asamalar": {
+            asama: {
+                "p50_ms": round(yuzdelik(sureler[asama], 0.50), 2),
+                "p95_ms": round(yuzdelik(sureler[asama], 0.95), 2),
+                "istekler": {islem: round(adet / tekrar, 2) for islem, adet in sorted(istekler[asama].items())}
+            }
+            for asama in ASAMALAR
+        }
+    }
+
+def sonuclari_yazdir(sonuc: Dict[str, Any], taban: Optional[Dict[str, Any]] = None) -> None:
+    """Aşama başına p50/p95 sürelerini ve tekrar başına istek sayılarını tablo olarak yazdır"""
+    ayarlar = sonuc["ayarlar"]
+    print(f"⏱  {ayarlar['tekrar']} tekrar, gecikme {ayarlar['gecikme_ms']:.0f}±{ayarlar['sapma_ms']:.0f} ms, "
+          f"yük {ayarlar['yuk_kb']} KB, {ayarlar['sezon_sayisi']} sezon × {ayarlar['bolum_sayisi']} bölüm\n")
+    print(f"  {'aşama':<16} {'p50 ms':>9} {'p95 ms':>9}  {'taban p50':>10} {'fark':>8}  istekler/tekrar")
+    for asama, deger in sonuc["asamalar"].items():
+        taban_degeri = (taban or {}).get("asamalar", {}).get(asama)
+        taban_p50 = f"{taban_degeri['p50_ms']:.2f}" if taban_degeri else "-"
+        fark = "-"
+        if taban_degeri and taban_degeri["p50_ms"] > 0:
+            fark = f"{(deger['p50_ms'] / taban_degeri['p50_ms'] - 1) * 100:+.0f}%"
+        istekler = ", ".join(f"{islem}={adet:g}" for islem, adet in deger["istekler"].items()) or "-"
+        print(f"  {asama:<16} {deger['p50_ms']:>9.2f} {deger['p95_ms']:>9.2f}  {taban_p50:>10} {fark:>8}  {istekler}")
+
+def gerilemeler(sonuc: Dict[str, Any], taban: Dict[str, Any], esik: float, mutlak_esik_ms: float = 5.0) -> List[str]:
+    """p50'si tabandan esik oranından ve mutlak eşikten fazla artan ya da daha çok istek yapan aşamaları döndür"""
+    bulunanlar = []
+    for asama, deger in sonuc["asamalar"].items():
+        taban_degeri = taban.get("asamalar", {}).get(asama)
+        if not taban_degeri:
+            continue
+        artis = deger["p50_ms"] - taban_degeri["p50_ms"]
+        if artis > mutlak_esik_ms and deger["p50_ms"] > taban_degeri["p50_ms"] * (1 + esik):
+            bulunanlar.append(f"{asama}: p50 {taban_degeri['p50_ms']:.2f} -> {deger['p50_ms']:.2f} ms")
+        istek = sum(deger["istekler"].values())
+        taban_istek = sum(taban_degeri["istekler"].values())
+        if istek > taban_istek:
+            bulunanlar.append(f"{asama}: istek/tekrar {taban_istek:g} -> {istek:g}")
+    return bulunanlar
+
+def main_kiyaslama() -> int:
+    """Kıyaslama giriş noktası; taban dosyasına göre gerileme varsa 1 döndürür"""
+    parser = argparse.ArgumentParser(description="anitr-py çözümleme yolunu sahte bir sunucuya karşı ölçer")
+    parser.add_argument("--tekrar", type=int, default=20, help="Ölçülen tekrar sayısı (varsayılan: 20)")
+    parser.add_argument("--gecikme", type=float, default=50, help="Sunucu yanıt gecikmesi, ms (varsayılan: 50)")
+    parser.add_argument("--sapma", type=float, default=10, help="Gecikmeye eklenen rastgele sapma, ± ms (varsayılan: 10)")
+    parser.add_argument("--yuk", type=int, default=0, help="JSON yanıtlarına eklenen dolgu, KB (varsayılan: 0)")
+    parser.add_argument("--sezon", type=int, default=3, help="Sahte animenin sezon sayısı (varsayılan: 3)")
+    parser.add_argument("--bolum", type=int, default=12, help="Sezon başına bölüm sayısı (varsayılan: 12)")
+    parser.add_argument("--kaydet", help="Sonuçları taban olarak bu JSON dosyasına yazar")
+    parser.add_argument("--karsilastir", help="Sonuçları bu taban dosyasıyla karşılaştırır")
+    parser.add_argument("--esik", type=float, default=10, help="Gerileme sayılacak p50 artışı, yüzde (varsayılan: 10)")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdırır")
+    args = parser.parse_args()
+    
+    sunucu = SahteSunucu(args.gecikme, args.sapma, args.yuk, args.sezon, args.bolum)
+    sunucu.baslat()
+    try:
+        sonuc = kiyasla(sunucu, args.tekrar)
+    finally:
+        sunucu.durdur()
+    
+    taban = None
+    if args.karsilastir:
+        with open(args.karsilastir, 'r', encoding='utf-8') as f:
+            taban = json.load(f)
+    
+    if args.json:
+        print(json.dumps(sonuc, ensure_ascii=False, indent=2))
+    else:
+        sonuclari_yazdir(sonuc, taban)
+    
+    if args.kaydet:
+        with open(args.kaydet, 'w', encoding='utf-8') as f:
+            json.dump(sonuc, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Taban {args.kaydet} dosyasına kaydedildi")
+    
+    if taban is not None:
+        bulunanlar = gerilemeler(sonuc, taban, args.esik / 100)
+        if bulunanlar:
+            print("\n❌ Gerileme:")
+            for satir in bulunanlar:
+                print(f"  {satir}")
+            return 1
+        print("\n✅ Tabana göre gerileme yok")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main_kiyaslama())
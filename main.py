@@ -3,14 +3,30 @@
 anitr-py - Terminalde Türkçe altyazılı anime arama ve izleme aracı
 """
 
+import time
+
+# --baslangic-profili için ölçümlerin başlangıç noktası
+_BASLANGIC = time.perf_counter()
+
 import argparse
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import functools
+import hashlib
 import json
 import os
+import queue
+import socket
+import shutil
 import sys
-import time
 import subprocess
-import requests
 import threading
+import unicodedata
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 import urllib.parse
@@ -19,17 +35,238 @@ import urllib.parse
 CONFIG_DIR = Path.home() / ".anitr-py"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 HISTORY_FILE = CONFIG_DIR / "gecmis.json"
+HISTORY_DB = CONFIG_DIR / "gecmis.db"
+TITLE_DB = CONFIG_DIR / "basliklar.db"
+CACHE_DIR = CONFIG_DIR / "onbellek"
+POSTER_DIR = CONFIG_DIR / "posterler"
+METRICS_FILE = CONFIG_DIR / "metrikler.jsonl"
+HOST_SCORES_FILE = CONFIG_DIR / "host_olcumleri.json"
 VIDEOS_DIR = Path.home() / "Videolar" / "anitr-py"
+PROFILE_DIR = CONFIG_DIR / "profiller"
+SERVICE_SOCKET = CONFIG_DIR / "servis.sock"
+
+# (aşama, bitiş zamanı) çiftleri; --baslangic-profili ile yazdırılır
+_BASLANGIC_OLCUMLERI: List[tuple] = [("modül içe aktarma", time.perf_counter())]
+
+def baslangic_olcumu(asama: str) -> None:
+    """Başlangıç profili için bir aşamanın bittiği anı kaydet"""
+    _BASLANGIC_OLCUMLERI.append((asama, time.perf_counter()))
+
+def baslangic_profilini_yazdir() -> None:
+    """Başlangıç aşamalarının sürelerini yazdır"""
+    print("⏱  Başlangıç profili:")
+    onceki = _BASLANGIC
+    for asama, zaman in _BASLANGIC_OLCUMLERI:
+        print(f"  {asama:<24} {(zaman - onceki) * 1000:8.2f} ms")
+        onceki = zaman
+    print(f"  {'toplam':<24} {(onceki - _BASLANGIC) * 1000:8.2f} ms")
+
+class _BosAralik:
+    """Profil kapalıyken döndürülen, hiçbir şey kaydetmeyen aralık"""
+    __slots__ = ()
+    
+    def __enter__(self) -> "_BosAralik":
+        return self
+    
+    def __exit__(self, *hata) -> bool:
+        return False
+    
+    def ekle(self, **argumanlar) -> None:
+        pass
+
+_BOS_ARALIK = _BosAralik()
+
+class _Aralik:
+    """Başlangıç ve bitişi monoton saatle ölçülen tek bir profil aralığı"""
+    __slots__ = ("profilci", "ad", "kategori", "argumanlar", "baslangic")
+    
+    def __init__(self, profilci: "Profilci", ad: str, kategori: str, argumanlar: Dict[str, Any]):
+        self.profilci = profilci
+        self.ad = ad
+        self.kategori = kategori
+        self.argumanlar = argumanlar
+        self.baslangic = 0.0
+    
+    def __enter__(self) -> "_Aralik":
+        self.baslangic = time.perf_counter()
+        return self
+    
+    def __exit__(self, hata_turu, hata, iz) -> bool:
+        if hata_turu is not None:
+            self.argumanlar["hata"] = hata_turu.__name__
+        self.profilci._kaydet(self.ad, self.kategori, self.baslangic, time.perf_counter(), self.argumanlar)
+        return False
+    
+    def ekle(self, **argumanlar) -> None:
+        """Aralığa host, bayt, önbellek durumu gibi bilgiler ekle"""
+        self.argumanlar.update(argumanlar)
+
+class Profilci:
+    """--profil ile açılan, aralıkları Chrome-trace/Perfetto JSON biçiminde toplayan kaydedici"""
+    
+    # Uzun oturumlarda bellek sınırsız büyümesin
+    EN_FAZLA_OLAY = 500_000
+    # asyncio görevlerinin izlerine verilen kimliklerin başlangıcı; iş parçacığı kimlikleriyle çakışmaz
+    GOREV_IZI_TABANI = 1 << 62
+    
+    def __init__(self):
+        # Kapalıyken tüm ölçüm noktaları yalnızca bu özniteliği okur
+        self.acik = False
+        self._olaylar: List[Dict[str, Any]] = []
+        self._is_parcaciklari: Dict[int, str] = {}
+        # Aynı olay döngüsündeki eşzamanlı görevlerin aralıkları iç içe geçmez; her görev kendi izine yazılır
+        self._gorev_izleri: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+        self._gorev_sayaci = 0
+        self._kilit = threading.Lock()
+        self._sifir = 0.0
+    
+    def ac(self) -> None:
+        """Kaydı başlat; zaman damgaları bu andan itibaren ölçülür"""
+        with self._kilit:
+            self._olaylar = []
+            self._is_parcaciklari = {}
+            self._gorev_izleri = weakref.WeakKeyDictionary()
+            self._gorev_sayaci = 0
+            self._sifir = time.perf_counter()
+            self.acik = True
+    
+    def aralik(self, ad: str, kategori: str, **argumanlar) -> Any:
+        """with ile kullanılacak bir aralık döndür; profil kapalıysa boş aralık"""
+        if not self.acik:
+            return _BOS_ARALIK
+        return _Aralik(self, ad, kategori, argumanlar)
+    
+    @staticmethod
+    def _gecerli_gorev() -> Any:
+        """Bu iş parçacığında çalışan asyncio görevi; asyncio hiç yüklenmediyse ya da görev yoksa None"""
+        asyncio = sys.modules.get("asyncio")
+        if asyncio is None:
+            return None
+        try:
+            return asyncio.current_task()
+        except RuntimeError:
+            return None
+    
+    def _kaydet(self, ad: str, kategori: str, baslangic: float, bitis: float, argumanlar: Dict[str, Any]) -> None:
+        gorev = self._gecerli_gorev()
+        is_parcacigi = threading.current_thread().name
+        with self._kilit:
+            if gorev is None:
+                tid, iz_adi = threading.get_ident(), is_parcacigi
+            else:
+                tid = self._gorev_izleri.get(gorev)
+                if tid is None:
+                    self._gorev_sayaci += 1
+                    tid = self._gorev_izleri[gorev] = self.GOREV_IZI_TABANI + self._gorev_sayaci
+                iz_adi = f"{is_parcacigi} {gorev.get_name()}"
+        olay = {
+            "name": ad,
+            "cat": kategori,
+            "ph": "X",
+            "ts": round((baslangic - self._sifir) * 1_000_000, 3),
+            "dur": round((bitis - baslangic) * 1_000_000, 3),
+            "pid": os.getpid(),
+            "tid": tid,
+            "args": argumanlar
+        }
+        with self._kilit:
+            if len(self._olaylar) < self.EN_FAZLA_OLAY:
+                self._olaylar.append(olay)
+            if tid not in self._is_parcaciklari:
+                self._is_parcaciklari[tid] = iz_adi
+    
+    def yaz(self, dosya: Path) -> Path:
+        """Toplanan aralıkları Chrome-trace JSON dosyasına yaz"""
+        with self._kilit:
+            olaylar = list(self._olaylar)
+            is_parcaciklari = dict(self._is_parcaciklari)
+        
+        pid = os.getpid()
+        ust_veri = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "anitr-py"}}]
+        ust_veri += [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": ad}}
+            for tid, ad in is_parcaciklari.items()
+        ]
+        
+        dosya.parent.mkdir(parents=True, exist_ok=True)
+        with open(dosya, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": ust_veri + olaylar, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        return dosya
+
+PROFILCI = Profilci()
 
-# Yapılandırma dizinini oluştur (yoksa)
-CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
+def profille(kategori: str):
+    """Metodu profil aralığıyla sarmala; profil kapalıyken yalnızca tek bir bayrak kontrolü eklenir"""
+    def sarmala(fonksiyon):
+        ad = fonksiyon.__qualname__
+        
+        @functools.wraps(fonksiyon)
+        def sarmalayici(*args, **kwargs):
+            if not PROFILCI.acik:
+                return fonksiyon(*args, **kwargs)
+            with _Aralik(PROFILCI, ad, kategori, {}):
+                return fonksiyon(*args, **kwargs)
+        return sarmalayici
+    return sarmala
+
+def asenkron_profille(kategori: str):
+    """profille'nin eşyordamlar için karşılığı; aralık eşyordamın beklendiği tüm süreyi kapsar ve çalışan
+    görevin izine yazılır"""
+    def sarmala(fonksiyon):
+        ad = fonksiyon.__qualname__
+        
+        @functools.wraps(fonksiyon)
+        async def sarmalayici(*args, **kwargs):
+            if not PROFILCI.acik:
+                return await fonksiyon(*args, **kwargs)
+            with _Aralik(PROFILCI, ad, kategori, {}):
+                return await fonksiyon(*args, **kwargs)
+        return sarmalayici
+    return sarmala
+
+def yapilandirma_dizini_olustur() -> None:
+    """Yapılandırma dizinini oluştur (yoksa); dosya yazmadan hemen önce çağrılır"""
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 # Varsayılan yapılandırma
 DEFAULT_CONFIG = {
     "varsayilan_kaynak": "animecix",
     "gecmis_limiti": 0,
-    "rpc_devre_disi": False
+    "rpc_devre_disi": False,
+    "baglanti_zaman_asimi": 5,
+    "okuma_zaman_asimi": 20,
+    "yeniden_deneme_sayisi": 2,
+    "host_basina_eszamanli_istek": 4,
+    "onbellek_devre_disi": False,
+    "onbellek_boyut_mb": 50,
+    "cozumleme_zaman_asimi": 30,
+    "on_yukleme": False,
+    "on_yukleme_gecerlilik": 300,
+    "on_yukleme_isitma_kb": 0,
+    "art_arda_izleme": False,
+    "art_arda_onde": 2,
+    "telemetri": True,
+    "indirme_host_basina_baglanti": 4,
+    "indirme_hiz_siniri_kb": 0,
+    "akis_vekili": False,
+    "akis_vekili_bellek_mb": 64,
+    "akis_vekili_onde_parca": 4,
+    "akis_vekili_baglanti": 4,
+    "uyarlanabilir_kalite": True,
+    "kalite_olcum_kb": 512,
+    "kalite_olcum_omru": 3600,
+    "canli_arama": True,
+    "canli_arama_bekleme_ms": 300,
+    "poster_onizleme": True,
+    "poster_onbellek_mb": 20,
+    "servis_kullan": True,
+    "arama_zaman_asimi": 10,
+    "baslik_zaman_asimi": 10,
+    "bolum_listesi_zaman_asimi": 20,
+    "yedek_istek": True,
+    "negatif_onbellek_omru": 120,
+    "devre_kesici_esigi": 3,
+    "devre_kesici_bekleme": 30
 }
 
 class Config:
@@ -43,14 +280,13 @@ class Config:
                 with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
                     return {**DEFAULT_CONFIG, **json.load(f)}
             except Exception:
-                return DEFAULT_CONFIG
-        else:
-            # Varsayılan yapılandırmayı kaydet
-            self.kaydet_config(DEFAULT_CONFIG)
-            return DEFAULT_CONFIG
+                return dict(DEFAULT_CONFIG)
+        # Dosya yoksa varsayılanlar kullanılır; dosya yalnızca kaydedilince oluşur
+        return dict(DEFAULT_CONFIG)
     
     def kaydet_config(self, config: Dict[str, Any]) -> None:
         """Yapılandırmayı dosyaya kaydet"""
+        yapilandirma_dizini_olustur()
         with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
 
@@ -60,319 +296,3165 @@ class Logger:
     
     def hata_kaydet(self, error: Exception) -> None:
         """Hatayı dosyaya kaydet"""
+        yapilandirma_dizini_olustur()
         with open(self.log_file, 'a', encoding='utf-8') as f:
             f.write(f"[HATA] {time.strftime('%Y-%m-%d %H:%M:%S')} - {str(error)}\n")
     
     def mesaj_kaydet(self, message: str) -> None:
         """Mesajı dosyaya kaydet"""
+        yapilandirma_dizini_olustur()
         with open(self.log_file, 'a', encoding='utf-8') as f:
             f.write(f"[BILGI] {time.strftime('%Y-%m-%d %H:%M:%S')} - {message}\n")
 
-class AnimeCix:
-    """AnimeCix kaynak uygulaması"""
+class HttpIstemcisi:
+    """Host başına bağlantı havuzu tutan, kalıcı bağlantılı ortak HTTP istemcisi"""
     
-    def __init__(self):
-        self.base_url = "https://animecix.tv/"
-        self.alternative_url = "https://mangacix.net/"
-        self.video_players = ["tau-video.xyz", "sibnet"]
-        self.http_headers = {
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0",
-            "x-e-h": "=.a"
-        }
+    def __init__(self, varsayilan_basliklar: Optional[Dict[str, str]] = None,
+                 baglanti_zaman_asimi: float = 5.0, okuma_zaman_asimi: float = 20.0,
+                 yeniden_deneme: int = 2, geri_cekilme: float = 0.3,
+                 havuz_sayisi: int = 8, host_basina_baglanti: int = 4):
+        self.zaman_asimi = (baglanti_zaman_asimi, okuma_zaman_asimi)
+        self.host_basina_baglanti = host_basina_baglanti
+        self.varsayilan_basliklar = dict(varsayilan_basliklar or {})
+        self.yeniden_deneme = yeniden_deneme
+        self.geri_cekilme = geri_cekilme
+        self.havuz_sayisi = havuz_sayisi
+        self.sayaclar: Dict[str, Dict[str, int]] = {}
+        self._kilit = threading.Lock()
+        self._host_semaforlari: Dict[str, threading.BoundedSemaphore] = {}
+        # Ağ yığını (requests/urllib3) ilk istekte kurulur
+        self._oturum = None
     
-    def kaynak(self) -> str:
-        return "AnimeciX"
+    @property
+    def oturum(self):
+        """requests oturumunu ilk kullanımda oluştur"""
+        with self._kilit:
+            if self._oturum is None:
+                import requests
+                from urllib3.util.retry import Retry
+                
+                # 5xx yanıtlarında ve bağlantı kopmalarında sınırlı sayıda, artan beklemeyle yeniden dene
+                yeniden_deneme_politikasi = Retry(
+                    total=self.yeniden_deneme,
+                    connect=self.yeniden_deneme,
+                    read=self.yeniden_deneme,
+                    status=self.yeniden_deneme,
+                    backoff_factor=self.geri_cekilme,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset({"GET", "HEAD"}),
+                    raise_on_status=False
+                )
+                adaptor = _sayan_adaptor_sinifi(self._el_sikisma_say)(
+                    pool_connections=self.havuz_sayisi,
+                    pool_maxsize=self.host_basina_baglanti,
+                    max_retries=yeniden_deneme_politikasi
+                )
+                
+                oturum = requests.Session()
+                oturum.mount("https://", adaptor)
+                oturum.mount("http://", adaptor)
+                oturum.headers.update(self.varsayilan_basliklar)
+                # Yönlendirme adımları dahil her yanıt için çağrılır
+                oturum.hooks["response"].append(self._yanit_say)
+                self._oturum = oturum
+            return self._oturum
     
-    def arama_verisi_al(self, sorgu: str) -> List[Dict[str, Any]]:
-        """Sorgu için arama verilerini al"""
-        # Türkçe karakterleri normalize et
-        normalize_edilmis_sorgu = self._turkce_normalize(sorgu).replace(" ", "-")
+    def _sayac(self, host: str) -> Dict[str, int]:
+        # Kilit tutulurken çağrılır
+        return self.sayaclar.setdefault(host, {"istek": 0, "yeniden_kullanim": 0, "el_sikisma": 0})
+    
+    def _el_sikisma_say(self, host: str) -> None:
+        """Havuzun hosta açtığı yeni bağlantıyı say"""
+        with self._kilit:
+            self._sayac(host)["el_sikisma"] += 1
+    
+    def _yanit_say(self, response: Any, *args, **kwargs) -> None:
+        """Yanıtın hostu için istek sayacını artır; yeni bağlantı açmayan istekler yeniden kullanım sayılır"""
+        with self._kilit:
+            sayac = self._sayac(urllib.parse.urlsplit(response.url).netloc)
+            sayac["istek"] += 1
+            sayac["yeniden_kullanim"] = max(0, sayac["istek"] - sayac["el_sikisma"])
+        return response
+    
+    def _host_semaforu(self, url: str) -> threading.BoundedSemaphore:
+        """URL'nin hostu için eşzamanlı istek sınırını uygulayan semaforu döndür"""
+        host = urllib.parse.urlparse(url).netloc
+        with self._kilit:
+            if host not in self._host_semaforlari:
+                self._host_semaforlari[host] = threading.BoundedSemaphore(self.host_basina_baglanti)
+            return self._host_semaforlari[host]
+    
+    def get(self, url: str, **kwargs) -> Any:
+        """Havuzdaki bir bağlantı üzerinden GET isteği gönder"""
+        kwargs.setdefault("timeout", self.zaman_asimi)
+        with PROFILCI.aralik("http GET", "http") as aralik:
+            # Aynı hosta aynı anda en fazla host_basina_baglanti istek gider
+            with self._host_semaforu(url):
+                response = self.oturum.get(url, **kwargs)
+            if PROFILCI.acik:
+                parcalar = urllib.parse.urlsplit(url)
+                # Akış yanıtlarında gövde okunmadığından boyut başlıktan alınır
+                bayt = response.headers.get("Content-Length") if kwargs.get("stream") else len(response.content)
+                aralik.ekle(host=parcalar.netloc, yol=parcalar.path, durum=response.status_code, bayt=bayt)
+            return response
+    
+    def istatistikler(self) -> Dict[str, Dict[str, int]]:
+        """Host başına sayaçların bir kopyasını döndür"""
+        with self._kilit:
+            return {host: dict(sayac) for host, sayac in self.sayaclar.items()}
+    
+    def kapat(self) -> None:
+        """Havuzdaki tüm bağlantıları kapat"""
+        if self._oturum is not None:
+            self._oturum.close()
+
+def _sayan_adaptor_sinifi(el_sikisma_say: Any) -> Any:
+    """Havuzlarının kurduğu her bağlantıyı el_sikisma_say(host) ile bildiren HTTPAdapter alt sınıfını döndür"""
+    import requests
+    from urllib3 import ProxyManager
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    
+    def sayan(havuz_sinifi: Any) -> Any:
+        class SayanBaglanti(havuz_sinifi.ConnectionCls):
+            def connect(self) -> None:
+                super().connect()
+                host = f"[{self.host}]" if ":" in self.host else self.host
+                el_sikisma_say(host if self.port in (None, self.default_port) else f"{host}:{self.port}")
         
-        url = f"{self.base_url}secure/search/{normalize_edilmis_sorgu}?type=&limit=20"
-        try:
-            response = requests.get(url, headers=self.http_headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            results = data.get("results", [])
-            return_data = []
-            
-            for item in results:
-                return_data.append({
-                    "id": item.get("id"),
-                    "baslik": item.get("name", ""),
-                    "tur": item.get("type", ""),
-                    "baslik_turu": item.get("title_type", ""),
-                    "gorsel_url": item.get("poster", "")
-                })
-            
-            return return_data
-        except Exception as e:
-            raise Exception(f"Arama başarısız: {str(e)}")
+        return type(f"Sayan{havuz_sinifi.__name__}", (havuz_sinifi,), {"ConnectionCls": SayanBaglanti})
     
-    def id_ile_anime_al(self, anime_id: str) -> Dict[str, Any]:
-        """ID ile anime verisini al"""
-        try:
-            url = f"{self.base_url}secure/titles/{anime_id}?titleId={anime_id}"
-            response = requests.get(url, headers=self.http_headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            title_data = data.get("title", {})
+    havuz_siniflari = {"http": sayan(HTTPConnectionPool), "https": sayan(HTTPSConnectionPool)}
+    
+    class SayanAdaptor(requests.adapters.HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs) -> None:
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = havuz_siniflari
+        
+        def proxy_manager_for(self, *args, **kwargs) -> Any:
+            yonetici = super().proxy_manager_for(*args, **kwargs)
+            # SOCKS vekillerinin kendi havuz sınıfları vardır; onlar sayılmaz
+            if isinstance(yonetici, ProxyManager):
+                yonetici.pool_classes_by_scheme = havuz_siniflari
+            return yonetici
+    
+    return SayanAdaptor
+
+def istek_anahtari(url: str) -> str:
+    """URL'yi aynı isteği gösteren adresler aynı anahtarı verecek biçimde normalize et"""
+    parcalar = urllib.parse.urlsplit(url)
+    sorgu = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parcalar.query, keep_blank_values=True)))
+    return urllib.parse.urlunsplit((parcalar.scheme.lower(), parcalar.netloc.lower(), parcalar.path or "/", sorgu, ""))
+
+class GecikmeOlcer:
+    """Host başına son yanıt sürelerini tutup yedek istek eşiği için p95 tahmini yapan kayan pencere"""
+    
+    def __init__(self, pencere: int = 200, en_az_ornek: int = 20, varsayilan: float = 1.0, taban: float = 0.05):
+        self.pencere = pencere
+        self.en_az_ornek = en_az_ornek
+        # Yeterli ölçüm birikene kadar kullanılan eşik ve eşiğin inebileceği en düşük değer (sn)
+        self.varsayilan = varsayilan
+        self.taban = taban
+        self._sureler: Dict[str, deque] = {}
+        self._kilit = threading.Lock()
+    
+    def kaydet(self, host: str, sure: float) -> None:
+        """Hostun bir yanıt süresini pencereye ekle"""
+        with self._kilit:
+            if host not in self._sureler:
+                self._sureler[host] = deque(maxlen=self.pencere)
+            self._sureler[host].append(sure)
+    
+    def p95(self, host: str) -> float:
+        """Hostun p95 yanıt süresini döndür; az ölçüm varsa varsayılan eşiği kullan"""
+        with self._kilit:
+            ornekler = sorted(self._sureler.get(host, ()))
+        if len(ornekler) < self.en_az_ornek:
+            return self.varsayilan
+        return max(self.taban, ornekler[int(0.95 * (len(ornekler) - 1))])
+    
+    def ozet(self) -> Dict[str, float]:
+        """Yeterli ölçümü olan her host için p95 tahminini döndür"""
+        with self._kilit:
+            hostlar = [host for host, sureler in self._sureler.items() if len(sureler) >= self.en_az_ornek]
+        return {host: self.p95(host) for host in hostlar}
+
+class NegatifOnbellek:
+    """Bozuk olduğu yakın zamanda görülen bölüm ve gömme adreslerini hata nedeniyle birlikte kısa süre tutar"""
+    
+    def __init__(self, omur: float = 120.0, en_fazla_kayit: int = 1024):
+        self.omur = omur
+        self.en_fazla_kayit = en_fazla_kayit
+        # Anahtar -> (son kullanma zamanı, hata nedeni); en eski kayıt başta
+        self._kayitlar: "OrderedDict[str, tuple]" = OrderedDict()
+        self.isabet = 0
+        self._kilit = threading.Lock()
+    
+    def al(self, anahtar: str) -> Optional[str]:
+        """Anahtar hâlâ bozuk sayılıyorsa kaydedilen hata nedenini döndür"""
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is None:
+                return None
+            if kayit[0] <= time.monotonic():
+                del self._kayitlar[anahtar]
+                return None
+            self.isabet += 1
+            return kayit[1]
+    
+    def ekle(self, anahtar: str, neden: str) -> None:
+        """Anahtarı ömür boyunca bozuk olarak işaretle"""
+        if self.omur <= 0:
+            return
+        with self._kilit:
+            self._kayitlar.pop(anahtar, None)
+            self._kayitlar[anahtar] = (time.monotonic() + self.omur, neden)
+            while len(self._kayitlar) > self.en_fazla_kayit:
+                self._kayitlar.popitem(last=False)
+    
+    def istatistikler(self) -> Dict[str, int]:
+        with self._kilit:
+            simdi = time.monotonic()
+            return {"kayit": sum(1 for son, _ in self._kayitlar.values() if son > simdi), "isabet": self.isabet}
+
+class DevreKesici:
+    """Host başına devre kesici: art arda hata veren hosta bir süre istek gönderilmez,
+    süre dolunca tek bir deneme isteği geçer ve sonucuna göre devre kapanır ya da yeniden açılır"""
+    
+    KAPALI = "kapali"
+    ACIK = "acik"
+    YARI_ACIK = "yari_acik"
+    
+    def __init__(self, hata_esigi: int = 3, bekleme: float = 30.0):
+        self.hata_esigi = hata_esigi
+        self.bekleme = bekleme
+        self._hostlar: Dict[str, Dict[str, Any]] = {}
+        self._kilit = threading.Lock()
+    
+    def _host(self, host: str) -> Dict[str, Any]:
+        if host not in self._hostlar:
+            self._hostlar[host] = {"durum": self.KAPALI, "ardisik_hata": 0, "zaman": 0.0, "acilma": 0, "reddedilen": 0}
+        return self._hostlar[host]
+    
+    def izin_ver(self, host: str) -> bool:
+        """Hosta istek gönderilebilir mi; açık devrenin süresi dolduysa yalnızca bir deneme isteğine izin ver"""
+        if self.hata_esigi <= 0:
+            return True
+        with self._kilit:
+            durum = self._host(host)
+            if durum["durum"] == self.KAPALI:
+                return True
+            simdi = time.monotonic()
+            # Yarı açıkken gönderilen deneme bekleme süresince sonuçlanmadıysa yeni bir denemeye izin verilir
+            if simdi - durum["zaman"] >= self.bekleme:
+                durum["durum"] = self.YARI_ACIK
+                durum["zaman"] = simdi
+                return True
+            durum["reddedilen"] += 1
+            return False
+    
+    def basari(self, host: str) -> None:
+        """Host yanıt verdi; devreyi kapat"""
+        with self._kilit:
+            durum = self._host(host)
+            durum["durum"] = self.KAPALI
+            durum["ardisik_hata"] = 0
+    
+    def hata(self, host: str) -> None:
+        """Host yanıt vermedi; eşik aşıldıysa ya da deneme isteği başarısızsa devreyi aç"""
+        if self.hata_esigi <= 0:
+            return
+        with self._kilit:
+            durum = self._host(host)
+            durum["ardisik_hata"] += 1
+            if durum["durum"] == self.ACIK:
+                return
+            if durum["durum"] == self.YARI_ACIK or durum["ardisik_hata"] >= self.hata_esigi:
+                durum["durum"] = self.ACIK
+                durum["zaman"] = time.monotonic()
+                durum["acilma"] += 1
+    
+    def acik_mi(self, host: str) -> bool:
+        """Devre açık ve bekleme sürüyor mu; izin_ver'in aksine durumu değiştirmez"""
+        if self.hata_esigi <= 0:
+            return False
+        with self._kilit:
+            durum = self._hostlar.get(host)
+            return bool(durum) and durum["durum"] == self.ACIK and time.monotonic() - durum["zaman"] < self.bekleme
+    
+    def birak(self, host: str) -> None:
+        """İstek host hakkında bilgi vermeden bitti (iptal, bütçe); yarı açıksa sıradaki istek yeniden deneyebilir"""
+        with self._kilit:
+            durum = self._host(host)
+            if durum["durum"] == self.YARI_ACIK:
+                durum["zaman"] = time.monotonic() - self.bekleme
+    
+    def durumlar(self) -> Dict[str, Dict[str, Any]]:
+        """Her hostun devre durumunu, açılma ve reddedilen istek sayılarını döndür"""
+        with self._kilit:
+            simdi = time.monotonic()
             return {
-                "id": int(anime_id),
-                "baslik": title_data.get("name", ""),
-                "tur": title_data.get("type", ""),
-                "baslik_turu": title_data.get("title_type", ""),
-                "gorsel_url": title_data.get("poster", "")
+                host: {
+                    "durum": durum["durum"],
+                    "ardisik_hata": durum["ardisik_hata"],
+                    "acilma": durum["acilma"],
+                    "reddedilen": durum["reddedilen"],
+                    "kalan": max(0.0, self.bekleme - (simdi - durum["zaman"])) if durum["durum"] == self.ACIK else 0.0
+                }
+                for host, durum in self._hostlar.items()
             }
-        except Exception as e:
-            raise Exception(f"Anime verisi alınamadı: {str(e)}")
+
+class YanitOnbellegi:
+    """CONFIG_DIR altında tutulan, uç nokta başına TTL'li ve LRU tahliyeli API yanıt önbelleği"""
     
-    def bolumler_verisini_al(self, sezon_id: int) -> List[Dict[str, Any]]:
-        """Sezon için bölüm verilerini al"""
-        try:
-            bolumler_raw = self._anime_bolumleri_verisini_al(sezon_id)
-            bolumler = []
-            
-            for i, item in enumerate(bolumler_raw):
-                bolumler.append({
-                    "id": item["url"],
-                    "baslik": item["name"],
-                    "numara": i + 1,
-                    "ekstra": {"sezon_num": item["season_num"]}
-                })
-            
-            return bolumler
-        except Exception as e:
-            raise Exception(f"Bölümler alınamadı: {str(e)}")
+    # Uç nokta başına tazelik süreleri (saniye)
+    VARSAYILAN_TTL = {
+        "secure/search": 60 * 60,
+        "secure/titles": 24 * 60 * 60,
+        "secure/related-videos": 6 * 60 * 60
+    }
     
-    def izleme_verisini_al(self, bolum_url: str) -> List[Dict[str, str]]:
-        """Bölüm için izleme verisini al"""
-        try:
-            return self._anime_izle_api_url(bolum_url)
-        except Exception as e:
-            raise Exception(f"İzleme verisi alınamadı: {str(e)}")
+    def __init__(self, dizin: Path = CACHE_DIR, boyut_siniri: int = 50 * 1024 * 1024,
+                 ttl: Optional[Dict[str, int]] = None):
+        self.dizin = dizin
+        self.boyut_siniri = boyut_siniri
+        self.ttl = {**self.VARSAYILAN_TTL, **(ttl or {})}
+        self.sayaclar = {"isabet": 0, "iska": 0, "dogrulama": 0}
+        self._kilit = threading.Lock()
+        self._toplam_boyut: Optional[int] = None
     
-    def tr_altyazi_al(self, sezon_indeks: int, bolum_indeks: int, anime_id: int) -> str:
-        """Türkçe altyazı URL'sini al"""
-        try:
-            url = f"{self.alternative_url}secure/related-videos?episode=1&season={sezon_indeks+1}&titleId={anime_id}&videoId=637113"
-            response = requests.get(url, headers=self.http_headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            videolar = data.get("videos", [])
-            if bolum_indeks < len(videolar):
-                video = videolar[bolum_indeks]
-                altyazilar = video.get("captions", [])
-                
-                # Türkçe altyazıyı ara
-                for altyazi in altyazilar:
-                    if altyazi.get("language") == "tr":
-                        return altyazi.get("url", "")
-                
-                # Türkçe altyazı yoksa ilkini döndür
-                if altyazilar:
-                    return altyazilar[0].get("url", "")
-            
-            return ""
-        except Exception:
-            return ""
+    def uc_nokta(self, url: str) -> Optional[str]:
+        """URL'nin önbelleğe alınabilen uç noktasını döndür (yoksa None)"""
+        yol = urllib.parse.urlparse(url).path.lstrip("/")
+        for uc_nokta in self.ttl:
+            if yol.startswith(uc_nokta):
+                return uc_nokta
+        return None
     
-    def _anime_bolumleri_verisini_al(self, anime_id: int) -> List[Dict[str, Any]]:
-        """Anime bölümleri verisini al"""
-        bolumler = []
-        gorulmus_bolumler = set()
+    def _dosya(self, url: str) -> Path:
+        return self.dizin / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+    
+    def oku(self, url: str) -> Optional[Dict[str, Any]]:
+        """Önbellekteki kaydı döndür; kayıt TTL içindeyse 'taze' alanı True olur"""
+        uc_nokta = self.uc_nokta(url)
+        if uc_nokta is None:
+            return None
         
+        dosya = self._dosya(url)
         try:
-            sezonlar = self._anime_sezonlari_verisini_al(anime_id)
-            
-            for sezon_indeks in sezonlar:
-                url = f"{self.alternative_url}secure/related-videos?episode=1&season={sezon_indeks+1}&titleId={anime_id}&videoId=637113"
-                response = requests.get(url, headers=self.http_headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                videolar = data.get("videos", [])
-                for video in videolar:
-                    name = video.get("name", "")
-                    if name not in gorulmus_bolumler:
-                        bolum_url = video.get("url", "")
-                        sezon_num = video.get("season_num")
-                        bolumler.append({
-                            "name": name,
-                            "url": bolum_url,
-                            "season_num": sezon_num
-                        })
-                        gorulmus_bolumler.add(name)
-            
-            return bolumler
-        except Exception as e:
-            raise Exception(f"Bölümler alınamadı: {str(e)}")
+            with open(dosya, 'r', encoding='utf-8') as f:
+                kayit = json.load(f)
+            # Dosyanın değiştirilme zamanı LRU sırası olarak kullanılır
+            os.utime(dosya)
+        except (OSError, ValueError):
+            with self._kilit:
+                self.sayaclar["iska"] += 1
+            return None
+        
+        kayit["taze"] = time.time() - kayit.get("zaman", 0) < self.ttl[uc_nokta]
+        with self._kilit:
+            self.sayaclar["isabet" if kayit["taze"] else "iska"] += 1
+        return kayit
     
-    def _anime_sezonlari_verisini_al(self, anime_id: int) -> List[int]:
-        """Anime sezonları verisini al"""
+    def yaz(self, url: str, veri: Any, etag: Optional[str] = None, son_degisiklik: Optional[str] = None) -> None:
+        """Yanıtı doğrulayıcılarıyla birlikte önbelleğe yaz"""
+        if self.uc_nokta(url) is None:
+            return
+        
+        kayit = {
+            "url": url,
+            "zaman": time.time(),
+            "etag": etag,
+            "son_degisiklik": son_degisiklik,
+            "veri": veri
+        }
         try:
-            url = f"{self.alternative_url}secure/related-videos?episode=1&season=1&titleId={anime_id}&videoId=637113"
-            response = requests.get(url, headers=self.http_headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            videolar = data.get("videos", [])
-            if videolar:
-                baslik = videolar[0].get("title", {})
-                sezonlar = baslik.get("seasons", [])
-                return list(range(len(sezonlar)))
+            self.dizin.mkdir(parents=True, exist_ok=True)
+            dosya = self._dosya(url)
+            eski_boyut = dosya.stat().st_size if dosya.exists() else 0
             
-            return []
-        except Exception as e:
-            raise Exception(f"Sezonlar alınamadı: {str(e)}")
-    
-    def _anime_izle_api_url(self, bolum_url: str) -> List[Dict[str, str]]:
-        """Bölüm için video URL'lerini al"""
-        try:
-            izle_url = f"{self.base_url}{bolum_url}"
-            response = requests.get(izle_url)
+            # Yarım kalan yazma mevcut kaydı bozmasın diye geçici dosyaya yazıp yer değiştir
+            gecici = dosya.with_name(f"{dosya.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(gecici, 'w', encoding='utf-8') as f:
+                json.dump(kayit, f, ensure_ascii=False)
+            os.replace(gecici, dosya)
             
-            if response.status_code == 422:
-                raise Exception("Bölüm verisi beklenen formatta değil")
+            with self._kilit:
+                if self._toplam_boyut is None:
+                    self._toplam_boyut = self._boyut_hesapla()
+                else:
+                    self._toplam_boyut += dosya.stat().st_size - eski_boyut
+                tahliye_gerekli = self._toplam_boyut > self.boyut_siniri
             
-            final_url = response.url
-            parsed_url = urllib.parse.urlparse(final_url)
-            path_parts = parsed_url.path.split("/")
+            if tahliye_gerekli:
+                self._tahliye_et()
+        except OSError:
+            pass
+    
+    def tazele(self, url: str, kayit: Dict[str, Any]) -> None:
+        """Sunucunun değişmedi (304) dediği kaydın zamanını yenile"""
+        with self._kilit:
+            self.sayaclar["dogrulama"] += 1
+        self.yaz(url, kayit["veri"], kayit.get("etag"), kayit.get("son_degisiklik"))
+    
+    def _boyut_hesapla(self) -> int:
+        return sum(dosya.stat().st_size for dosya in self.dizin.glob("*.json"))
+    
+    def _tahliye_et(self) -> None:
+        """Boyut sınırının altına inene kadar en uzun süredir kullanılmayan kayıtları sil"""
+        with self._kilit:
+            dosyalar = []
+            for dosya in self.dizin.glob("*.json"):
+                try:
+                    bilgi = dosya.stat()
+                    dosyalar.append((bilgi.st_mtime, bilgi.st_size, dosya))
+                except OSError:
+                    continue
             
-            if len(path_parts) < 3:
-                raise Exception("Yol verisi beklenen formatta değil")
+            toplam = sum(boyut for _, boyut, _ in dosyalar)
+            for _, boyut, dosya in sorted(dosyalar):
+                if toplam <= self.boyut_siniri:
+                    break
+                try:
+                    dosya.unlink()
+                    toplam -= boyut
+                except OSError:
+                    continue
+            self._toplam_boyut = toplam
+    
+    def temizle(self) -> int:
+        """Önbellekteki tüm kayıtları sil ve silinen kayıt sayısını döndür"""
+        silinen = 0
+        with self._kilit:
+            if self.dizin.exists():
+                for dosya in self.dizin.glob("*.json"):
+                    try:
+                        dosya.unlink()
+                        silinen += 1
+                    except OSError:
+                        continue
+            self._toplam_boyut = 0
+        return silinen
+    
+    def istatistikler(self) -> Dict[str, int]:
+        """Önbellek sayaçlarının bir kopyasını döndür"""
+        with self._kilit:
+            return dict(self.sayaclar)
+
+class PosterOnbellegi:
+    """Arama sonuçlarının posterlerini küçültülmüş olarak CONFIG_DIR altında tutan, LRU tahliyeli önbellek"""
+    
+    KUCUK_BOYUT = (160, 240)
+    # Bellekte tutulan en fazla chafa önizlemesi; en uzun süre kullanılmayan atılır
+    EN_FAZLA_ONIZLEME = 64
+    
+    def __init__(self, istemci: HttpIstemcisi, dizin: Path = POSTER_DIR, boyut_siniri: int = 20 * 1024 * 1024,
+                 is_sayisi: int = 4, taban_url: str = ""):
+        self.istemci = istemci
+        self.dizin = dizin
+        self.boyut_siniri = boyut_siniri
+        self.is_sayisi = is_sayisi
+        self.taban_url = taban_url
+        self.sayaclar = {"isabet": 0, "indirilen": 0, "hata": 0}
+        # Her yeni poster hazır olduğunda artar; arayüz değişince yeniden çizmek için izler
+        self.surum = 0
+        self._kilit = threading.Lock()
+        self._havuz: Optional[ThreadPoolExecutor] = None
+        self._yoldakiler: set = set()
+        self._toplam_boyut: Optional[int] = None
+        # (url, genişlik, yükseklik) -> önizleme (chafa başarısızsa None) ve hazırlanmakta olan önizlemeler
+        self._onizlemeler: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+        self._hazirlanan: Dict[tuple, Future] = {}
+    
+    def _tam_url(self, url: str) -> str:
+        return urllib.parse.urljoin(self.taban_url, url)
+    
+    def _dosya(self, url: str) -> Path:
+        return self.dizin / f"{hashlib.sha256(self._tam_url(url).encode('utf-8')).hexdigest()}.img"
+    
+    def yol(self, url: str) -> Optional[Path]:
+        """Poster indirilmişse dosya yolunu döndür (yoksa None)"""
+        if not url:
+            return None
+        dosya = self._dosya(url)
+        return dosya if dosya.exists() else None
+    
+    def on_yukle(self, urller: List[str]) -> None:
+        """Posterleri küçük bir iş havuzunda aynı anda indirmeye başla; beklemeden döner"""
+        for url in dict.fromkeys(u for u in urller if u):
+            dosya = self._dosya(url)
+            if dosya.exists():
+                try:
+                    # Dosyanın değiştirilme zamanı LRU sırası olarak kullanılır
+                    os.utime(dosya)
+                    with self._kilit:
+                        self.sayaclar["isabet"] += 1
+                except OSError:
+                    pass
+                continue
             
-            embed_id = path_parts[2]
-            query_params = urllib.parse.parse_qs(parsed_url.query)
-            vid = query_params.get("vid", [""])[0]
+            with self._kilit:
+                if url in self._yoldakiler:
+                    continue
+                self._yoldakiler.add(url)
+                self._is_havuzu().submit(self._indir, url)
+    
+    def _is_havuzu(self) -> ThreadPoolExecutor:
+        # Kilit tutulurken çağrılır; indirmeler ve önizleme çizimleri aynı havuzu paylaşır
+        if self._havuz is None:
+            self._havuz = ThreadPoolExecutor(max_workers=self.is_sayisi, thread_name_prefix="anitr-py-poster")
+        return self._havuz
+    
+    def _kucult(self, veri: bytes) -> bytes:
+        """Pillow yüklüyse posteri küçük bir JPEG'e dönüştür; değilse olduğu gibi sakla"""
+        try:
+            from PIL import Image
+        except ImportError:
+            return veri
+        import io
+        
+        resim = Image.open(io.BytesIO(veri)).convert("RGB")
+        resim.thumbnail(self.KUCUK_BOYUT)
+        cikti = io.BytesIO()
+        resim.save(cikti, "JPEG", quality=80)
+        return cikti.getvalue()
+    
+    def _indir(self, url: str) -> None:
+        try:
+            response = self.istemci.get(self._tam_url(url), headers={"Accept": "image/*"})
+            response.raise_for_status()
+            veri = self._kucult(response.content)
             
-            api_url = f"https://{self.video_players[0]}/api/video/{embed_id}?vid={vid}"
-            api_response = requests.get(api_url)
-            api_response.raise_for_status()
+            self.dizin.mkdir(parents=True, exist_ok=True)
+            dosya = self._dosya(url)
+            gecici = dosya.with_name(f"{dosya.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(gecici, 'wb') as f:
+                f.write(veri)
+            os.replace(gecici, dosya)
             
-            video_data = api_response.json()
-            urls = video_data.get("urls", [])
+            with self._kilit:
+                self.sayaclar["indirilen"] += 1
+                self.surum += 1
+                if self._toplam_boyut is None:
+                    self._toplam_boyut = self._boyut_hesapla()
+                else:
+                    self._toplam_boyut += len(veri)
+                tahliye_gerekli = self._toplam_boyut > self.boyut_siniri
             
-            results = []
-            for item in urls:
-                results.append({
-                    "etiket": item.get("label", ""),
-                    "url": item.get("url", "")
-                })
+            if tahliye_gerekli:
+                self._tahliye_et()
+        except Exception:
+            with self._kilit:
+                self.sayaclar["hata"] += 1
+        finally:
+            with self._kilit:
+                self._yoldakiler.discard(url)
+    
+    def _boyut_hesapla(self) -> int:
+        return sum(dosya.stat().st_size for dosya in self.dizin.glob("*.img"))
+    
+    def _tahliye_et(self) -> None:
+        """Kota altına inene kadar en uzun süredir kullanılmayan posterleri sil"""
+        with self._kilit:
+            dosyalar = []
+            for dosya in self.dizin.glob("*.img"):
+                try:
+                    bilgi = dosya.stat()
+                    dosyalar.append((bilgi.st_mtime, bilgi.st_size, dosya))
+                except OSError:
+                    continue
             
-            return results
-        except Exception as e:
-            raise Exception(f"Video URL'leri alınamadı: {str(e)}")
+            toplam = sum(boyut for _, boyut, _ in dosyalar)
+            for _, boyut, dosya in sorted(dosyalar):
+                if toplam <= self.boyut_siniri:
+                    break
+                try:
+                    dosya.unlink()
+                    toplam -= boyut
+                except OSError:
+                    continue
+            self._toplam_boyut = toplam
     
-    def _turkce_normalize(self, text: str) -> str:
-        """Türkçe karakterleri ASCII ile değiştir"""
-        replacements = {
-            "ö": "o", "ü": "u", "ı": "i", "ç": "c", "ş": "s", "ğ": "g",
-            "Ö": "O", "Ü": "U", "İ": "I", "Ç": "C", "Ş": "S", "Ğ": "G"
-        }
+    def onizleme(self, url: str, genislik: int = 20, yukseklik: int = 10, bekle: float = 0.0) -> Optional[str]:
+        """Poster ve chafa önizlemesi hazırsa döndür; değilse önizlemeyi arka planda çizmeye başlayıp None döndür
         
-        for turkish, ascii_char in replacements.items():
-            text = text.replace(turkish, ascii_char)
+        Önizleme hazır olduğunda surum artar; arayüz yeniden çizildiğinde önizleme gelir. bekle verilirse
+        önizlemenin çizilmesi en fazla bu kadar saniye beklenir.
+        """
+        anahtar = (url, genislik, yukseklik)
+        with self._kilit:
+            if anahtar in self._onizlemeler:
+                self._onizlemeler.move_to_end(anahtar)
+                return self._onizlemeler[anahtar]
+            gelecek = self._hazirlanan.get(anahtar)
         
-        return text
-
-class GecmisYonetici:
-    """Anime izleme geçmişi yöneticisi"""
-    
-    def __init__(self):
-        self.gecmis_dosya = HISTORY_FILE
-        self.gecmis = self._gecmis_yukle()
-    
-    def _gecmis_yukle(self) -> Dict[str, Any]:
-        """Geçmişi dosyadan yükle"""
-        if self.gecmis_dosya.exists():
+        if gelecek is None:
+            dosya = self.yol(url)
+            chafa = shutil.which("chafa")
+            if dosya is None or chafa is None:
+                return None
+            with self._kilit:
+                gelecek = self._hazirlanan.get(anahtar)
+                if gelecek is None:
+                    gelecek = self._is_havuzu().submit(self._onizleme_ciz, anahtar, chafa, dosya)
+                    self._hazirlanan[anahtar] = gelecek
+        
+        if bekle > 0:
             try:
-                with open(self.gecmis_dosya, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return gelecek.result(timeout=bekle)
             except Exception:
-                return {}
-        return {}
+                return None
+        return None
     
-    def gecmis_kaydet(self) -> None:
-        """Geçmişi dosyaya kaydet"""
+    def _onizleme_ciz(self, anahtar: tuple, chafa: str, dosya: Path) -> Optional[str]:
+        _, genislik, yukseklik = anahtar
         try:
-            with open(self.gecmis_dosya, 'w', encoding='utf-8') as f:
-                json.dump(self.gecmis, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Geçmiş kaydedilemedi: {e}")
+            onizleme = subprocess.run(
+                [chafa, f"--size={genislik}x{yukseklik}", "--format=symbols", str(dosya)],
+                capture_output=True, text=True, timeout=2, check=True
+            ).stdout.rstrip("\n")
+        except (OSError, subprocess.SubprocessError):
+            onizleme = None
+        
+        with self._kilit:
+            self._hazirlanan.pop(anahtar, None)
+            self._onizlemeler[anahtar] = onizleme
+            while len(self._onizlemeler) > self.EN_FAZLA_ONIZLEME:
+                self._onizlemeler.popitem(last=False)
+            self.surum += 1
+        return onizleme
     
-    def gecmis_guncelle(self, kaynak: str, anime_adi: str, bolum_adi: str, anime_id: str, bolum_indeks: int) -> None:
-        """Geçmişi izlenen bölümle güncelle"""
-        try:
-            if kaynak not in self.gecmis:
-                self.gecmis[kaynak] = {}
-            
-            self.gecmis[kaynak][anime_adi] = {
-                "son_bolum_adi": bolum_adi,
-                "son_bolum_indeks": bolum_indeks,
-                "anime_id": anime_id,
-                "son_izlenme": time.time()
-            }
-            
-            self.gecmis_kaydet()
-        except Exception as e:
-            print(f"Geçmiş güncellenemedi: {e}")
+    def istatistikler(self) -> Dict[str, int]:
+        """Poster sayaçlarının bir kopyasını döndür"""
+        with self._kilit:
+            return dict(self.sayaclar)
+    
+    def kapat(self) -> None:
+        """Bekleyen indirmeleri iptal et"""
+        if self._havuz is not None:
+            self._havuz.shutdown(wait=False, cancel_futures=True)
 
-class MPVOynatici:
-    """MPV oynatıcı denetleyicisi"""
+# Türkçe harfleri ASCII karşılıklarına çevirir (büyük/küçük harf korunur)
+_TURKCE_ASCII = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+# NFKD ayrıştırmasından önce: noktalı/noktasız i'ler ayrışmadığı için doğrudan i'ye çevrilir
+_TURKCE_I_TABLOSU = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+# Katlamanın sonunda noktalama boşluğa çevrilir
+_NOKTALAMA_TABLOSU = str.maketrans({isaret: " " for isaret in "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"})
+
+def baslik_katla(metin: str) -> str:
+    """Başlığı aramada karşılaştırılacak biçime getir: 'Şingeki no Kyojin: Final' -> 'singeki no kyojin final',
+    'Pokémon' -> 'pokemon'"""
+    ayrisik = unicodedata.normalize("NFKD", metin.translate(_TURKCE_I_TABLOSU))
+    metin = "".join(harf for harf in ayrisik if not unicodedata.combining(harf)).casefold()
+    return " ".join(metin.translate(_NOKTALAMA_TABLOSU).split())
+
+def duzenleme_mesafesi(a: str, b: str, sinir: int) -> int:
+    """Levenshtein mesafesi; sınırı aştığı anlaşılınca sinir + 1 döndürür"""
+    if abs(len(a) - len(b)) > sinir:
+        return sinir + 1
+    onceki = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        satir = [i]
+        for j, cb in enumerate(b, 1):
+            satir.append(min(onceki[j] + 1, satir[j - 1] + 1, onceki[j - 1] + (ca != cb)))
+        if min(satir) > sinir:
+            return sinir + 1
+        onceki = satir
+    return onceki[-1]
+
+class BaslikDizini:
+    """Görülen arama/başlık yanıtlarından ve geçmişten oluşan yerel başlık dizini; aramayı ağa gitmeden yanıtlar"""
     
-    def __init__(self):
-        self.socket_path = f"/tmp/anitr-py-{int(time.time())}.sock"
+    # İzlenmiş başlıkların sıralamadaki öne çıkma payı yarı ömürle azalır
+    YENILIK_PAYI = 0.15
+    YENILIK_YARI_OMRU = 30 * 24 * 3600
+    ESIK = 0.5
     
-    def yuklu_mu(self) -> bool:
-        """MPV'nin yüklü olup olmadığını kontrol et"""
-        try:
-            subprocess.run(["mpv", "--version"], 
-                          stdout=subprocess.DEVNULL, 
-                          stderr=subprocess.DEVNULL)
-            return True
-        except FileNotFoundError:
-            return False
+    def __init__(self, veritabani: Path = TITLE_DB, gecmis: Optional["GecmisYonetici"] = None, kaynak: str = "animecix"):
+        self.veritabani = veritabani
+        self.gecmis = gecmis
+        self.kaynak = kaynak
+        self._baglanti = None
+        self._kilit = threading.Lock()
+        # anime_id -> kayıt ve üçlü harf -> anime_id kümesi; ilk aramada bellekte kurulur
+        self._kayitlar: Optional[Dict[str, Dict[str, Any]]] = None
+        self._uclular: Dict[str, set] = defaultdict(set)
+        self.logger = Logger()
     
-    def oynat(self, url: str, altyazi_url: Optional[str], baslik: str) -> subprocess.Popen:
-        """Videoyu MPV ile oynat"""
-        if not self.yuklu_mu():
-            raise Exception("Sisteminizde MPV yüklü değil")
+    def _baglan(self):
+        """Veritabanı bağlantısını ilk kullanımda aç ve şemayı kur"""
+        if self._baglanti is not None:
+            return self._baglanti
         
-        args = [
-            "mpv",
-            "--fullscreen",
-            "--save-position-on-quit",
-            f"--title={baslik}",
-            f"--force-media-title={baslik}",
-            "--idle=once",
-            "--really-quiet",
-            "--no-terminal",
-            f"--input-ipc-server={self.socket_path}",
-            "--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/137.0.0.0 Safari/537.36",
-            "--referrer=https://yeshi.eu.org/"
+        import sqlite3
+        
+        yapilandirma_dizini_olustur()
+        baglanti = sqlite3.connect(str(self.veritabani), timeout=10, isolation_level=None, check_same_thread=False)
+        baglanti.execute("PRAGMA journal_mode=WAL")
+        baglanti.execute("PRAGMA synchronous=NORMAL")
+        baglanti.execute("PRAGMA busy_timeout=10000")
+        baglanti.execute("""
+            CREATE TABLE IF NOT EXISTS basliklar (
+                kaynak TEXT NOT NULL,
+                anime_id TEXT NOT NULL,
+                baslik TEXT NOT NULL,
+                tur TEXT,
+                baslik_turu TEXT,
+                gorsel_url TEXT,
+                son_gorulme REAL,
+                PRIMARY KEY (kaynak, anime_id)
+            )
+        """)
+        self._baglanti = baglanti
+        return baglanti
+    
+    @staticmethod
+    def _uclu_harfler(katlanmis: str) -> set:
+        """Kelime başları boşlukla işaretlenmiş üçlü harf kümesi"""
+        uclular = set()
+        for kelime in katlanmis.split():
+            kelime = " " + kelime
+            uclular.update(kelime[i:i + 3] for i in range(max(1, len(kelime) - 2)))
+        return uclular
+    
+    def _bellege_ekle(self, kayit: Dict[str, Any]) -> None:
+        kayit["katlanmis"] = baslik_katla(kayit["baslik"])
+        eski = self._kayitlar.get(kayit["anime_id"])
+        if eski:
+            kayit["son_izlenme"] = eski.get("son_izlenme")
+            for uclu in self._uclu_harfler(eski["katlanmis"]):
+                self._uclular[uclu].discard(kayit["anime_id"])
+        self._kayitlar[kayit["anime_id"]] = kayit
+        anime_id = kayit["anime_id"]
+        for uclu in self._uclu_harfler(kayit["katlanmis"]):
+            self._uclular[uclu].add(anime_id)
+    
+    def _yukle(self) -> Dict[str, Dict[str, Any]]:
+        """Dizini veritabanından ve geçmişten belleğe bir kez yükle (kilit tutulurken çağrılır)"""
+        if self._kayitlar is not None:
+            return self._kayitlar
+        
+        self._kayitlar = {}
+        satirlar = self._baglan().execute(
+            "SELECT anime_id, baslik, tur, baslik_turu, gorsel_url, son_gorulme FROM basliklar WHERE kaynak = ?",
+            (self.kaynak,)
+        ).fetchall()
+        for anime_id, baslik, tur, baslik_turu, gorsel_url, son_gorulme in satirlar:
+            self._bellege_ekle({
+                "anime_id": anime_id, "baslik": baslik, "tur": tur, "baslik_turu": baslik_turu,
+                "gorsel_url": gorsel_url, "son_gorulme": son_gorulme, "son_izlenme": None
+            })
+        
+        # Geçmişteki animeler hiç aranmamış olsa da bulunur ve izlenme zamanıyla öne çıkar
+        if self.gecmis is not None:
+            for kayit in self.gecmis.son_izlenenler(self.kaynak, -1):
+                if not kayit["anime_id"]:
+                    continue
+                if kayit["anime_id"] not in self._kayitlar:
+                    self._bellege_ekle({
+                        "anime_id": kayit["anime_id"], "baslik": kayit["anime_adi"], "tur": "", "baslik_turu": "",
+                        "gorsel_url": "", "son_gorulme": None, "son_izlenme": None
+                    })
+                mevcut = self._kayitlar[kayit["anime_id"]]
+                mevcut["son_izlenme"] = max(mevcut["son_izlenme"] or 0, kayit["son_izlenme"] or 0)
+        return self._kayitlar
+    
+    def yukle(self) -> None:
+        """Dizini önceden belleğe al; ilk aramanın yükleme süresini beklemesini önler"""
+        try:
+            with self._kilit:
+                self._yukle()
+        except Exception:
+            pass
+    
+    def ekle(self, animeler: List[Dict[str, Any]]) -> None:
+        """Arama ya da başlık yanıtındaki animeleri dizine ekle veya güncelle"""
+        simdi = time.time()
+        kayitlar = [
+            {
+                "anime_id": str(anime["id"]), "baslik": anime["baslik"], "tur": anime.get("tur", ""),
+                "baslik_turu": anime.get("baslik_turu", ""), "gorsel_url": anime.get("gorsel_url", ""),
+                "son_gorulme": simdi, "son_izlenme": None
+            }
+            for anime in animeler if anime.get("id") is not None and anime.get("baslik")
         ]
+        if not kayitlar:
+            return
         
-        if altyazi_url and altyazi_url.strip():
-            args.extend(["--sub-file", altyazi_url])
+        try:
+            with self._kilit:
+                baglanti = self._baglan()
+                baglanti.execute("BEGIN")
+                try:
+                    baglanti.executemany(
+                        "INSERT OR REPLACE INTO basliklar VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [(self.kaynak, k["anime_id"], k["baslik"], k["tur"], k["baslik_turu"], k["gorsel_url"], simdi)
+                         for k in kayitlar]
+                    )
+                    baglanti.execute("COMMIT")
+                except BaseException:
+                    baglanti.execute("ROLLBACK")
+                    raise
+                if self._kayitlar is not None:
+                    for kayit in kayitlar:
+                        self._bellege_ekle(kayit)
+        except Exception as e:
+            self.logger.hata_kaydet(Exception(f"Başlık dizini güncellenemedi: {str(e)}"))
+    
+    def _eslesme_puani(self, sorgu: str, sorgu_kelimeleri: List[str], katlanmis: str) -> float:
+        """1 tam eşleşme; önek eşleşmesi yüksek, yazım hatalı eşleşme düşük puan; sorgudaki her kelime eşleşmeli"""
+        if katlanmis == sorgu:
+            return 1.0
+        if katlanmis.startswith(sorgu):
+            return 0.95
         
-        args.append(url)
+        kelimeler = katlanmis.split()
+        toplam = 0.0
+        for sorgu_kelimesi in sorgu_kelimeleri:
+            # Kısa kelimelerde yazım hatası tahmini anlamsızlaşır
+            sinir = 0 if len(sorgu_kelimesi) < 3 else 1 if len(sorgu_kelimesi) <= 5 else 2
+            en_iyi = 0.0
+            for kelime in kelimeler:
+                if kelime.startswith(sorgu_kelimesi):
+                    en_iyi = max(en_iyi, 1.0 if kelime == sorgu_kelimesi else 0.9)
+                    continue
+                if sinir:
+                    mesafe = min(
+                        duzenleme_mesafesi(sorgu_kelimesi, kelime[:len(sorgu_kelimesi)], sinir),
+                        duzenleme_mesafesi(sorgu_kelimesi, kelime, sinir)
+                    )
+                    if mesafe <= sinir:
+                        en_iyi = max(en_iyi, 0.75 - 0.15 * mesafe)
+            if not en_iyi:
+                return 0.0
+            toplam += en_iyi
+        return 0.9 * toplam / len(sorgu_kelimeleri)
+    
+    @profille("dizin")
+    def ara(self, sorgu: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Sorguyu yerel dizinden yanıtla; sonuçlar eşleşme kalitesi ve izlenme yeniliğine göre sıralanır"""
+        katlanmis_sorgu = baslik_katla(sorgu)
+        sorgu_kelimeleri = katlanmis_sorgu.split()
+        if not sorgu_kelimeleri:
+            return []
         
-        return subprocess.Popen(args)
+        with self._kilit:
+            kayitlar = self._yukle()
+            # Üçlü harf paylaşan adaylar puanlanır; hiç aday yoksa (kısa ya da çok hatalı sorgu) hepsi taranır
+            adaylar = set()
+            for uclu in self._uclu_harfler(katlanmis_sorgu):
+                adaylar.update(self._uclular.get(uclu, ()))
+            adaylar = [kayitlar[anime_id] for anime_id in (adaylar or kayitlar)]
+        
+        simdi = time.time()
+        sonuclar = []
+        for kayit in adaylar:
+            puan = self._eslesme_puani(katlanmis_sorgu, sorgu_kelimeleri, kayit["katlanmis"])
+            if puan < self.ESIK:
+                continue
+            if kayit["son_izlenme"]:
+                puan += self.YENILIK_PAYI * 0.5 ** (max(0.0, simdi - kayit["son_izlenme"]) / self.YENILIK_YARI_OMRU)
+            sonuclar.append((puan, kayit))
+        
+        sonuclar.sort(key=lambda x: (-x[0], x[1]["baslik"]))
+        return [
+            {
+                "id": int(kayit["anime_id"]) if kayit["anime_id"].isdigit() else kayit["anime_id"],
+                "baslik": kayit["baslik"],
+                "tur": kayit["tur"],
+                "baslik_turu": kayit["baslik_turu"],
+                "gorsel_url": kayit["gorsel_url"]
+            }
+            for _, kayit in sonuclar[:limit]
+        ]
+    
+    def kapat(self) -> None:
+        """Veritabanı bağlantısını kapat"""
+        with self._kilit:
+            if self._baglanti is not None:
+                self._baglanti.close()
+                self._baglanti = None
+
+class _AnimeCixOrtak:
+    """AsenkronAnimeCix çekirdeğinin adresleri, başlıkları ve yanıt ayrıştırıcıları"""
+    
+    # Altyazısı bellekte tutulan en fazla bölüm; servis süreci günlerce çalışabildiği için sınırlıdır
+    EN_FAZLA_ALTYAZI = 4096
+    
+    def __init__(self, onbellek: Optional[YanitOnbellegi] = None, baslik_dizini: Optional[BaslikDizini] = None,
+                 negatif_onbellek: Optional[NegatifOnbellek] = None, devre_kesici: Optional[DevreKesici] = None):
+        self.base_url = "https://animecix.tv/"
+        self.alternative_url = "https://mangacix.net/"
+        self.video_players = ["tau-video.xyz", "sibnet"]
+        self.video_api_tabani = f"https://{self.video_players[0]}/"
+        self.http_headers = {
+            "Accept": "application/json",
+            "User-Agent": "Mozilla/5.0",
+            "x-e-h": "=.a"
+        }
+        self.onbellek = onbellek
+        # Görülen arama ve başlık yanıtları yerel aramada kullanılmak üzere dizine eklenir; dizin SQLite'a
+        # (servis varsa sokete) yazdığından ekleme olay döngüsünü bekletmemek için tek işçili havuzda sırayla yapılır
+        self.baslik_dizini = baslik_dizini
+        self._dizin_havuzu: Optional[ThreadPoolExecutor] = None
+        # Bölüm URL'si -> altyazı listesi; bölüm listesi alınırken doldurulur, en eski kayıt başta
+        self._altyazi_dizini: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        # Bozuk bölüm/gömme adresleri kısa süre yeniden denenmez; yanıt vermeyen hostlara istek gönderilmez
+        self.negatif_onbellek = negatif_onbellek or NegatifOnbellek()
+        self.devre_kesici = devre_kesici or DevreKesici()
+    
+    def kaynak(self) -> str:
+        return "AnimeciX"
+    
+    def _altyazilari_kaydet(self, bolum_url: str, altyazilar: List[Dict[str, Any]]) -> None:
+        self._altyazi_dizini[bolum_url] = altyazilar
+        self._altyazi_dizini.move_to_end(bolum_url)
+        while len(self._altyazi_dizini) > self.EN_FAZLA_ALTYAZI:
+            self._altyazi_dizini.popitem(last=False)
+    
+    def _arama_url(self, sorgu: str) -> str:
+        # Türkçe karakterleri normalize et
+        normalize_edilmis_sorgu = self._turkce_normalize(sorgu).replace(" ", "-")
+        return f"{self.base_url}secure/search/{normalize_edilmis_sorgu}?type=&limit=20"
+    
+    def _anime_url(self, anime_id: Any) -> str:
+        return f"{self.base_url}secure/titles/{anime_id}?titleId={anime_id}"
+    
+    def _sezon_url(self, anime_id: int, sezon_num: int) -> str:
+        return f"{self.alternative_url}secure/related-videos?episode=1&season={sezon_num}&titleId={anime_id}&videoId=637113"
+    
+    def _kosullu_basliklar(self, kayit: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """API başlıklarını, süresi dolmuş önbellek kaydı varsa onu sunucuya doğrulatacak başlıklarla döndür"""
+        basliklar = dict(self.http_headers)
+        if kayit:
+            if kayit.get("etag"):
+                basliklar["If-None-Match"] = kayit["etag"]
+            if kayit.get("son_degisiklik"):
+                basliklar["If-Modified-Since"] = kayit["son_degisiklik"]
+        return basliklar
+    
+    def _arama_ayristir(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """secure/search yanıtını sonuç listesine çevir"""
+        results = data.get("results", [])
+        return_data = []
+        
+        for item in results:
+            return_data.append({
+                "id": item.get("id"),
+                "baslik": item.get("name", ""),
+                "tur": item.get("type", ""),
+                "baslik_turu": item.get("title_type", ""),
+                "gorsel_url": item.get("poster", "")
+            })
+        
+        self._dizine_ekle(return_data)
+        return return_data
+    
+    def _anime_ayristir(self, anime_id: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+        """secure/titles yanıtını anime kaydına çevir"""
+        title_data = data.get("title", {})
+        anime = {
+            "id": int(anime_id),
+            "baslik": title_data.get("name", ""),
+            "tur": title_data.get("type", ""),
+            "baslik_turu": title_data.get("title_type", ""),
+            "gorsel_url": title_data.get("poster", "")
+        }
+        self._dizine_ekle([anime])
+        return anime
+    
+    def _dizine_ekle(self, animeler: List[Dict[str, Any]]) -> None:
+        """Başlıkları dizine arka planda ekle; hatalarını dizin kendisi günlüğe yazar"""
+        if not self.baslik_dizini:
+            return
+        if self._dizin_havuzu is None:
+            self._dizin_havuzu = ThreadPoolExecutor(max_workers=1, thread_name_prefix="anitr-py-dizin")
+        self._dizin_havuzu.submit(self.baslik_dizini.ekle, animeler)
+    
+    def _dizin_isini_bitir(self) -> None:
+        """Sıradaki dizin eklemelerinin bitmesini bekle ve işçiyi kapat"""
+        if self._dizin_havuzu is not None:
+            self._dizin_havuzu.shutdown(wait=True)
+            self._dizin_havuzu = None
+    
+    def _sezon_listesi(self, ilk_sezon_verisi: Dict[str, Any]) -> List[int]:
+        """1. sezonun related-videos yanıtından sezon indekslerini çıkar"""
+        videolar = ilk_sezon_verisi.get("videos", [])
+        if videolar:
+            baslik = videolar[0].get("title", {})
+            sezonlar = baslik.get("seasons", [])
+            return list(range(len(sezonlar)))
+        
+        return []
+    
+    def _sezon_bolumlerini_birlestir(self, sezon_verileri: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sezon yanıtlarındaki bölümleri tekrarsız birleştir ve altyazılarını dizine ekle"""
+        bolumler = []
+        gorulmus_bolumler = set()
+        
+        for data in sezon_verileri:
+            videolar = data.get("videos", [])
+            for video in videolar:
+                name = video.get("name", "")
+                if name not in gorulmus_bolumler:
+                    bolum_url = video.get("url", "")
+                    sezon_num = video.get("season_num")
+                    altyazilar = video.get("captions") or []
+                    bolumler.append({
+                        "name": name,
+                        "url": bolum_url,
+                        "season_num": sezon_num,
+                        "captions": altyazilar
+                    })
+                    gorulmus_bolumler.add(name)
+                    self._altyazilari_kaydet(bolum_url, altyazilar)
+        
+        return bolumler
+    
+    def _bolumleri_ayristir(self, bolumler_raw: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Birleştirilmiş sezon bölümlerini bölüm listesine çevir"""
+        bolumler = []
+        
+        for i, item in enumerate(bolumler_raw):
+            bolumler.append({
+                "id": item["url"],
+                "baslik": item["name"],
+                "numara": i + 1,
+                "ekstra": {"sezon_num": item["season_num"], "altyazilar": item["captions"]}
+            })
+        
+        return bolumler
+    
+    def _sezondan_altyazi_bul(self, data: Dict[str, Any], bolum_indeks: int, bolum_url: Optional[str]) -> str:
+        """Sezon yanıtında bölümün Türkçe altyazısını bul"""
+        videolar = data.get("videos", [])
+        # Bölüm URL'si biliniyorsa sezon içindeki sıraya güvenmeden eşleştir
+        for video in videolar:
+            if bolum_url is not None and video.get("url") == bolum_url:
+                return self._altyazi_sec(video.get("captions", []))
+        
+        if bolum_indeks < len(videolar):
+            return self._altyazi_sec(videolar[bolum_indeks].get("captions", []))
+        
+        return ""
+    
+    def _altyazi_sec(self, altyazilar: List[Dict[str, Any]]) -> str:
+        """Altyazılar arasından Türkçe olanı, yoksa ilkini seç"""
+        # Türkçe altyazıyı ara
+        for altyazi in altyazilar:
+            if altyazi.get("language") == "tr":
+                return altyazi.get("url", "")
+        
+        # Türkçe altyazı yoksa ilkini döndür
+        if altyazilar:
+            return altyazilar[0].get("url", "")
+        
+        return ""
+    
+    def _video_api_url(self, final_url: str) -> str:
+        """Bölüm yönlendirmesinin vardığı gömme adresinden video API adresini üret"""
+        parsed_url = urllib.parse.urlparse(final_url)
+        path_parts = parsed_url.path.split("/")
+        
+        if len(path_parts) < 3:
+            raise Exception("Yol verisi beklenen formatta değil")
+        
+        embed_id = path_parts[2]
+        query_params = urllib.parse.parse_qs(parsed_url.query)
+        vid = query_params.get("vid", [""])[0]
+        
+        return f"{self.video_api_tabani}api/video/{embed_id}?vid={vid}"
+    
+    def _bilinen_hata(self, anahtar: str) -> None:
+        """Anahtar negatif önbellekteyse ağa çıkmadan kaydedilen hatayı yükselt"""
+        neden = self.negatif_onbellek.al(anahtar)
+        if neden is not None:
+            raise Exception(f"{neden} (kısa süre önce denendi)")
+    
+    def _bozuk_isaretle(self, anahtar: str, neden: str) -> None:
+        """Anahtarı negatif önbelleğe ekle ve hatayı yükselt"""
+        self.negatif_onbellek.ekle(anahtar, neden)
+        raise Exception(neden)
+    
+    def _gomme_api_url(self, bolum_url: str, final_url: str) -> str:
+        """Bölümün gömme adresinden video API adresini üret; biçimi bozuk adresi bölüm için negatif önbelleğe al"""
+        try:
+            video_api_url = self._video_api_url(final_url)
+        except Exception as e:
+            self._bozuk_isaretle(f"bolum {bolum_url}", str(e))
+        self._bilinen_hata(f"gomme {istek_anahtari(video_api_url)}")
+        return video_api_url
+    
+    def _video_yanitini_denetle(self, video_api_url: str, response: Any) -> None:
+        """Video API'nin kalıcı hata yanıtını (4xx) gömme adresi için negatif önbelleğe al"""
+        if 400 <= response.status_code < 500 and response.status_code not in (408, 429):
+            self._bozuk_isaretle(f"gomme {istek_anahtari(video_api_url)}", f"{response.status_code} yanıtı: {video_api_url}")
+        response.raise_for_status()
+    
+    def _devre_izni_al(self, url: str) -> str:
+        """URL'nin hostu için devre kesiciden izin al; devre açıksa ağa çıkmadan hata ver"""
+        host = urllib.parse.urlsplit(url).netloc
+        if not self.devre_kesici.izin_ver(host):
+            raise Exception(f"{host} yanıt vermiyor (devre kesici açık)")
+        return host
+    
+    def _video_urlleri_ayristir(self, video_data: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Video API yanıtını etiket/URL listesine çevir"""
+        urls = video_data.get("urls", [])
+        
+        results = []
+        for item in urls:
+            results.append({
+                "etiket": item.get("label", ""),
+                "url": item.get("url", "")
+            })
+        
+        return results
+    
+    def _turkce_normalize(self, text: str) -> str:
+        """Türkçe karakterleri ASCII ile değiştir"""
+        return text.translate(_TURKCE_ASCII)
+
+class AsenkronYanit:
+    """AsenkronHttpIstemcisi'nin döndürdüğü, gövdesi tamamen okunmuş yanıt; başlıklar büyük/küçük harfe duyarsızdır"""
+    
+    def __init__(self, url: str, status_code: int, headers: Any, content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+    
+    def json(self) -> Any:
+        return json.loads(self.content)
+    
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise Exception(f"{self.status_code} yanıtı: {self.url}")
+
+class AsenkronHttpIstemcisi:
+    """aiohttp üzerinde host başına sınırlı, kalıcı bağlantılarla çalışan GET istemcisi;
+    HTTP(S)_PROXY/NO_PROXY ortam değişkenlerine uyar"""
+    
+    YENIDEN_DENENEN_KODLAR = (500, 502, 503, 504)
+    
+    def __init__(self, varsayilan_basliklar: Optional[Dict[str, str]] = None,
+                 baglanti_zaman_asimi: float = 5.0, okuma_zaman_asimi: float = 20.0,
+                 yeniden_deneme: int = 2, geri_cekilme: float = 0.3, host_basina_baglanti: int = 4):
+        self.zaman_asimi = (baglanti_zaman_asimi, okuma_zaman_asimi)
+        self.varsayilan_basliklar = dict(varsayilan_basliklar or {})
+        self.yeniden_deneme = yeniden_deneme
+        self.geri_cekilme = geri_cekilme
+        self.host_basina_baglanti = host_basina_baglanti
+        self.sayaclar: Dict[str, Dict[str, int]] = {}
+        self._kilit = threading.Lock()
+        # Oturum ilk isteği gönderen olay döngüsüne aittir; istemci tek döngüde kullanılmalıdır
+        self._oturum = None
+    
+    def _oturum_al(self) -> Any:
+        """aiohttp oturumunu ilk kullanımda oluştur"""
+        if self._oturum is None:
+            import aiohttp
+            
+            # Yönlendirme adımları dahil her bağlantı edinimi sayılır; adımın hostu istek bağlamında tutulur
+            izleme = aiohttp.TraceConfig()
+            
+            async def istek_basladi(oturum, baglam, parametreler) -> None:
+                baglam.host = parametreler.url.raw_authority
+            
+            async def yonlendirildi(oturum, baglam, parametreler) -> None:
+                konum = parametreler.response.headers.get("Location", "")
+                baglam.host = urllib.parse.urlsplit(urllib.parse.urljoin(str(parametreler.url), konum)).netloc
+            
+            async def baglanti_kuruldu(oturum, baglam, parametreler) -> None:
+                self._istek_say(baglam.host, True)
+            
+            async def baglanti_yeniden_kullanildi(oturum, baglam, parametreler) -> None:
+                self._istek_say(baglam.host, False)
+            
+            izleme.on_request_start.append(istek_basladi)
+            izleme.on_request_redirect.append(yonlendirildi)
+            izleme.on_connection_create_end.append(baglanti_kuruldu)
+            izleme.on_connection_reuseconn.append(baglanti_yeniden_kullanildi)
+            
+            baglanti_zaman_asimi, okuma_zaman_asimi = self.zaman_asimi
+            self._oturum = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, limit_per_host=self.host_basina_baglanti, ttl_dns_cache=300),
+                headers=self.varsayilan_basliklar,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=baglanti_zaman_asimi, sock_read=okuma_zaman_asimi),
+                trace_configs=[izleme],
+                trust_env=True
+            )
+        return self._oturum
+    
+    def _istek_say(self, host: str, el_sikisma: bool) -> None:
+        """Host için istek, yeniden kullanım ve el sıkışma sayaçlarını güncelle"""
+        with self._kilit:
+            sayac = self.sayaclar.setdefault(host, {"istek": 0, "yeniden_kullanim": 0, "el_sikisma": 0})
+            sayac["istek"] += 1
+            sayac["el_sikisma" if el_sikisma else "yeniden_kullanim"] += 1
+    
+    def istatistikler(self) -> Dict[str, Dict[str, int]]:
+        """Host başına sayaçların bir kopyasını döndür"""
+        with self._kilit:
+            return {host: dict(sayac) for host, sayac in self.sayaclar.items()}
+    
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  zaman_asimi: Optional[tuple] = None) -> AsenkronYanit:
+        """GET isteği gönder, yönlendirmeleri izleyip son yanıtın gövdesini oku; bağlantı hatalarında ve 5xx
+        yanıtlarında artan beklemeyle yeniden dene. zaman_asimi: (bağlantı, okuma) saniyesi"""
+        import asyncio
+        import aiohttp
+        
+        baglanti_zaman_asimi, okuma_zaman_asimi = zaman_asimi or self.zaman_asimi
+        sure_siniri = aiohttp.ClientTimeout(total=None, sock_connect=baglanti_zaman_asimi, sock_read=okuma_zaman_asimi)
+        parcalar = urllib.parse.urlsplit(url)
+        with PROFILCI.aralik("http GET", "http") as aralik:
+            deneme = 0
+            while True:
+                try:
+                    async with self._oturum_al().get(url, headers=headers, timeout=sure_siniri) as yanit:
+                        govde = await yanit.read()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if deneme >= self.yeniden_deneme:
+                        raise Exception(f"{parcalar.netloc} isteği başarısız: {e!r}") from e
+                else:
+                    if yanit.status not in self.YENIDEN_DENENEN_KODLAR or deneme >= self.yeniden_deneme:
+                        aralik.ekle(host=parcalar.netloc, yol=parcalar.path, durum=yanit.status, bayt=len(govde))
+                        return AsenkronYanit(str(yanit.url), yanit.status, yanit.headers, govde)
+                await asyncio.sleep(self.geri_cekilme * (2 ** deneme))
+                deneme += 1
+    
+    async def kapat(self) -> None:
+        """Oturumu ve havuzdaki tüm bağlantıları kapat"""
+        if self._oturum is not None:
+            await self._oturum.close()
+            self._oturum = None
+
+class AsenkronTekUcus:
+    """Aynı anahtarlı eşzamanlı eşyordamları tek bir görevde birleştiren (single-flight) yardımcı"""
+    
+    def __init__(self):
+        self._ucanlar: Dict[str, Any] = {}
+        # birlesen: uçuştaki bir göreve katılıp kendi isteğini göndermeyen çağrı sayısı
+        self.sayaclar = {"cagri": 0, "birlesen": 0}
+    
+    async def calistir(self, anahtar: str, islem: Any, zaman_asimi: Optional[float] = None) -> Any:
+        """Anahtar için uçuşta bir görev yoksa islem() eşyordamını görev olarak başlat; görevi en fazla
+        zaman_asimi kadar bekle"""
+        import asyncio
+        
+        self.sayaclar["cagri"] += 1
+        gorev = self._ucanlar.get(anahtar)
+        if gorev is None:
+            gorev = self._ucanlar[anahtar] = asyncio.ensure_future(islem())
+            gorev.add_done_callback(lambda bitti: self._bitir(anahtar, bitti))
+        else:
+            self.sayaclar["birlesen"] += 1
+        
+        # shield: bekleyenin iptali ya da süre sınırı ortak görevi ve diğer bekleyenleri etkilemez; öncü de
+        # katılanlarla aynı süre sınırına tabidir
+        try:
+            return await asyncio.wait_for(asyncio.shield(gorev), zaman_asimi)
+        except asyncio.TimeoutError:
+            if gorev.done():
+                raise
+            raise Exception("Aynı istek beklenirken zaman aşımı")
+    
+    def _bitir(self, anahtar: str, gorev: Any) -> None:
+        # Sonuç bildirilmeden önce kayıt silinir; sonradan gelen çağrı yeni ve taze bir istek başlatır
+        if self._ucanlar.get(anahtar) is gorev:
+            del self._ucanlar[anahtar]
+        # Tüm bekleyenler vazgeçmişse hata kimse tarafından okunmaz; "never retrieved" uyarısı verilmesin
+        if not gorev.cancelled():
+            gorev.exception()
+    
+    def istatistikler(self) -> Dict[str, int]:
+        """Sayaçların bir kopyasını döndür"""
+        return dict(self.sayaclar)
+
+def _gorevleri_birak(gorevler: Any) -> None:
+    """Süren görevleri iptal et; bitmiş görevlerin hatasını okunmuş say"""
+    for gorev in gorevler:
+        if not gorev.done():
+            gorev.cancel()
+        elif not gorev.cancelled():
+            gorev.exception()
+
+async def _birlikte_calistir(islemler: List[Any]) -> List[Any]:
+    """Eşyordamları aynı anda çalıştırıp sonuçları sırasıyla döndür; biri hata verirse kalanları iptal et"""
+    import asyncio
+    
+    gorevler = [asyncio.ensure_future(islem) for islem in islemler]
+    try:
+        return await asyncio.gather(*gorevler)
+    finally:
+        _gorevleri_birak(gorevler)
+
+# Süren kullanıcı işleminin son tarihi (time.monotonic); görevler oluşturuldukları bağlamı kopyaladığından
+# işlemin alt isteklerine kendiliğinden taşınır
+_SON_TARIH: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar("anitr_py_son_tarih", default=None)
+
+class AsenkronAnimeCix(_AnimeCixOrtak):
+    """AnimeCix çekirdeği: metotlar tek olay döngüsünde ortak bağlantı havuzunu kullanan eşyordamlardır.
+    Tüm API istekleri süre bütçesi, yedek istek, devre kesici, önbellek ve profil aralıklarıyla tek yoldan geçer"""
+    
+    def __init__(self, baglanti_zaman_asimi: float = 5.0, okuma_zaman_asimi: float = 20.0,
+                 yeniden_deneme: int = 2, host_basina_eszamanli: int = 4,
+                 onbellek: Optional[YanitOnbellegi] = None, baslik_dizini: Optional[BaslikDizini] = None,
+                 bekleme_zaman_asimi: Optional[float] = None, arama_butcesi: Optional[float] = None,
+                 baslik_butcesi: Optional[float] = None, bolum_listesi_butcesi: Optional[float] = None,
+                 oynatma_butcesi: Optional[float] = None,
+                 yedek_istek: bool = True, negatif_onbellek: Optional[NegatifOnbellek] = None,
+                 devre_kesici: Optional[DevreKesici] = None):
+        super().__init__(onbellek, baslik_dizini, negatif_onbellek, devre_kesici)
+        self.istemci = AsenkronHttpIstemcisi(
+            baglanti_zaman_asimi=baglanti_zaman_asimi,
+            okuma_zaman_asimi=okuma_zaman_asimi,
+            yeniden_deneme=yeniden_deneme,
+            host_basina_baglanti=host_basina_eszamanli
+        )
+        # Aynı URL'ye eşzamanlı istekler tek bir ağ isteğinde birleşir; bekleyenler en fazla bekleme_zaman_asimi bekler
+        self.tek_ucus = AsenkronTekUcus()
+        self.bekleme_zaman_asimi = bekleme_zaman_asimi
+        # Kullanıcı düzeyindeki işlemlerin uçtan uca süre bütçeleri (sn, None: sınırsız); alt istekler kalanı paylaşır
+        self.arama_butcesi = arama_butcesi
+        self.baslik_butcesi = baslik_butcesi
+        self.bolum_listesi_butcesi = bolum_listesi_butcesi
+        self.oynatma_butcesi = oynatma_butcesi
+        # p95 süresini aşan API istekleri diğer aynaya da gönderilir; ilk başarılı yanıt kullanılır
+        self.yedek_istek = yedek_istek
+        self.gecikmeler = GecikmeOlcer()
+        self.sayaclar = {"yedek_istek": 0, "yedek_kazandi": 0, "butce_asimi": 0}
+        self._kilit = threading.Lock()
+    
+    def _say(self, sayac: str) -> None:
+        with self._kilit:
+            self.sayaclar[sayac] += 1
+    
+    async def _butceyle(self, islem: Any, saniye: Optional[float]) -> Any:
+        """Eşyordamı süre bütçesiyle çalıştır; alt istekler kalan süreyi paylaşır, süre dolunca işlem alt
+        istekleriyle birlikte iptal edilir. İç içe bütçelerde en erken son tarih geçerlidir"""
+        import asyncio
+        
+        onceki = _SON_TARIH.get()
+        adaylar = [t for t in (onceki, None if saniye is None else time.monotonic() + saniye) if t is not None]
+        if not adaylar:
+            return await islem
+        son_tarih = min(adaylar)
+        belirtec = _SON_TARIH.set(son_tarih)
+        try:
+            return await asyncio.wait_for(islem, max(0.0, son_tarih - time.monotonic()))
+        except asyncio.TimeoutError:
+            self._say("butce_asimi")
+            raise Exception("Süre bütçesi doldu")
+        finally:
+            _SON_TARIH.reset(belirtec)
+    
+    def _bekleme_suresi(self) -> Optional[float]:
+        """Birleşen bir isteği beklerken kullanılacak süre: bekleme sınırı ile kalan bütçenin küçüğü"""
+        son_tarih = _SON_TARIH.get()
+        if son_tarih is None:
+            return self.bekleme_zaman_asimi
+        kalan = max(0.0, son_tarih - time.monotonic())
+        return kalan if self.bekleme_zaman_asimi is None else min(kalan, self.bekleme_zaman_asimi)
+    
+    def _ayna_url(self, url: str) -> Optional[str]:
+        """API isteğinin diğer aynadaki karşılığını döndür; aynalanmayan adreslerde None"""
+        for asil, ayna in ((self.base_url, self.alternative_url), (self.alternative_url, self.base_url)):
+            if asil != ayna and url.startswith(f"{asil}secure/"):
+                return ayna + url[len(asil):]
+        return None
+    
+    async def _olculu_get(self, url: str, headers: Dict[str, str], son_tarih: Optional[float]) -> AsenkronYanit:
+        """Tek bir GET gönder; zaman aşımlarını kalan bütçeyle sınırla, sonucu devre kesiciye
+        ve yanıt süresini hosta kaydet"""
+        import asyncio
+        
+        baglanti_zaman_asimi, okuma_zaman_asimi = self.istemci.zaman_asimi
+        if son_tarih is not None:
+            kalan = son_tarih - time.monotonic()
+            if kalan <= 0:
+                raise Exception("Süre bütçesi doldu")
+            baglanti_zaman_asimi, okuma_zaman_asimi = min(baglanti_zaman_asimi, kalan), min(okuma_zaman_asimi, kalan)
+        
+        sure_siniri = (baglanti_zaman_asimi, okuma_zaman_asimi)
+        host = self._devre_izni_al(url)
+        baslangic = time.monotonic()
+        try:
+            response = await self.istemci.get(url, headers=headers, zaman_asimi=sure_siniri)
+        except Exception as e:
+            if self._host_hatasi_mi(e, sure_siniri):
+                self.devre_kesici.hata(host)
+                raise
+            self.devre_kesici.birak(host)
+            # Kalan bütçeyle kısaltılmış süre dolduysa hata hostun değil bütçenindir
+            if sure_siniri != self.istemci.zaman_asimi and isinstance(e.__cause__, asyncio.TimeoutError):
+                self._say("butce_asimi")
+                raise Exception("Süre bütçesi doldu") from e
+            raise
+        except BaseException:
+            # İptal edilen istek (kaybeden yedek ya da dolan bütçe) hostun durumu hakkında bilgi vermez
+            self.devre_kesici.birak(host)
+            raise
+        if response.status_code >= 500:
+            self.devre_kesici.hata(host)
+        else:
+            self.devre_kesici.basari(host)
+            self.gecikmeler.kaydet(host, time.monotonic() - baslangic)
+        return response
+    
+    def _host_hatasi_mi(self, hata: Exception, sure_siniri: tuple) -> bool:
+        """İstek hatası devre kesicide host aleyhine sayılır mı: bağlantı kurulamadıysa ya da yapılandırılan
+        tam süre dolduysa evet; bütçeyle kısaltılmış süre dolduysa ya da hata başka türdense hayır"""
+        import asyncio
+        import aiohttp
+        
+        neden = hata.__cause__
+        if isinstance(neden, aiohttp.ClientConnectorError):
+            return True
+        if isinstance(neden, asyncio.TimeoutError):
+            return sure_siniri == self.istemci.zaman_asimi
+        return False
+    
+    async def _yarisli_get(self, url: str, headers: Optional[Dict[str, str]] = None) -> AsenkronYanit:
+        """GET isteğini süre bütçesi içinde tamamla; p95 süresinde yanıt gelmezse ya da istek başarısız olursa
+        (hostun devresi açıksa hemen) aynı isteği diğer aynaya da gönderip ilk başarılı yanıtı döndür.
+        Kazanan belli olunca ya da bütçe dolunca süren istek iptal edilir, bağlantısı kapatılır"""
+        import asyncio
+        
+        headers = headers or {}
+        son_tarih = _SON_TARIH.get()
+        if son_tarih is not None and time.monotonic() >= son_tarih:
+            self._say("butce_asimi")
+            raise Exception("Süre bütçesi doldu")
+        
+        ayna = self._ayna_url(url) if self.yedek_istek else None
+        if ayna is None:
+            # Yedeklenmeyen istek görev oluşturulmadan doğrudan beklenir; son tarihi _butceyle uygular
+            response = await self._olculu_get(url, headers, son_tarih)
+            if response.status_code >= 500:
+                raise Exception(f"{response.status_code} yanıtı: {url}")
+            return response
+        
+        yedek_zamani = time.monotonic() + self.gecikmeler.p95(urllib.parse.urlsplit(url).netloc)
+        gorevler = {asyncio.ensure_future(self._olculu_get(url, headers, son_tarih)): url}
+        son_hata: Optional[Exception] = None
+        try:
+            while True:
+                sinirlar = [t for t in (son_tarih, yedek_zamani) if t is not None]
+                biten, _ = await asyncio.wait(
+                    gorevler,
+                    timeout=max(0.0, min(sinirlar) - time.monotonic()) if sinirlar else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for gorev in biten:
+                    adres = gorevler.pop(gorev)
+                    try:
+                        response = gorev.result()
+                    except Exception as e:
+                        son_hata = e
+                        continue
+                    if response.status_code >= 500:
+                        son_hata = Exception(f"{response.status_code} yanıtı: {adres}")
+                        continue
+                    if adres != url:
+                        self._say("yedek_kazandi")
+                    return response
+                
+                # Asıl istek p95 süresini aştıysa ya da başarısız olduysa yedeği diğer aynaya gönder
+                if yedek_zamani is not None and (not gorevler or time.monotonic() >= yedek_zamani):
+                    yedek_zamani = None
+                    self._say("yedek_istek")
+                    gorevler[asyncio.ensure_future(self._olculu_get(ayna, headers, son_tarih))] = ayna
+                    continue
+                if not gorevler:
+                    raise son_hata
+                if son_tarih is not None and time.monotonic() >= son_tarih:
+                    self._say("butce_asimi")
+                    raise Exception("Süre bütçesi doldu")
+        finally:
+            _gorevleri_birak(gorevler)
+    
+    def istatistikler(self) -> Dict[str, Any]:
+        """Yedek istek ve bütçe sayaçlarını, host başına p95 tahminlerini, devre kesici ve negatif önbellek durumunu döndür"""
+        with self._kilit:
+            sayaclar = dict(self.sayaclar)
+        return {
+            **sayaclar,
+            "p95": self.gecikmeler.ozet(),
+            "devre_kesici": self.devre_kesici.durumlar(),
+            "negatif_onbellek": self.negatif_onbellek.istatistikler()
+        }
+    
+    async def _json_al(self, url: str) -> Any:
+        """URL'nin JSON yanıtını önbellekten ya da ağdan al; aynı URL'ye eşzamanlı çağrılar tek isteği paylaşır
+        
+        Yanıt, birleşen çağrılar ve önbellek arasında paylaşıldığı için her çağırana kendi kopyası verilir.
+        """
+        veri = await self.tek_ucus.calistir(
+            f"json {istek_anahtari(url)}", lambda: self._json_getir(url), self._bekleme_suresi()
+        )
+        return copy.deepcopy(veri)
+    
+    async def _json_getir(self, url: str) -> Any:
+        """JSON yanıtını önbellek doğrulamasıyla birlikte tek başına al; önbelleğin disk işleri olay döngüsü
+        dışında yapılır"""
+        import asyncio
+        
+        with PROFILCI.aralik("AsenkronAnimeCix._json_al", "animecix") as aralik:
+            kayit = await asyncio.to_thread(self.onbellek.oku, url) if self.onbellek else None
+            if kayit and kayit["taze"]:
+                aralik.ekle(onbellek="isabet")
+                return kayit["veri"]
+            
+            # Süresi dolmuş kayıt varsa sunucudan koşullu olarak doğrulat
+            response = await self._yarisli_get(url, self._kosullu_basliklar(kayit))
+            if response.status_code == 304 and kayit:
+                await asyncio.to_thread(self.onbellek.tazele, url, kayit)
+                aralik.ekle(onbellek="dogrulandi")
+                return kayit["veri"]
+            
+            aralik.ekle(onbellek="iska" if self.onbellek else "kapali")
+            response.raise_for_status()
+            veri = response.json()
+            if self.onbellek:
+                await asyncio.to_thread(
+                    self.onbellek.yaz, url, veri, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                )
+            return veri
+    
+    @asenkron_profille("animecix")
+    async def arama_verisi_al(self, sorgu: str, zaman_asimi: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Sorgu için arama verilerini al; zaman_asimi verilmezse arama bütçesi uygulanır"""
+        try:
+            data = await self._butceyle(
+                self._json_al(self._arama_url(sorgu)),
+                self.arama_butcesi if zaman_asimi is None else zaman_asimi
+            )
+            return self._arama_ayristir(data)
+        except Exception as e:
+            raise Exception(f"Arama başarısız: {str(e)}")
+    
+    @asenkron_profille("animecix")
+    async def id_ile_anime_al(self, anime_id: str, zaman_asimi: Optional[float] = None) -> Dict[str, Any]:
+        """ID ile anime verisini al"""
+        try:
+            data = await self._butceyle(
+                self._json_al(self._anime_url(anime_id)),
+                self.baslik_butcesi if zaman_asimi is None else zaman_asimi
+            )
+            return self._anime_ayristir(anime_id, data)
+        except Exception as e:
+            raise Exception(f"Anime verisi alınamadı: {str(e)}")
+    
+    @asenkron_profille("animecix")
+    async def bolumler_verisini_al(self, sezon_id: int, zaman_asimi: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Sezon için bölüm verilerini al"""
+        try:
+            bolumler = await self._butceyle(
+                self._anime_bolumleri_verisini_al(sezon_id),
+                self.bolum_listesi_butcesi if zaman_asimi is None else zaman_asimi
+            )
+            return self._bolumleri_ayristir(bolumler)
+        except Exception as e:
+            raise Exception(f"Bölümler alınamadı: {str(e)}")
+    
+    @asenkron_profille("animecix")
+    async def izleme_verisini_al(self, bolum_url: str, zaman_asimi: Optional[float] = None) -> List[Dict[str, str]]:
+        """Bölüm için izleme verisini al"""
+        
+        async def cozumle() -> List[Dict[str, str]]:
+            return await self.tek_ucus.calistir(
+                f"izle {istek_anahtari(self.base_url + bolum_url)}",
+                lambda: self._anime_izle_api_url(bolum_url),
+                self._bekleme_suresi()
+            )
+        
+        try:
+            # Ön yükleyici ile oynatma aynı bölümü aynı anda isterse yönlendirme ve video API çağrısı bir kez yapılır;
+            # çağıranlar listeyi yerinde sıraladığından her birine kopyası verilir
+            return list(await self._butceyle(cozumle(), self.oynatma_butcesi if zaman_asimi is None else zaman_asimi))
+        except Exception as e:
+            raise Exception(f"İzleme verisi alınamadı: {str(e)}")
+    
+    @asenkron_profille("animecix")
+    async def tr_altyazi_al(self, sezon_indeks: int, bolum_indeks: int, anime_id: int,
+                            bolum_url: Optional[str] = None, zaman_asimi: Optional[float] = None) -> str:
+        """Türkçe altyazı URL'sini al"""
+        # Bölüm listesi alınırken kaydedilen altyazılar varsa ağa gitmeden çöz
+        altyazilar = self._altyazi_dizini.get(bolum_url) if bolum_url is not None else None
+        if altyazilar is not None:
+            return self._altyazi_sec(altyazilar)
+        
+        try:
+            data = await self._butceyle(
+                self._sezon_verisini_al(anime_id, sezon_indeks + 1),
+                self.oynatma_butcesi if zaman_asimi is None else zaman_asimi
+            )
+            return self._sezondan_altyazi_bul(data, bolum_indeks, bolum_url)
+        except Exception:
+            return ""
+    
+    @asenkron_profille("animecix")
+    async def _sezon_verisini_al(self, anime_id: int, sezon_num: int) -> Dict[str, Any]:
+        """Bir sezonun related-videos yanıtını al"""
+        return await self._json_al(self._sezon_url(anime_id, sezon_num))
+    
+    async def _anime_bolumleri_verisini_al(self, anime_id: int) -> List[Dict[str, Any]]:
+        """Anime bölümleri verisini al"""
+        try:
+            # Sezon sayısını öğrenmek için alınan 1. sezon yanıtı bölüm listesi için de kullanılır
+            ilk_sezon_verisi = await self._sezon_verisini_al(anime_id, 1)
+            sezonlar = self._sezon_listesi(ilk_sezon_verisi)
+            
+            sezon_verileri = [ilk_sezon_verisi] if sezonlar else []
+            # Kalan sezonlar aynı anda istenir; eşzamanlılığı istemcinin host sınırı belirler
+            sezon_verileri.extend(await _birlikte_calistir([
+                self._sezon_verisini_al(anime_id, sezon_indeks + 1) for sezon_indeks in sezonlar[1:]
+            ]))
+            
+            return self._sezon_bolumlerini_birlestir(sezon_verileri)
+        except Exception as e:
+            raise Exception(f"Bölümler alınamadı: {str(e)}")
+    
+    async def _anime_izle_api_url(self, bolum_url: str) -> List[Dict[str, str]]:
+        """Bölüm için video URL'lerini al"""
+        try:
+            # Yakın zamanda bozuk çıkan bölüm yönlendirme ve video API çağrısı yapılmadan reddedilir
+            self._bilinen_hata(f"bolum {bolum_url}")
+            response = await self._yarisli_get(f"{self.base_url}{bolum_url}")
+            
+            if response.status_code == 422:
+                self._bozuk_isaretle(f"bolum {bolum_url}", "Bölüm verisi beklenen formatta değil")
+            
+            video_api_url = self._gomme_api_url(bolum_url, response.url)
+            api_response = await self._yarisli_get(video_api_url)
+            self._video_yanitini_denetle(video_api_url, api_response)
+            
+            return self._video_urlleri_ayristir(api_response.json())
+        except Exception as e:
+            raise Exception(f"Video URL'leri alınamadı: {str(e)}")
+    
+    async def kapat(self) -> None:
+        """Bağlantı havuzunu kapat; sıradaki dizin eklemelerinin bitmesini bekle"""
+        import asyncio
+        
+        await self.istemci.kapat()
+        await asyncio.to_thread(self._dizin_isini_bitir)
+
+class AnimeCix:
+    """AnimeCix kaynak uygulaması: AsenkronAnimeCix çekirdeğini arka plandaki tek bir olay döngüsünde çalıştıran
+    engelleyici cephe. Video, poster ve kalite ölçümü istekleri için ayrıca engelleyici bir istemci tutar"""
+    
+    def __init__(self, baglanti_zaman_asimi: float = 5.0, okuma_zaman_asimi: float = 20.0,
+                 yeniden_deneme: int = 2, host_basina_eszamanli: int = 4,
+                 onbellek: Optional[YanitOnbellegi] = None, baslik_dizini: Optional[BaslikDizini] = None,
+                 bekleme_zaman_asimi: Optional[float] = None, arama_butcesi: Optional[float] = None,
+                 baslik_butcesi: Optional[float] = None, bolum_listesi_butcesi: Optional[float] = None,
+                 oynatma_butcesi: Optional[float] = None,
+                 yedek_istek: bool = True, negatif_onbellek: Optional[NegatifOnbellek] = None,
+                 devre_kesici: Optional[DevreKesici] = None):
+        self.cekirdek = AsenkronAnimeCix(
+            baglanti_zaman_asimi=baglanti_zaman_asimi,
+            okuma_zaman_asimi=okuma_zaman_asimi,
+            yeniden_deneme=yeniden_deneme,
+            host_basina_eszamanli=host_basina_eszamanli,
+            onbellek=onbellek,
+            baslik_dizini=baslik_dizini,
+            bekleme_zaman_asimi=bekleme_zaman_asimi,
+            arama_butcesi=arama_butcesi,
+            baslik_butcesi=baslik_butcesi,
+            bolum_listesi_butcesi=bolum_listesi_butcesi,
+            oynatma_butcesi=oynatma_butcesi,
+            yedek_istek=yedek_istek,
+            negatif_onbellek=negatif_onbellek,
+            devre_kesici=devre_kesici
+        )
+        # Video, poster ve indirme istekleri için engelleyici istemci; API istekleri çekirdekten geçer
+        self.istemci = HttpIstemcisi(
+            baglanti_zaman_asimi=baglanti_zaman_asimi,
+            okuma_zaman_asimi=okuma_zaman_asimi,
+            yeniden_deneme=yeniden_deneme,
+            host_basina_baglanti=host_basina_eszamanli
+        )
+        self._kilit = threading.Lock()
+        # Olay döngüsü ilk çağrıda kendi iş parçacığında başlatılır
+        self._dongu = None
+        self._dongu_is_parcacigi: Optional[threading.Thread] = None
+    
+    @property
+    def onbellek(self) -> Optional[YanitOnbellegi]:
+        return self.cekirdek.onbellek
+    
+    @property
+    def base_url(self) -> str:
+        return self.cekirdek.base_url
+    
+    @property
+    def devre_kesici(self) -> DevreKesici:
+        return self.cekirdek.devre_kesici
+    
+    @property
+    def tek_ucus(self) -> AsenkronTekUcus:
+        return self.cekirdek.tek_ucus
+    
+    def kaynak(self) -> str:
+        return self.cekirdek.kaynak()
+    
+    def _dongu_al(self) -> Any:
+        """Çekirdeğin olay döngüsünü ilk kullanımda arka plandaki bir iş parçacığında başlat"""
+        with self._kilit:
+            if self._dongu is None:
+                import asyncio
+                
+                dongu = asyncio.new_event_loop()
+                is_parcacigi = threading.Thread(target=dongu.run_forever, daemon=True, name="anitr-py-ag")
+                is_parcacigi.start()
+                self._dongu, self._dongu_is_parcacigi = dongu, is_parcacigi
+            return self._dongu
+    
+    def _calistir(self, islem: Any) -> Any:
+        """Eşyordamı çekirdeğin olay döngüsünde çalıştırıp sonucunu bekle; bekleyen kesilirse işlem iptal edilir"""
+        import asyncio
+        
+        gelecek = asyncio.run_coroutine_threadsafe(islem, self._dongu_al())
+        try:
+            return gelecek.result()
+        except BaseException:
+            gelecek.cancel()
+            raise
+    
+    @profille("animecix")
+    def arama_verisi_al(self, sorgu: str) -> List[Dict[str, Any]]:
+        """Sorgu için arama verilerini al"""
+        return self._calistir(self.cekirdek.arama_verisi_al(sorgu))
+    
+    @profille("animecix")
+    def id_ile_anime_al(self, anime_id: str) -> Dict[str, Any]:
+        """ID ile anime verisini al"""
+        return self._calistir(self.cekirdek.id_ile_anime_al(anime_id))
+    
+    @profille("animecix")
+    def bolumler_verisini_al(self, sezon_id: int) -> List[Dict[str, Any]]:
+        """Sezon için bölüm verilerini al"""
+        return self._calistir(self.cekirdek.bolumler_verisini_al(sezon_id))
+    
+    @profille("animecix")
+    def izleme_verisini_al(self, bolum_url: str) -> List[Dict[str, str]]:
+        """Bölüm için izleme verisini al"""
+        return self._calistir(self.cekirdek.izleme_verisini_al(bolum_url))
+    
+    @profille("animecix")
+    def tr_altyazi_al(self, sezon_indeks: int, bolum_indeks: int, anime_id: int, bolum_url: Optional[str] = None) -> str:
+        """Türkçe altyazı URL'sini al"""
+        return self._calistir(self.cekirdek.tr_altyazi_al(sezon_indeks, bolum_indeks, anime_id, bolum_url))
+    
+    def istatistikler(self) -> Dict[str, Any]:
+        """Yedek istek ve bütçe sayaçlarını, p95 tahminlerini, devre kesici ve negatif önbellek durumunu döndür"""
+        return self.cekirdek.istatistikler()
+    
+    def http_istatistikleri(self) -> Dict[str, Dict[str, int]]:
+        """API (çekirdek) ve video/poster istemcilerinin host başına bağlantı sayaçlarını birlikte döndür"""
+        toplam: Dict[str, Dict[str, int]] = {}
+        for istatistikler in (self.cekirdek.istemci.istatistikler(), self.istemci.istatistikler()):
+            for host, sayac in istatistikler.items():
+                hedef = toplam.setdefault(host, {"istek": 0, "yeniden_kullanim": 0, "el_sikisma": 0})
+                for ad, deger in sayac.items():
+                    hedef[ad] += deger
+        return toplam
+    
+    def kapat(self) -> None:
+        """Olay döngüsünü ve iki istemcinin bağlantılarını kapat"""
+        import asyncio
+        
+        with self._kilit:
+            dongu, is_parcacigi = self._dongu, self._dongu_is_parcacigi
+            self._dongu = self._dongu_is_parcacigi = None
+        if dongu is not None:
+            with contextlib.suppress(Exception):
+                asyncio.run_coroutine_threadsafe(self.cekirdek.kapat(), dongu).result(timeout=5)
+                asyncio.run_coroutine_threadsafe(dongu.shutdown_default_executor(), dongu).result(timeout=5)
+            dongu.call_soon_threadsafe(dongu.stop)
+            is_parcacigi.join(timeout=5)
+            if not dongu.is_running():
+                dongu.close()
+        self.istemci.kapat()
+
+class GecmisYonetici:
+    """Anime izleme geçmişi yöneticisi (WAL kipinde SQLite veritabanı)"""
+    
+    def __init__(self, veritabani: Path = HISTORY_DB, eski_dosya: Path = HISTORY_FILE):
+        self.veritabani = veritabani
+        self.gecmis_dosya = eski_dosya
+        self._baglanti = None
+        self._kilit = threading.Lock()
+    
+    def _baglan(self):
+        """Veritabanı bağlantısını ilk kullanımda aç; şemayı kur ve eski JSON geçmişini taşı"""
+        if self._baglanti is not None:
+            return self._baglanti
+        
+        import sqlite3
+        
+        yapilandirma_dizini_olustur()
+        # Otomatik işlem yönetimi kapalı; işlemler açıkça BEGIN ile başlatılır
+        baglanti = sqlite3.connect(str(self.veritabani), timeout=10, isolation_level=None, check_same_thread=False)
+        # WAL: okuyucular yazanı beklemez, birden çok anitr-py süreci aynı anda yazabilir
+        baglanti.execute("PRAGMA journal_mode=WAL")
+        baglanti.execute("PRAGMA synchronous=NORMAL")
+        baglanti.execute("PRAGMA busy_timeout=10000")
+        baglanti.execute("""
+            CREATE TABLE IF NOT EXISTS gecmis (
+                kaynak TEXT NOT NULL,
+                anime_adi TEXT NOT NULL,
+                son_bolum_adi TEXT,
+                son_bolum_indeks INTEGER,
+                anime_id TEXT,
+                son_izlenme REAL,
+                PRIMARY KEY (kaynak, anime_adi)
+            )
+        """)
+        # Son izlenenler ve anime_id sorguları tabloyu taramadan dizinden yanıtlanır
+        baglanti.execute("CREATE INDEX IF NOT EXISTS gecmis_son_izlenme ON gecmis (kaynak, son_izlenme DESC)")
+        baglanti.execute("CREATE INDEX IF NOT EXISTS gecmis_anime_id ON gecmis (kaynak, anime_id)")
+        baglanti.execute("CREATE TABLE IF NOT EXISTS meta (anahtar TEXT PRIMARY KEY, deger TEXT)")
+        self._baglanti = baglanti
+        self._json_tasi()
+        return baglanti
+    
+    def _json_tasi(self) -> None:
+        """Eski gecmis.json dosyasını bir kereliğine veritabanına aktar"""
+        if not self.gecmis_dosya.exists():
+            return
+        
+        baglanti = self._baglanti
+        # IMMEDIATE: aynı anda açılan iki süreçten yalnızca biri taşır
+        baglanti.execute("BEGIN IMMEDIATE")
+        try:
+            tasindi = baglanti.execute("SELECT 1 FROM meta WHERE anahtar = 'json_tasindi'").fetchone()
+            if tasindi or not self.gecmis_dosya.exists():
+                baglanti.execute("COMMIT")
+                return
+            
+            try:
+                with open(self.gecmis_dosya, 'r', encoding='utf-8') as f:
+                    eski_gecmis = json.load(f)
+            except Exception as e:
+                # Bozuk dosya silinmez, incelenebilmesi için kenara alınır
+                baglanti.execute("ROLLBACK")
+                os.replace(self.gecmis_dosya, self.gecmis_dosya.with_name(self.gecmis_dosya.name + ".bozuk"))
+                print(f"Eski geçmiş dosyası okunamadı, {self.gecmis_dosya.name}.bozuk olarak saklandı: {e}")
+                return
+            
+            for kaynak, animeler in eski_gecmis.items():
+                for anime_adi, veri in animeler.items():
+                    baglanti.execute(
+                        "INSERT OR REPLACE INTO gecmis VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            kaynak,
+                            anime_adi,
+                            veri.get("son_bolum_adi"),
+                            veri.get("son_bolum_indeks"),
+                            veri.get("anime_id"),
+                            veri.get("son_izlenme", 0)
+                        )
+                    )
+            baglanti.execute("INSERT OR REPLACE INTO meta VALUES ('json_tasindi', ?)", (str(time.time()),))
+            baglanti.execute("COMMIT")
+        except BaseException:
+            if baglanti.in_transaction:
+                baglanti.execute("ROLLBACK")
+            raise
+        
+        # Taşınan dosya yedek olarak saklanır
+        os.replace(self.gecmis_dosya, self.gecmis_dosya.with_name(self.gecmis_dosya.name + ".yedek"))
+    
+    @property
+    def gecmis(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Tüm geçmişi kaynak -> anime adı -> kayıt biçiminde döndür"""
+        try:
+            with self._kilit:
+                satirlar = self._baglan().execute(
+                    "SELECT kaynak, anime_adi, son_bolum_adi, son_bolum_indeks, anime_id, son_izlenme FROM gecmis"
+                ).fetchall()
+        except Exception as e:
+            print(f"Geçmiş okunamadı: {e}")
+            return {}
+        
+        gecmis: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for kaynak, anime_adi, bolum_adi, bolum_indeks, anime_id, son_izlenme in satirlar:
+            gecmis.setdefault(kaynak, {})[anime_adi] = {
+                "son_bolum_adi": bolum_adi,
+                "son_bolum_indeks": bolum_indeks,
+                "anime_id": anime_id,
+                "son_izlenme": son_izlenme
+            }
+        return gecmis
+    
+    @profille("gecmis")
+    def _sorgula(self, sorgu: str, parametreler: tuple) -> List[Dict[str, Any]]:
+        """Geçmiş tablosunda sorgu çalıştırıp satırları kayıt olarak döndür"""
+        with self._kilit:
+            satirlar = self._baglan().execute(
+                "SELECT anime_adi, son_bolum_adi, son_bolum_indeks, anime_id, son_izlenme FROM gecmis " + sorgu,
+                parametreler
+            ).fetchall()
+        return [
+            {
+                "anime_adi": anime_adi,
+                "son_bolum_adi": bolum_adi,
+                "son_bolum_indeks": bolum_indeks,
+                "anime_id": anime_id,
+                "son_izlenme": son_izlenme
+            }
+            for anime_adi, bolum_adi, bolum_indeks, anime_id, son_izlenme in satirlar
+        ]
+    
+    def son_izlenenler(self, kaynak: str, limit: int, baslangic: int = 0) -> List[Dict[str, Any]]:
+        """En son izlenenden başlayarak bir sayfa geçmiş kaydı döndür"""
+        return self._sorgula(
+            "WHERE kaynak = ? ORDER BY son_izlenme DESC LIMIT ? OFFSET ?",
+            (kaynak, limit, baslangic)
+        )
+    
+    def ara(self, kaynak: str, metin: str, limit: int, baslangic: int = 0) -> List[Dict[str, Any]]:
+        """Adında metin geçen kayıtları döndür; önce adı metinle başlayanlar, sonra en yeniler"""
+        kacisli = metin.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._sorgula(
+            "WHERE kaynak = ? AND anime_adi LIKE ? ESCAPE '\\' "
+            "ORDER BY anime_adi LIKE ? ESCAPE '\\' DESC, son_izlenme DESC LIMIT ? OFFSET ?",
+            (kaynak, f"%{kacisli}%", f"{kacisli}%", limit, baslangic)
+        )
+    
+    def anime_id_ile(self, kaynak: str, anime_id: str) -> Optional[Dict[str, Any]]:
+        """anime_id'ye ait en son kaydı döndür (yoksa None)"""
+        kayitlar = self._sorgula(
+            "WHERE kaynak = ? AND anime_id = ? ORDER BY son_izlenme DESC LIMIT 1",
+            (kaynak, str(anime_id))
+        )
+        return kayitlar[0] if kayitlar else None
+    
+    @profille("gecmis")
+    def gecmis_guncelle(self, kaynak: str, anime_adi: str, bolum_adi: str, anime_id: str, bolum_indeks: int) -> None:
+        """Geçmişi izlenen bölümle güncelle"""
+        try:
+            # Tek satırlık işlem; maliyeti geçmişin büyüklüğünden bağımsızdır
+            with self._kilit:
+                self._baglan().execute(
+                    "INSERT OR REPLACE INTO gecmis VALUES (?, ?, ?, ?, ?, ?)",
+                    (kaynak, anime_adi, bolum_adi, bolum_indeks, anime_id, time.time())
+                )
+        except Exception as e:
+            print(f"Geçmiş güncellenemedi: {e}")
+    
+    def kapat(self) -> None:
+        """Veritabanı bağlantısını kapat"""
+        with self._kilit:
+            if self._baglanti is not None:
+                self._baglanti.close()
+                self._baglanti = None
+
+class MPVIPCIstemcisi:
+    """mpv'nin --input-ipc-server soketi üzerinden konuşan JSON IPC istemcisi"""
+    
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self._soket: Optional[socket.socket] = None
+        self._kilit = threading.Lock()
+        self._yazma_kilidi = threading.Lock()
+        self._istek_no = 0
+        self._bekleyenler: Dict[int, Dict[str, Any]] = {}
+        self._olay_dinleyicileri: List[Any] = []
+        self.kapandi = threading.Event()
+    
+    def baglan(self, zaman_asimi: float = 10.0) -> None:
+        """mpv soketi açana kadar bekleyip bağlan"""
+        son_tarih = time.monotonic() + zaman_asimi
+        while True:
+            soket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                soket.connect(self.socket_path)
+                break
+            except OSError:
+                soket.close()
+                if time.monotonic() >= son_tarih:
+                    raise Exception("MPV IPC soketine bağlanılamadı")
+                time.sleep(0.05)
+        
+        self._soket = soket
+        threading.Thread(target=self._oku, daemon=True).start()
+    
+    def _oku(self) -> None:
+        """Soketten gelen satırları okuyup yanıtlara ve olay dinleyicilerine dağıt"""
+        tampon = b""
+        while True:
+            try:
+                parca = self._soket.recv(65536)
+            except OSError:
+                break
+            if not parca:
+                break
+            
+            tampon += parca
+            while b"\n" in tampon:
+                satir, tampon = tampon.split(b"\n", 1)
+                try:
+                    mesaj = json.loads(satir)
+                except ValueError:
+                    continue
+                self._mesaj_isle(mesaj)
+        
+        # Bağlantı kapandı; yanıt bekleyen herkesi uyandır
+        self.kapandi.set()
+        with self._kilit:
+            for bekleyen in self._bekleyenler.values():
+                bekleyen["olay"].set()
+    
+    def _mesaj_isle(self, mesaj: Dict[str, Any]) -> None:
+        if "event" in mesaj:
+            for dinleyici in list(self._olay_dinleyicileri):
+                try:
+                    dinleyici(mesaj)
+                except Exception:
+                    pass
+            return
+        
+        with self._kilit:
+            bekleyen = self._bekleyenler.get(mesaj.get("request_id"))
+        if bekleyen is not None:
+            bekleyen["yanit"] = mesaj
+            bekleyen["olay"].set()
+    
+    def olay_dinleyicisi_ekle(self, dinleyici) -> None:
+        """mpv olaylarını (event) alacak bir çağrılabilir ekle"""
+        self._olay_dinleyicileri.append(dinleyici)
+    
+    def komut(self, *argumanlar: Any, zaman_asimi: float = 5.0) -> Any:
+        """mpv'ye komut gönder ve yanıtın data alanını döndür"""
+        if self._soket is None:
+            raise Exception("MPV IPC bağlantısı kurulmadı")
+        
+        with self._kilit:
+            self._istek_no += 1
+            istek_no = self._istek_no
+            bekleyen = {"olay": threading.Event(), "yanit": None}
+            self._bekleyenler[istek_no] = bekleyen
+        
+        try:
+            veri = json.dumps({"command": list(argumanlar), "request_id": istek_no}) + "\n"
+            with self._yazma_kilidi:
+                self._soket.sendall(veri.encode("utf-8"))
+            
+            if not bekleyen["olay"].wait(zaman_asimi):
+                raise Exception(f"MPV '{argumanlar[0]}' komutuna yanıt vermedi")
+        except OSError as e:
+            raise Exception(f"MPV IPC bağlantısı koptu: {str(e)}")
+        finally:
+            with self._kilit:
+                self._bekleyenler.pop(istek_no, None)
+        
+        yanit = bekleyen["yanit"]
+        if yanit is None:
+            raise Exception("MPV IPC bağlantısı kapandı")
+        if yanit.get("error") != "success":
+            raise Exception(f"MPV '{argumanlar[0]}' komutu başarısız: {yanit.get('error')}")
+        return yanit.get("data")
+    
+    def kapat(self) -> None:
+        """IPC bağlantısını kapat"""
+        if self._soket is not None:
+            try:
+                self._soket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._soket.close()
+            self._soket = None
+
+class MPVOynatici:
+    """MPV oynatıcı denetleyicisi"""
+    
+    USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/137.0.0.0 Safari/537.36"
+    REFERRER = "https://yeshi.eu.org/"
+    TELEMETRI_OZELLIKLERI = ("demuxer-cache-state", "paused-for-cache", "cache-speed", "time-pos", "video-bitrate")
+    
+    def __init__(self):
+        self.socket_path = f"/tmp/anitr-py-{int(time.time())}.sock"
+        self.ipc: Optional[MPVIPCIstemcisi] = None
+        self._oturum_listesi: List[Dict[str, Any]] = []
+        # Ayarlanırsa MPV videoyu CDN yerine yerel okuma-önde vekilden okur
+        self.vekil: Optional["AkisVekili"] = None
+    
+    # PATH araması süreç başına bir kez yapılır
+    _mpv_yolu: Optional[str] = None
+    _mpv_arandi = False
+    
+    def yuklu_mu(self) -> bool:
+        """MPV'nin yüklü olup olmadığını kontrol et"""
+        if not MPVOynatici._mpv_arandi:
+            MPVOynatici._mpv_yolu = shutil.which("mpv")
+            MPVOynatici._mpv_arandi = True
+        return MPVOynatici._mpv_yolu is not None
+    
+    def _temel_argumanlar(self) -> List[str]:
+        """Her MPV sürecine verilen ortak argümanlar"""
+        return [
+            "mpv",
+            "--fullscreen",
+            "--save-position-on-quit",
+            "--really-quiet",
+            "--no-terminal",
+            f"--input-ipc-server={self.socket_path}",
+            f"--user-agent={self.USER_AGENT}",
+            f"--referrer={self.REFERRER}"
+        ]
+    
+    def _oynatma_adresi(self, url: str) -> str:
+        """Vekil açıksa URL'nin yerel vekil adresini döndür (HLS listeleri göreli adres içerdiğinden doğrudan oynatılır)"""
+        if self.vekil is None or urllib.parse.urlparse(url).path.endswith(".m3u8"):
+            return url
+        return self.vekil.adres(url)
+    
+    @profille("mpv")
+    def oynat(self, url: str, altyazi_url: Optional[str], baslik: str) -> subprocess.Popen:
+        """Videoyu MPV ile oynat"""
+        if not self.yuklu_mu():
+            raise Exception("Sisteminizde MPV yüklü değil")
+        
+        args = self._temel_argumanlar() + [
+            f"--title={baslik}",
+            f"--force-media-title={baslik}",
+            "--idle=once"
+        ]
+        
+        if altyazi_url and altyazi_url.strip():
+            args.extend(["--sub-file", altyazi_url])
+        
+        args.append(self._oynatma_adresi(url))
+        
+        return subprocess.Popen(args)
+    
+    @profille("mpv")
+    def altyazi_ekle(self, altyazi_url: str, zaman_asimi: float = 30.0) -> None:
+        """Oynatılmakta olan videoya IPC üzerinden altyazı ekle"""
+        son_tarih = time.monotonic() + zaman_asimi
+        ipc = MPVIPCIstemcisi(self.socket_path)
+        ipc.baglan(zaman_asimi)
+        try:
+            # Dosya henüz yüklenmediyse sub-add başarısız olur; yüklenene kadar tekrar dene
+            while True:
+                try:
+                    ipc.komut("sub-add", altyazi_url, "select")
+                    return
+                except Exception:
+                    if time.monotonic() >= son_tarih:
+                        raise
+                    time.sleep(0.2)
+        finally:
+            ipc.kapat()
+    
+    def ozellikleri_izle(self, ipc: MPVIPCIstemcisi, ilk_id: int = 10) -> None:
+        """Telemetri için gereken MPV özelliklerine abone ol"""
+        for i, ozellik in enumerate(self.TELEMETRI_OZELLIKLERI):
+            ipc.komut("observe_property", ilk_id + i, ozellik)
+    
+    def telemetri_izle(self, telemetri: "OynatmaTelemetrisi", zaman_asimi: float = 10.0) -> None:
+        """Oynatma telemetrisini ayrı bir IPC bağlantısı üzerinden arka planda topla"""
+        def izle():
+            ipc = MPVIPCIstemcisi(self.socket_path)
+            try:
+                ipc.baglan(zaman_asimi)
+                ipc.olay_dinleyicisi_ekle(telemetri.olay_isle)
+                self.ozellikleri_izle(ipc)
+                # MPV kapanınca okuyucu biter ve bağlantı bırakılır
+                ipc.kapandi.wait()
+            except Exception:
+                pass
+            finally:
+                ipc.kapat()
+        
+        threading.Thread(target=izle, daemon=True).start()
+    
+    @profille("mpv")
+    def oturum_baslat(self) -> subprocess.Popen:
+        """Art arda izleme için tek bir MPV sürecini boşta başlat ve IPC ile bağlan"""
+        if not self.yuklu_mu():
+            raise Exception("Sisteminizde MPV yüklü değil")
+        
+        args = self._temel_argumanlar() + [
+            "--title=anitr-py",
+            "--idle=yes",
+            "--force-window=yes"
+        ]
+        
+        self._oturum_listesi = []
+        process = subprocess.Popen(args)
+        self.ipc = MPVIPCIstemcisi(self.socket_path)
+        try:
+            self.ipc.baglan()
+        except Exception:
+            process.terminate()
+            self.ipc = None
+            raise
+        
+        self.ipc.olay_dinleyicisi_ekle(self._oturum_olayi)
+        return process
+    
+    def olay_dinleyicisi_ekle(self, dinleyici) -> None:
+        """Oturumdaki MPV olaylarını alacak bir çağrılabilir ekle"""
+        if self.ipc is None:
+            raise Exception("MPV oturumu başlatılmadı")
+        self.ipc.olay_dinleyicisi_ekle(dinleyici)
+    
+    @profille("mpv")
+    def listeye_ekle(self, url: str, altyazi_url: Optional[str], baslik: str) -> None:
+        """Videoyu oturumun oynatma listesinin sonuna ekle (MPV boştaysa hemen oynatılır)"""
+        if self.ipc is None:
+            raise Exception("MPV oturumu başlatılmadı")
+        self._oturum_listesi.append({"baslik": baslik, "altyazi_url": altyazi_url})
+        self.ipc.komut("loadfile", self._oynatma_adresi(url), "append-play")
+    
+    def _oturum_olayi(self, mesaj: Dict[str, Any]) -> None:
+        # Olaylar IPC okuyucu iş parçacığında gelir; komut yanıtlarını da o okuduğu için
+        # komut gönderen işler ayrı bir iş parçacığında yapılır
+        if mesaj.get("event") == "file-loaded":
+            threading.Thread(target=self._dosya_yuklendi, daemon=True).start()
+    
+    def _dosya_yuklendi(self) -> None:
+        """Yüklenen liste girdisinin başlığını ve altyazısını ayarla"""
+        try:
+            konum = self.ipc.komut("get_property", "playlist-pos")
+            girdi = self._oturum_listesi[konum]
+            self.ipc.komut("set_property", "force-media-title", girdi["baslik"])
+            if girdi["altyazi_url"] and girdi["altyazi_url"].strip():
+                self.ipc.komut("sub-add", girdi["altyazi_url"], "select")
+        except Exception:
+            pass
+    
+    def oturum_kapat(self, process: subprocess.Popen) -> None:
+        """Oturumdaki MPV sürecini kapat ve IPC bağlantısını bırak"""
+        if self.ipc is not None:
+            if process.poll() is None:
+                try:
+                    self.ipc.komut("quit")
+                except Exception:
+                    process.terminate()
+            self.ipc.kapat()
+            self.ipc = None
+        process.wait()
+
+class OynatmaTelemetrisi:
+    """Bir bölüm oynatılırken MPV özelliklerinden takılma, önbellek ve hız ölçümleri toplar"""
+    
+    def __init__(self, anime_adi: str, bolum_adi: str, url: str, kalite: str):
+        self.bilgi = {
+            "anime": anime_adi,
+            "bolum": bolum_adi,
+            "host": urllib.parse.urlparse(url).netloc,
+            "kalite": kalite
+        }
+        self.baslangic = time.monotonic()
+        self.ilk_kare_suresi: Optional[float] = None
+        self.takilma_sayisi = 0
+        self.takilma_suresi = 0.0
+        self._takilma_baslangici: Optional[float] = None
+        self._hiz_ornekleri: List[float] = []
+        self._bit_hizi_ornekleri: List[float] = []
+        self._onbellek_sureleri: List[float] = []
+        self._kilit = threading.Lock()
+    
+    def olay_isle(self, mesaj: Dict[str, Any]) -> None:
+        """MPV property-change olayını ölçümlere işle"""
+        if mesaj.get("event") != "property-change":
+            return
+        
+        ad, deger = mesaj.get("name"), mesaj.get("data")
+        simdi = time.monotonic()
+        with self._kilit:
+            if ad == "time-pos":
+                if deger is not None and self.ilk_kare_suresi is None:
+                    self.ilk_kare_suresi = simdi - self.baslangic
+            elif ad == "paused-for-cache":
+                # İlk kareden önceki doldurma takılma sayılmaz
+                if deger and self.ilk_kare_suresi is not None and self._takilma_baslangici is None:
+                    self._takilma_baslangici = simdi
+                    self.takilma_sayisi += 1
+                elif not deger and self._takilma_baslangici is not None:
+                    self.takilma_suresi += simdi - self._takilma_baslangici
+                    self._takilma_baslangici = None
+            elif ad == "cache-speed":
+                if deger:
+                    self._hiz_ornekleri.append(float(deger))
+            elif ad == "video-bitrate":
+                if deger:
+                    self._bit_hizi_ornekleri.append(float(deger))
+            elif ad == "demuxer-cache-state":
+                if isinstance(deger, dict) and deger.get("cache-duration") is not None:
+                    self._onbellek_sureleri.append(float(deger["cache-duration"]))
+    
+    def ozet(self) -> Dict[str, Any]:
+        """Toplanan ölçümlerin özetini döndür"""
+        with self._kilit:
+            takilma_suresi = self.takilma_suresi
+            if self._takilma_baslangici is not None:
+                takilma_suresi += time.monotonic() - self._takilma_baslangici
+            
+            def ortalama(ornekler: List[float]) -> Optional[float]:
+                return sum(ornekler) / len(ornekler) if ornekler else None
+            
+            return {
+                **self.bilgi,
+                "zaman": time.time(),
+                "sure": time.monotonic() - self.baslangic,
+                "ilk_kare_suresi": self.ilk_kare_suresi,
+                "takilma_sayisi": self.takilma_sayisi,
+                "takilma_suresi": takilma_suresi,
+                "ortalama_indirme_hizi": ortalama(self._hiz_ornekleri),
+                "ortalama_bit_hizi": ortalama(self._bit_hizi_ornekleri),
+                "ortalama_onbellek_suresi": ortalama(self._onbellek_sureleri)
+            }
+    
+    def kaydet(self, dosya: Path = METRICS_FILE) -> None:
+        """Özeti metrik dosyasına bir satır olarak ekle"""
+        try:
+            yapilandirma_dizini_olustur()
+            with open(dosya, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.ozet(), ensure_ascii=False) + "\n")
+        except OSError:
+            pass
+    
+    @staticmethod
+    def ozetle(dosya: Path = METRICS_FILE) -> List[Dict[str, Any]]:
+        """Metrik dosyasındaki kayıtları host ve kaliteye göre gruplayıp ortalamalarını döndür"""
+        gruplar: Dict[tuple, List[Dict[str, Any]]] = {}
+        if dosya.exists():
+            with open(dosya, 'r', encoding='utf-8') as f:
+                for satir in f:
+                    try:
+                        kayit = json.loads(satir)
+                    except ValueError:
+                        continue
+                    gruplar.setdefault((kayit.get("host", ""), kayit.get("kalite", "")), []).append(kayit)
+        
+        def ortalama(kayitlar: List[Dict[str, Any]], alan: str) -> Optional[float]:
+            degerler = [k[alan] for k in kayitlar if k.get(alan) is not None]
+            return sum(degerler) / len(degerler) if degerler else None
+        
+        return [
+            {
+                "host": host,
+                "kalite": kalite,
+                "oynatma": len(kayitlar),
+                "ilk_kare_suresi": ortalama(kayitlar, "ilk_kare_suresi"),
+                "takilma_sayisi": ortalama(kayitlar, "takilma_sayisi"),
+                "takilma_suresi": ortalama(kayitlar, "takilma_suresi"),
+                "ortalama_indirme_hizi": ortalama(kayitlar, "ortalama_indirme_hizi")
+            }
+            for (host, kalite), kayitlar in sorted(gruplar.items())
+        ]
+
+class KaynakSecici:
+    """Aday video kaynaklarını host başına ölçüp bağlantının takılmadan taşıyabileceği en yüksek kaliteyi seçer"""
+    
+    # Kalite -> yaklaşık gereken bant genişliği (bit/sn); ölçülen hız bunun pay katından azsa kalite elenir
+    KALITE_BIT_HIZLARI = {2160: 16_000_000, 1440: 9_000_000, 1080: 5_000_000, 720: 2_500_000,
+                          480: 1_200_000, 360: 700_000, 240: 400_000}
+    # Bir host için ölçümde denenecek en fazla URL
+    EN_FAZLA_DENEME = 3
+    
+    def __init__(self, istemci: HttpIstemcisi, dosya: Path = HOST_SCORES_FILE, ornek_bayt: int = 512 * 1024,
+                 zaman_asimi: float = 3.0, yari_omur: float = 3600.0, pay: float = 1.5,
+                 devre_kesici: Optional[DevreKesici] = None):
+        self.istemci = istemci
+        self.dosya = dosya
+        self.ornek_bayt = ornek_bayt
+        self.zaman_asimi = zaman_asimi
+        self.yari_omur = yari_omur
+        self.pay = pay
+        # Ölçümü başarısız olan hostlar devre kesiciye bildirilir; açık devreli host son çare olarak seçilir
+        self.devre_kesici = devre_kesici
+        self.basliklar = {
+            "Accept": "*/*",
+            "User-Agent": MPVOynatici.USER_AGENT,
+            "Referer": MPVOynatici.REFERRER
+        }
+        self._kilit = threading.Lock()
+        # host -> {"ttfb": sn, "hiz": bayt/sn ya da None, "zaman": epoch}; ilk seçimde diskten okunur
+        self._puanlar: Optional[Dict[str, Dict[str, Any]]] = None
+        self._havuz: Optional[ThreadPoolExecutor] = None
+        # host -> sürmekte olan arka plan ölçümü; aynı host iki kez ölçülmez
+        self._olculenler: Dict[str, Future] = {}
+        self._kapandi = threading.Event()
+    
+    def _puanlari_yukle(self) -> Dict[str, Dict[str, Any]]:
+        with self._kilit:
+            if self._puanlar is None:
+                try:
+                    with open(self.dosya, 'r', encoding='utf-8') as f:
+                        self._puanlar = json.load(f)
+                except (OSError, ValueError):
+                    self._puanlar = {}
+            return self._puanlar
+    
+    def _puanlari_kaydet(self) -> None:
+        with self._kilit:
+            veri = json.dumps(self._puanlar, ensure_ascii=False)
+        try:
+            yapilandirma_dizini_olustur()
+            ara_dosya = self.dosya.with_name(self.dosya.name + ".tmp")
+            with open(ara_dosya, 'w', encoding='utf-8') as f:
+                f.write(veri)
+            os.replace(ara_dosya, self.dosya)
+        except OSError:
+            pass
+    
+    def _guven(self, puan: Dict[str, Any]) -> float:
+        """Ölçümün yaşına göre yarı ömürle azalan ağırlığı (1 = yeni, 0.5 = bir yarı ömür önce)"""
+        return 0.5 ** (max(0.0, time.time() - puan["zaman"]) / self.yari_omur)
+    
+    def _olc(self, url: str) -> Optional[Dict[str, Any]]:
+        """İlk bayta kadar geçen süreyi ve kısa bir örnekle aktarım hızını ölç"""
+        try:
+            baslangic = time.perf_counter()
+            response = self.istemci.get(
+                url,
+                headers={**self.basliklar, "Range": f"bytes=0-{self.ornek_bayt - 1}"},
+                stream=True,
+                timeout=(self.zaman_asimi, self.zaman_asimi)
+            )
+            try:
+                response.raise_for_status()
+                ilk_bayt = None
+                alinan = 0
+                for veri in response.iter_content(chunk_size=16 * 1024):
+                    if ilk_bayt is None:
+                        ilk_bayt = time.perf_counter()
+                    alinan += len(veri)
+                    if alinan >= self.ornek_bayt or time.perf_counter() - baslangic > self.zaman_asimi:
+                        break
+                bitis = time.perf_counter()
+            finally:
+                response.close()
+        except Exception:
+            return None
+        
+        if ilk_bayt is None:
+            return None
+        # HLS listesi gibi küçük yanıtlar hız için anlamlı bir örnek vermez
+        hiz = alinan / (bitis - ilk_bayt) if alinan >= self.ornek_bayt // 4 and bitis > ilk_bayt else None
+        return {"ttfb": ilk_bayt - baslangic, "hiz": hiz}
+    
+    def _puan_guncelle(self, host: str, olcum: Dict[str, Any]) -> None:
+        """Yeni ölçümü eski puanla, eski puanın güveni oranında harmanla"""
+        with self._kilit:
+            eski = self._puanlar.get(host)
+            agirlik = 0.5 * self._guven(eski) if eski else 0.0
+            
+            def harmanla(alan: str) -> Optional[float]:
+                if olcum[alan] is None or not eski or eski.get(alan) is None:
+                    return olcum[alan] if olcum[alan] is not None else (eski or {}).get(alan)
+                return agirlik * eski[alan] + (1 - agirlik) * olcum[alan]
+            
+            self._puanlar[host] = {"ttfb": harmanla("ttfb"), "hiz": harmanla("hiz"), "zaman": time.time()}
+    
+    def gerekli_bit_hizi(self, etiket: str) -> int:
+        """Etiketteki kaliteyi karşılayan en yakın tablo değerini döndür (bilinmiyorsa 0)"""
+        kalite = AnimeCLI._kalite_cikar(etiket)
+        uygun = [hiz for k, hiz in self.KALITE_BIT_HIZLARI.items() if k <= kalite]
+        return max(uygun) if uygun else 0
+    
+    def _host_olc(self, host: str, urller: List[str]) -> None:
+        """Hostu sıradaki URL'lerle dene; tek bir bozuk dosya hostun puanını belirlemez"""
+        try:
+            if self.devre_kesici and not self.devre_kesici.izin_ver(host):
+                return
+            for url in urller[:self.EN_FAZLA_DENEME]:
+                if self._kapandi.is_set():
+                    if self.devre_kesici:
+                        self.devre_kesici.birak(host)
+                    return
+                olcum = self._olc(url)
+                if olcum:
+                    self._puan_guncelle(host, olcum)
+                    self._puanlari_kaydet()
+                    if self.devre_kesici:
+                        self.devre_kesici.basari(host)
+                    return
+            if self.devre_kesici:
+                self.devre_kesici.hata(host)
+        finally:
+            with self._kilit:
+                self._olculenler.pop(host, None)
+    
+    def olcumleri_baslat(self, izleme_verisi: List[Dict[str, str]]) -> Dict[str, Future]:
+        """Ölçümü eskimiş hostları arka planda ölçmeye başla; beklemeden döner"""
+        puanlar = self._puanlari_yukle()
+        hostlar: Dict[str, List[str]] = {}
+        for kaynak in izleme_verisi:
+            hostlar.setdefault(urllib.parse.urlparse(kaynak["url"]).netloc, []).append(kaynak["url"])
+        
+        baslatilan: Dict[str, Future] = {}
+        with self._kilit:
+            if self._kapandi.is_set():
+                return baslatilan
+            for host, urller in hostlar.items():
+                # Son bir yarı ömür içinde ölçülmüş ve devresi açık hostlar tekrar ölçülmez
+                if host in puanlar and self._guven(puanlar[host]) >= 0.5:
+                    continue
+                if self.devre_kesici and self.devre_kesici.acik_mi(host):
+                    continue
+                if host not in self._olculenler:
+                    if self._havuz is None:
+                        self._havuz = ThreadPoolExecutor(max_workers=4, thread_name_prefix="anitr-py-olcum")
+                    self._olculenler[host] = self._havuz.submit(self._host_olc, host, urller)
+                baslatilan[host] = self._olculenler[host]
+        return baslatilan
+    
+    def sec(self, izleme_verisi: List[Dict[str, str]]) -> Dict[str, str]:
+        """Hızın taşıyabildiği en yüksek kaliteyi eldeki puanlarla seç; eskimiş hostlar arka planda ölçülür"""
+        self.olcumleri_baslat(izleme_verisi)
+        with self._kilit:
+            puanlar = dict(self._puanlar)
+        
+        def sira(kaynak: Dict[str, str]) -> tuple:
+            host = urllib.parse.urlparse(kaynak["url"]).netloc
+            puan = puanlar.get(host) or {}
+            kalite = AnimeCLI._kalite_cikar(kaynak["etiket"])
+            # Devresi açık host, başka host kalmadıysa seçilir
+            erisilir = not (self.devre_kesici and self.devre_kesici.acik_mi(host))
+            # Hızı bilinmeyen host için kalite sınırlanmaz
+            tasir = puan.get("hiz") is None or puan["hiz"] * 8 >= self.gerekli_bit_hizi(kaynak["etiket"]) * self.pay
+            if tasir:
+                ttfb = puan.get("ttfb") if puan.get("ttfb") is not None else float("inf")
+                return (erisilir, 1, kalite, -ttfb)
+            # Hiçbir kalite taşınamıyorsa en düşük kalite en hızlı hosttan seçilir
+            return (erisilir, 0, -kalite, puan["hiz"])
+        
+        izleme_verisi.sort(key=lambda x: AnimeCLI._kalite_cikar(x["etiket"]), reverse=True)
+        return max(izleme_verisi, key=sira)
+    
+    def istatistikler(self) -> Dict[str, Dict[str, Any]]:
+        """Host puanlarının bir kopyasını döndür"""
+        puanlar = self._puanlari_yukle()
+        with self._kilit:
+            return {host: dict(puan) for host, puan in puanlar.items()}
+    
+    def kapat(self) -> None:
+        """Bekleyen ölçümleri iptal et; süren ölçüm sıradaki URL'ye geçmeden biter"""
+        with self._kilit:
+            self._kapandi.set()
+            havuz, self._havuz = self._havuz, None
+        if havuz:
+            havuz.shutdown(wait=False, cancel_futures=True)
+
+class OnYukleyici:
+    """Sıradaki bölümün video ve altyazı kaynaklarını oynatma sürerken arka planda çözer"""
+    
+    # İmzalı URL'lerde son kullanma zamanını taşıyabilen sorgu parametreleri
+    SON_KULLANMA_PARAMETRELERI = ("expires", "expire", "exp", "e")
+    
+    def __init__(self, anime_kaynak: "AnimeCix", is_havuzu: ThreadPoolExecutor, kalite_sec,
+                 gecerlilik_suresi: float = 300, isitma_bayt: int = 0, en_fazla_kayit: int = 8):
+        self.anime_kaynak = anime_kaynak
+        self.is_havuzu = is_havuzu
+        self.kalite_sec = kalite_sec
+        self.gecerlilik_suresi = gecerlilik_suresi
+        self.isitma_bayt = isitma_bayt
+        self.en_fazla_kayit = en_fazla_kayit
+        # Bölüm kimliği -> çözümleme; en eski kayıt başta
+        self._kayitlar: "OrderedDict[str, Future]" = OrderedDict()
+        self._anime_id: Optional[Any] = None
+        self._kilit = threading.Lock()
+    
+    def baslat(self, anime: Dict[str, Any], bolum: Dict[str, Any], bolum_indeks: int) -> None:
+        """Bölümün çözümlenmesini arka planda başlat (zaten başlatıldıysa bir şey yapma)"""
+        with self._kilit:
+            # Başka bir animeye geçildiyse önceki animenin oynatılmamış ön yüklemeleri atılır
+            if anime["id"] != self._anime_id:
+                self._temizle()
+                self._anime_id = anime["id"]
+            if bolum["id"] in self._kayitlar:
+                return
+            self._kayitlar[bolum["id"]] = self.is_havuzu.submit(self._coz, anime, bolum, bolum_indeks)
+            while len(self._kayitlar) > self.en_fazla_kayit:
+                _, gelecek = self._kayitlar.popitem(last=False)
+                gelecek.cancel()
+    
+    def _temizle(self) -> None:
+        # Başlamamış çözümlemeler iptal edilir; sürenler biter ve sonuçları atılır
+        for gelecek in self._kayitlar.values():
+            gelecek.cancel()
+        self._kayitlar.clear()
+    
+    def bekle(self, anime: Dict[str, Any], bolum: Dict[str, Any], bolum_indeks: int, zaman_asimi: float) -> Dict[str, Any]:
+        """Bölümün çözümlenmesini (gerekirse başlatıp) bekle ve sonucunu al"""
+        self.baslat(anime, bolum, bolum_indeks)
+        with self._kilit:
+            gelecek = self._kayitlar.pop(bolum["id"])
+        
+        try:
+            sonuc = gelecek.result(timeout=zaman_asimi)
+        except concurrent.futures.TimeoutError:
+            raise Exception("Video kaynağı zamanında çözümlenemedi")
+        
+        if time.time() >= sonuc["son_kullanma"]:
+            return self._coz(anime, bolum, bolum_indeks)
+        return sonuc
+    
+    def al(self, bolum_id: str) -> Optional[Dict[str, Any]]:
+        """Tamamlanmış ve süresi dolmamış ön yükleme sonucunu al (yoksa None)"""
+        with self._kilit:
+            gelecek = self._kayitlar.get(bolum_id)
+            if gelecek is None or not gelecek.done():
+                return None
+            del self._kayitlar[bolum_id]
+        
+        try:
+            sonuc = gelecek.result()
+        except BaseException:
+            # İptal edilmiş ya da hata vermiş ön yükleme yok sayılır
+            return None
+        
+        # Süresi dolmuş imzalı URL'ler MPV'ye verilmez, baştan çözülür
+        if time.time() >= sonuc["son_kullanma"]:
+            return None
+        return sonuc
+    
+    def _coz(self, anime: Dict[str, Any], bolum: Dict[str, Any], bolum_indeks: int) -> Dict[str, Any]:
+        cozulme_zamani = time.time()
+        izleme_verisi = self.anime_kaynak.izleme_verisini_al(bolum["id"])
+        sezon_num = bolum["ekstra"].get("sezon_num", 1)
+        altyazi_url = self.anime_kaynak.tr_altyazi_al(sezon_num - 1, bolum_indeks, anime["id"], bolum["id"])
+        
+        son_kullanma = cozulme_zamani + self.gecerlilik_suresi
+        for kaynak in izleme_verisi:
+            son_kullanma = min(son_kullanma, self._url_son_kullanma(kaynak["url"]))
+        
+        if izleme_verisi and self.isitma_bayt > 0:
+            self._isit(self.kalite_sec(izleme_verisi)["url"])
+        
+        return {
+            "izleme_verisi": izleme_verisi,
+            "altyazi_url": altyazi_url,
+            "son_kullanma": son_kullanma
+        }
+    
+    def _url_son_kullanma(self, url: str) -> float:
+        """İmzalı URL'nin son kullanma zamanını döndür (bilinmiyorsa sonsuz)"""
+        parametreler = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+        for ad in self.SON_KULLANMA_PARAMETRELERI:
+            try:
+                deger = float(parametreler[ad][0])
+            except (KeyError, ValueError):
+                continue
+            # Unix zaman damgası gibi görünmeyen değerler yok sayılır
+            if deger > 1_000_000_000:
+                return deger
+        return float("inf")
+    
+    def _isit(self, url: str) -> None:
+        """Seçilen kalitenin ilk baytlarını çekerek CDN ve bağlantıyı ısıt"""
+        try:
+            response = self.anime_kaynak.istemci.get(
+                url,
+                headers={
+                    "Range": f"bytes=0-{self.isitma_bayt - 1}",
+                    "User-Agent": MPVOynatici.USER_AGENT,
+                    "Referer": MPVOynatici.REFERRER
+                },
+                stream=True
+            )
+            for _ in response.iter_content(chunk_size=64 * 1024):
+                pass
+            response.close()
+        except Exception:
+            pass
+
+class HizSinirlayici:
+    """Tüm indirmelerin paylaştığı bant genişliği sınırı (jeton kovası)"""
+    
+    def __init__(self, bayt_saniye: float = 0):
+        self.bayt_saniye = bayt_saniye
+        self._jeton = float(bayt_saniye)
+        self._son = time.monotonic()
+        self._kilit = threading.Lock()
+    
+    def al(self, miktar: int) -> None:
+        """miktar baytlık izin al; sınır aşılıyorsa gereken kadar bekle (0 = sınırsız)"""
+        if self.bayt_saniye <= 0:
+            return
+        
+        with self._kilit:
+            simdi = time.monotonic()
+            self._jeton = min(self.bayt_saniye, self._jeton + (simdi - self._son) * self.bayt_saniye)
+            self._son = simdi
+            # Jetonlar eksiye düşebilir; borç, bekleme süresi olarak ödenir
+            self._jeton -= miktar
+            bekleme = -self._jeton / self.bayt_saniye if self._jeton < 0 else 0.0
+        
+        if bekleme > 0:
+            time.sleep(bekleme)
+
+class Indirici:
+    """Videoyu paralel HTTP Range parçalarıyla indirir; yarıda kalan indirme tamamlanan baytlardan devam eder"""
+    
+    PARCA_BOYUTU = 4 * 1024 * 1024
+    OKUMA_BOYUTU = 64 * 1024
+    
+    def __init__(self, istemci: HttpIstemcisi, host_basina_baglanti: int = 4, bant_genisligi: float = 0,
+                 parca_boyutu: int = PARCA_BOYUTU, yeniden_deneme: int = 3):
+        self.istemci = istemci
+        self.host_basina_baglanti = host_basina_baglanti
+        self.hiz_sinirlayici = HizSinirlayici(bant_genisligi)
+        self.parca_boyutu = parca_boyutu
+        self.yeniden_deneme = yeniden_deneme
+        self._kilit = threading.Lock()
+        self._host_semaforlari: Dict[str, threading.BoundedSemaphore] = {}
+        self.basliklar = {
+            "Accept": "*/*",
+            "User-Agent": MPVOynatici.USER_AGENT,
+            "Referer": MPVOynatici.REFERRER
+        }
+    
+    def _host_semaforu(self, url: str) -> threading.BoundedSemaphore:
+        """Tüm indirmelerde bir hosta açık bağlantı sayısını sınırlayan semafor"""
+        host = urllib.parse.urlparse(url).netloc
+        with self._kilit:
+            if host not in self._host_semaforlari:
+                self._host_semaforlari[host] = threading.BoundedSemaphore(self.host_basina_baglanti)
+            return self._host_semaforlari[host]
+    
+    def _boyut_al(self, url: str) -> Optional[int]:
+        """Dosya boyutunu döndür; sunucu Range desteklemiyorsa None"""
+        with self._host_semaforu(url):
+            response = self.istemci.get(url, headers={**self.basliklar, "Range": "bytes=0-0"}, stream=True)
+            response.close()
+        response.raise_for_status()
+        
+        icerik_araligi = response.headers.get("Content-Range", "")
+        if response.status_code != 206 or "/" not in icerik_araligi:
+            return None
+        toplam = icerik_araligi.rsplit("/", 1)[1]
+        return int(toplam) if toplam.isdigit() else None
+    
+    def indir(self, url: str, hedef: Path, ilerleme=None) -> Path:
+        """URL'yi hedef dosyaya indir; ilerleme(indirilen, toplam) çağrılabilirse ara ara çağrılır"""
+        if hedef.exists():
+            return hedef
+        
+        hedef.parent.mkdir(parents=True, exist_ok=True)
+        gecici = hedef.with_name(hedef.name + ".part")
+        manifest_dosyasi = hedef.with_name(hedef.name + ".parca.json")
+        
+        boyut = self._boyut_al(url)
+        if boyut is None:
+            self._tek_parca_indir(url, gecici, ilerleme)
+            os.replace(gecici, hedef)
+            return hedef
+        
+        # Manifest aynı boyut ve parça düzeniyle başlatılmış bir indirmeye aitse kaldığı yerden devam et
+        manifest = {"boyut": boyut, "parca_boyutu": self.parca_boyutu, "yazilan": {}}
+        if manifest_dosyasi.exists() and gecici.exists():
+            try:
+                with open(manifest_dosyasi, 'r', encoding='utf-8') as f:
+                    eski = json.load(f)
+                if eski.get("boyut") == boyut and eski.get("parca_boyutu") == self.parca_boyutu:
+                    manifest = eski
+            except (OSError, ValueError):
+                pass
+        
+        if not manifest["yazilan"]:
+            # Seyrek dosya: disk alanı yalnızca yazılan bölgeler için kullanılır
+            with open(gecici, 'wb') as f:
+                f.truncate(boyut)
+        
+        parcalar = []
+        for no in range((boyut + self.parca_boyutu - 1) // self.parca_boyutu):
+            bas = no * self.parca_boyutu
+            son = min(boyut, bas + self.parca_boyutu) - 1
+            if manifest["yazilan"].get(str(no), 0) < son - bas + 1:
+                parcalar.append((no, bas, son))
+        
+        durum = {"son_kayit": 0.0, "indirilen": sum(manifest["yazilan"].values())}
+        iptal = threading.Event()
+        kayit_kilidi = threading.Lock()
+        
+        def manifest_kaydet(zorla: bool = False) -> None:
+            # Zorunlu olmayan kayıt, başka bir iş parçacığı kaydederken atlanır
+            if not kayit_kilidi.acquire(blocking=zorla):
+                return
+            try:
+                with self._kilit:
+                    simdi = time.monotonic()
+                    if not zorla and simdi - durum["son_kayit"] < 1.0:
+                        return
+                    durum["son_kayit"] = simdi
+                    anlik = {**manifest, "yazilan": dict(manifest["yazilan"])}
+                
+                # Manifest yalnızca diske ulaşmış baytları göstermeli: anlık görüntüdeki baytlar
+                # görüntü alınmadan önce yazıldı, fsync onları manifestten önce diske indirir
+                fd = os.open(gecici, os.O_RDWR)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                
+                ara_dosya = manifest_dosyasi.with_name(manifest_dosyasi.name + ".tmp")
+                with open(ara_dosya, 'w', encoding='utf-8') as f:
+                    json.dump(anlik, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(ara_dosya, manifest_dosyasi)
+            finally:
+                kayit_kilidi.release()
+        
+        def parca_indir(no: int, bas: int, son: int) -> None:
+            for deneme in range(self.yeniden_deneme + 1):
+                baslangic = bas + manifest["yazilan"].get(str(no), 0)
+                try:
+                    with self._host_semaforu(url):
+                        response = self.istemci.get(
+                            url,
+                            headers={**self.basliklar, "Range": f"bytes={baslangic}-{son}"},
+                            stream=True
+                        )
+                        try:
+                            if response.status_code != 206:
+                                raise Exception(f"Beklenmeyen HTTP durumu {response.status_code}")
+                            with open(gecici, 'r+b', buffering=0) as f:
+                                f.seek(baslangic)
+                                for veri in response.iter_content(chunk_size=self.OKUMA_BOYUTU):
+                                    if iptal.is_set():
+                                        raise Exception("İndirme iptal edildi")
+                                    self.hiz_sinirlayici.al(len(veri))
+                                    f.write(veri)
+                                    with self._kilit:
+                                        manifest["yazilan"][str(no)] = manifest["yazilan"].get(str(no), 0) + len(veri)
+                                        durum["indirilen"] += len(veri)
+                                    if ilerleme:
+                                        ilerleme(durum["indirilen"], boyut)
+                                    manifest_kaydet()
+                        finally:
+                            response.close()
+                    
+                    if bas + manifest["yazilan"].get(str(no), 0) <= son:
+                        raise Exception("Parça eksik indirildi")
+                    manifest_kaydet(zorla=True)
+                    return
+                except Exception:
+                    if deneme >= self.yeniden_deneme or iptal.is_set():
+                        raise
+                    time.sleep(0.5 * (2 ** deneme))
+        
+        havuz = ThreadPoolExecutor(max_workers=self.host_basina_baglanti)
+        try:
+            for gelecek in as_completed([havuz.submit(parca_indir, *parca) for parca in parcalar]):
+                gelecek.result()
+        except BaseException:
+            # Kalan parçaları durdur; yazılmış baytlar manifestte kalır ve sonraki denemede atlanır
+            iptal.set()
+            raise
+        finally:
+            havuz.shutdown(wait=True, cancel_futures=True)
+            manifest_kaydet(zorla=True)
+        
+        os.replace(gecici, hedef)
+        manifest_dosyasi.unlink()
+        return hedef
+    
+    def _tek_parca_indir(self, url: str, gecici: Path, ilerleme=None) -> None:
+        """Range desteklemeyen sunucudan dosyayı tek bağlantıyla baştan indir"""
+        with self._host_semaforu(url):
+            response = self.istemci.get(url, headers=self.basliklar, stream=True)
+            try:
+                response.raise_for_status()
+                toplam = int(response.headers.get("Content-Length", 0)) or None
+                indirilen = 0
+                with open(gecici, 'wb') as f:
+                    for veri in response.iter_content(chunk_size=self.OKUMA_BOYUTU):
+                        self.hiz_sinirlayici.al(len(veri))
+                        f.write(veri)
+                        indirilen += len(veri)
+                        if ilerleme:
+                            ilerleme(indirilen, toplam)
+            finally:
+                response.close()
+
+class AkisVekili:
+    """mpv ile CDN arasında yerel okuma-önde vekil sunucu; Range isteklerini bellekteki parçalardan yanıtlar"""
+    
+    PARCA_BOYUTU = 1024 * 1024
+    # Kayıtlı tutulan en fazla kaynak (bölüm URL'si); en uzun süre kullanılmayan atılır
+    EN_FAZLA_KAYNAK = 32
+    
+    def __init__(self, istemci: HttpIstemcisi, bellek_siniri: int = 64 * 1024 * 1024, onde_parca: int = 4,
+                 baglanti: int = 4, parca_boyutu: int = PARCA_BOYUTU):
+        self.istemci = istemci
+        self.parca_boyutu = parca_boyutu
+        self.bellek_siniri = max(bellek_siniri, 2 * parca_boyutu)
+        # Önde okunan parçalar, oynatılan parçayı bellekten atacak kadar çok olamaz
+        self.onde_parca = max(0, min(onde_parca, self.bellek_siniri // parca_boyutu - 1))
+        self.basliklar = {
+            "Accept": "*/*",
+            "User-Agent": MPVOynatici.USER_AGENT,
+            "Referer": MPVOynatici.REFERRER
+        }
+        self._kilit = threading.Lock()
+        # (kaynak kimliği, parça no) -> veri; en son kullanılan sonda (geri sarmalar için LRU)
+        self._parcalar: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._bellek = 0
+        self._yoldakiler: Dict[tuple, Future] = {}
+        # Kaynak kimliği -> URL, boyut ve tür; en son kullanılan sonda
+        self._kaynaklar: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # İstenen parça için her zaman bir bağlantı boş kalsın diye önde okuma bir eksik işçiyle çalışır
+        self._havuz = ThreadPoolExecutor(max_workers=max(1, baglanti - 1), thread_name_prefix="anitr-py-vekil")
+        self._sunucu = None
+        self.sayaclar = {"isabet": 0, "yolda": 0, "iska": 0, "ust_akis_bayt": 0, "istemci_bayt": 0}
+    
+    def baslat(self) -> None:
+        """Vekil sunucuyu 127.0.0.1 üzerinde rastgele bir portta arka planda başlat"""
+        if self._sunucu is not None:
+            return
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        vekil = self
+        
+        class VekilIsleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Başlıklar ve gövde ayrı yazılır; Nagle gecikmeli ACK ile birleşip her yanıta ~40 ms eklemesin
+            disable_nagle_algorithm = True
+            
+            def log_message(self, *args) -> None:
+                pass
+            
+            def do_HEAD(self) -> None:
+                vekil._istegi_yanitla(self, govde=False)
+            
+            def do_GET(self) -> None:
+                vekil._istegi_yanitla(self, govde=True)
+        
+        self._sunucu = ThreadingHTTPServer(("127.0.0.1", 0), VekilIsleyici)
+        self._sunucu.daemon_threads = True
+        threading.Thread(target=self._sunucu.serve_forever, daemon=True, name="anitr-py-vekil-sunucu").start()
+    
+    def adres(self, url: str) -> str:
+        """Upstream URL'yi kaydet ve mpv'ye verilecek yerel adresi döndür"""
+        self.baslat()
+        kimlik = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        with self._kilit:
+            self._kaynaklar.setdefault(kimlik, {"url": url, "kilit": threading.Lock(), "boyut": None, "tur": None})
+            self._kaynaklar.move_to_end(kimlik)
+            while len(self._kaynaklar) > self.EN_FAZLA_KAYNAK:
+                self._kaynagi_at(next(iter(self._kaynaklar)))
+        dosya_adi = urllib.parse.quote(Path(urllib.parse.urlparse(url).path).name or "video")
+        return f"http://127.0.0.1:{self._sunucu.server_port}/{kimlik}/{dosya_adi}"
+    
+    def _kaynagi_at(self, kimlik: str) -> None:
+        # Kilit tutulurken çağrılır; kaynağın bellekteki parçaları ve kuyruktaki önde okumaları da bırakılır
+        del self._kaynaklar[kimlik]
+        for anahtar in [anahtar for anahtar in self._parcalar if anahtar[0] == kimlik]:
+            self._bellek -= len(self._parcalar.pop(anahtar))
+        for anahtar, gelecek in list(self._yoldakiler.items()):
+            if anahtar[0] == kimlik and gelecek.cancel():
+                del self._yoldakiler[anahtar]
+    
+    def _kaynak_bilgisi(self, kimlik: str) -> Optional[Dict[str, Any]]:
+        """Kaynağın boyutunu ve içerik türünü ilk istekte bir kez öğren; Range desteklenmiyorsa boyut 0 kalır"""
+        with self._kilit:
+            kaynak = self._kaynaklar.get(kimlik)
+            if kaynak is None:
+                return None
+            self._kaynaklar.move_to_end(kimlik)
+        with kaynak["kilit"]:
+            if kaynak["boyut"] is None:
+                response = self.istemci.get(kaynak["url"], headers={**self.basliklar, "Range": "bytes=0-0"}, stream=True)
+                response.close()
+                response.raise_for_status()
+                icerik_araligi = response.headers.get("Content-Range", "")
+                toplam = icerik_araligi.rsplit("/", 1)[1] if "/" in icerik_araligi else ""
+                kaynak["boyut"] = int(toplam) if response.status_code == 206 and toplam.isdigit() else 0
+                kaynak["tur"] = response.headers.get("Content-Type", "application/octet-stream")
+        return kaynak
+    
+    def _parca_indir(self, kimlik: str, no: int) -> bytes:
+        """Bir parçayı upstream'den tek Range isteğiyle çekip belleğe yerleştir"""
+        anahtar = (kimlik, no)
+        try:
+            kaynak = self._kaynaklar.get(kimlik)
+            if kaynak is None:
+                raise Exception("Kaynak artık kayıtlı değil")
+            bas = no * self.parca_boyutu
+            son = min(kaynak["boyut"], bas + self.parca_boyutu) - 1
+            response = self.istemci.get(kaynak["url"], headers={**self.basliklar, "Range": f"bytes={bas}-{son}"})
+            if response.status_code != 206 or len(response.content) != son - bas + 1:
+                raise Exception(f"Parça alınamadı: HTTP {response.status_code}")
+            veri = response.content
+            
+            with self._kilit:
+                self.sayaclar["ust_akis_bayt"] += len(veri)
+                self._parcalar[anahtar] = veri
+                self._bellek += len(veri)
+                while self._bellek > self.bellek_siniri and len(self._parcalar) > 1:
+                    _, atilan = self._parcalar.popitem(last=False)
+                    self._bellek -= len(atilan)
+            return veri
+        finally:
+            with self._kilit:
+                self._yoldakiler.pop(anahtar, None)
+    
+    def _parca_al(self, kimlik: str, no: int) -> bytes:
+        """Parçayı bellekten ver; yoksa yoldaki isteği bekle ya da hemen çek, sonra önündekileri okumaya başla"""
+        anahtar = (kimlik, no)
+        with self._kilit:
+            veri = self._parcalar.get(anahtar)
+            if veri is not None:
+                self._parcalar.move_to_end(anahtar)
+                self.sayaclar["isabet"] += 1
+            gelecek = self._yoldakiler.get(anahtar) if veri is None else None
+            if veri is None:
+                self.sayaclar["yolda" if gelecek else "iska"] += 1
+        
+        self._onden_oku(kimlik, no)
+        if veri is not None:
+            return veri
+        if gelecek is not None and not gelecek.cancel():
+            return gelecek.result()
+        
+        # İstenen parça kuyruğa girmeden bu iş parçacığında çekilir; aynı parçayı isteyenler bunu bekler
+        gelecek = Future()
+        gelecek.set_running_or_notify_cancel()
+        with self._kilit:
+            self._yoldakiler[anahtar] = gelecek
+        try:
+            veri = self._parca_indir(kimlik, no)
+        except Exception as e:
+            gelecek.set_exception(e)
+            raise
+        gelecek.set_result(veri)
+        return veri
+    
+    def _onden_oku(self, kimlik: str, no: int) -> None:
+        """Sonraki parçaları paralel çekmeye başla; artık gerekmeyen kuyruktaki önde okumaları iptal et"""
+        with self._kilit:
+            kaynak = self._kaynaklar.get(kimlik)
+            if kaynak is None:
+                return
+            parca_sayisi = (kaynak["boyut"] + self.parca_boyutu - 1) // self.parca_boyutu
+            pencere = range(no, min(parca_sayisi, no + self.onde_parca + 1))
+            # Atlama sonrasında eski konumun kuyruktaki önde okumaları bağlantıları boşuna meşgul etmesin
+            for (k, n), gelecek in list(self._yoldakiler.items()):
+                if k == kimlik and n not in pencere and gelecek.cancel():
+                    del self._yoldakiler[(k, n)]
+            for n in pencere[1:]:
+                anahtar = (kimlik, n)
+                if anahtar not in self._parcalar and anahtar not in self._yoldakiler:
+                    self._yoldakiler[anahtar] = self._havuz.submit(self._parca_indir, kimlik, n)
+    
+    @staticmethod
+    def _aralik_coz(aralik: str, boyut: int) -> Optional[tuple]:
+        """Range başlığını (bas, son) çiftine çevir; başlık yoksa, birim bytes değilse ya da birden çok aralık
+        istendiyse None (tüm dosya 200 ile gönderilir); bozuk ya da karşılanamayan aralıkta ValueError"""
+        if not aralik.startswith("bytes=") or "," in aralik:
+            return None
+        ilk, tire, ikinci = (parca.strip() for parca in aralik[6:].partition("-"))
+        if not tire or not (ilk or ikinci) or not all(parca.isdecimal() for parca in (ilk, ikinci) if parca):
+            raise ValueError(f"Geçersiz aralık: {aralik}")
+        
+        if ilk:
+            bas = int(ilk)
+            son = min(int(ikinci), boyut - 1) if ikinci else boyut - 1
+        else:
+            # bytes=-N: son N bayt
+            if int(ikinci) == 0:
+                raise ValueError(f"Geçersiz aralık: {aralik}")
+            bas, son = max(0, boyut - int(ikinci)), boyut - 1
+        if bas >= boyut or bas > son:
+            raise ValueError(f"Karşılanamayan aralık: {aralik}")
+        return bas, son
+    
+    def _istegi_yanitla(self, isleyici, govde: bool) -> None:
+        """mpv'den gelen isteği bellekteki parçalarla yanıtla"""
+        kimlik = isleyici.path.lstrip("/").split("/", 1)[0]
+        try:
+            kaynak = self._kaynak_bilgisi(kimlik)
+        except Exception:
+            isleyici.send_error(502)
+            return
+        if kaynak is None:
+            isleyici.send_error(404)
+            return
+        if not kaynak["boyut"]:
+            # Upstream Range desteklemiyorsa mpv doğrudan kaynağa yönlendirilir
+            isleyici.send_response(302)
+            isleyici.send_header("Location", kaynak["url"])
+            isleyici.send_header("Content-Length", "0")
+            isleyici.end_headers()
+            return
+        
+        boyut = kaynak["boyut"]
+        try:
+            aralik = self._aralik_coz(isleyici.headers.get("Range", ""), boyut)
+        except ValueError:
+            isleyici.send_response(416)
+            isleyici.send_header("Content-Range", f"bytes */{boyut}")
+            isleyici.send_header("Content-Length", "0")
+            isleyici.end_headers()
+            return
+        bas, son = aralik or (0, boyut - 1)
+        
+        isleyici.send_response(206 if aralik else 200)
+        isleyici.send_header("Content-Type", kaynak["tur"])
+        isleyici.send_header("Accept-Ranges", "bytes")
+        isleyici.send_header("Content-Length", str(son - bas + 1))
+        if aralik:
+            isleyici.send_header("Content-Range", f"bytes {bas}-{son}/{boyut}")
+        isleyici.end_headers()
+        if not govde:
+            return
+        
+        try:
+            for no in range(bas // self.parca_boyutu, son // self.parca_boyutu + 1):
+                veri = self._parca_al(kimlik, no)
+                parca_basi = no * self.parca_boyutu
+                dilim = veri[max(bas, parca_basi) - parca_basi:son - parca_basi + 1]
+                isleyici.wfile.write(dilim)
+                with self._kilit:
+                    self.sayaclar["istemci_bayt"] += len(dilim)
+        except (BrokenPipeError, ConnectionResetError):
+            # mpv atlama yaparken eski bağlantıyı kapatır
+            pass
+        except Exception:
+            # Başlıklar gönderildi; bağlantıyı kesmek mpv'nin yeniden denemesini sağlar
+            isleyici.close_connection = True
+    
+    def istatistikler(self) -> Dict[str, Any]:
+        """İsabet oranı ve upstream/istemci bayt sayaçlarını döndür"""
+        with self._kilit:
+            sayac = dict(self.sayaclar)
+            sayac["bellek_bayt"] = self._bellek
+        toplam = sayac["isabet"] + sayac["yolda"] + sayac["iska"]
+        sayac["isabet_orani"] = sayac["isabet"] / toplam if toplam else 0.0
+        return sayac
+    
+    def kapat(self) -> None:
+        """Sunucuyu durdur, önde okumaları iptal et ve belleği bırak"""
+        if self._sunucu is not None:
+            self._sunucu.shutdown()
+            self._sunucu.server_close()
+            self._sunucu = None
+        self._havuz.shutdown(wait=False, cancel_futures=True)
+        with self._kilit:
+            self._parcalar.clear()
+            self._bellek = 0
 
 class TUI:
     """Terminal Kullanıcı Arayüzü"""
     
-    def __init__(self):
-        self.ekran_temizle()
-    
     def ekran_temizle(self) -> None:
         """Terminal ekranını temizle"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            # Her menüde 'clear' süreci başlatmak yerine ANSI kaçış dizisi kullan
+            print("\033[H\033[2J\033[3J", end="", flush=True)
     
     def yukleniyor_goster(self, mesaj: str) -> None:
         """Yükleniyor mesajını göster"""
@@ -390,10 +3472,79 @@ class TUI:
         """Kullanıcıdan girdi al"""
         return input(f"🔍 {prompt}: ").strip()
     
-    def secim_listesi(self, secenekler: List[str], baslik: str) -> str:
-        """Seçim listesini göster ve kullanıcı seçimini al"""
+    def canli_girdi_destekleniyor(self) -> bool:
+        """Tuş tuş okuma yapılabiliyor mu (etkileşimli terminal ve termios/msvcrt)"""
+        if not sys.stdin.isatty():
+            return False
+        if os.name == 'nt':
+            return True
+        try:
+            import termios  # noqa: F401
+            return True
+        except ImportError:
+            return False
+    
+    @contextlib.contextmanager
+    def ham_girdi(self):
+        """Girdiyi satır beklemeden tuş tuş okunacak kipe al; çıkışta terminali eski haline getir"""
+        import codecs
+        # Türkçe harfler birden çok bayttır; okuma ortasında bölünen karakterler sonraki okumada tamamlanır
+        self._cozucu = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        if os.name == 'nt':
+            yield
+            return
+        
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        eski_ayarlar = termios.tcgetattr(fd)
+        try:
+            # cbreak: yankı ve satır tamponu kapalı, Ctrl+C yine KeyboardInterrupt üretir
+            tty.setcbreak(fd, termios.TCSANOW)
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, eski_ayarlar)
+    
+    def tus_oku(self, zaman_asimi: float) -> str:
+        """Basılan tuşları döndür; zaman aşımına kadar tuşa basılmazsa boş metin"""
+        if os.name == 'nt':
+            import msvcrt
+            son_tarih = time.monotonic() + zaman_asimi
+            while time.monotonic() < son_tarih:
+                if msvcrt.kbhit():
+                    tuslar = ""
+                    while msvcrt.kbhit():
+                        tuslar += msvcrt.getwch()
+                    return tuslar
+                time.sleep(0.01)
+            return ""
+        
+        import select
+        if not select.select([sys.stdin], [], [], zaman_asimi)[0]:
+            return ""
+        return self._cozucu.decode(os.read(sys.stdin.fileno(), 64))
+    
+    def canli_arama_goster(self, sorgu: str, sonuclar: List[Dict[str, Any]], bekleniyor: bool,
+                           en_fazla: int = 10, isaretler: Optional[List[str]] = None,
+                           onizleme: Optional[str] = None) -> None:
+        """Yazarken arama ekranını sorgu, o anki sonuçlar ve varsa ilk sonucun poster önizlemesiyle yeniden çiz"""
+        self.ekran_temizle()
+        print("\nAnime Ara  (Enter: seç, Esc: geri)\n")
+        print(f"🔍 {sorgu}▏")
+        print(f"   {'⏳ aranıyor...' if bekleniyor else f'{len(sonuclar)} sonuç'}\n")
+        if onizleme:
+            print(onizleme + "\033[0m\n")
+        for i, anime in enumerate(sonuclar[:en_fazla]):
+            print(f"  {isaretler[i] if isaretler else '•'} {anime['baslik']}")
+        if len(sonuclar) > en_fazla:
+            print(f"  … {len(sonuclar) - en_fazla} sonuç daha")
+    
+    def secim_listesi(self, secenekler: List[str], baslik: str, onizleme: Optional[str] = None) -> str:
+        """Seçim listesini (varsa üstünde poster önizlemesiyle) göster ve kullanıcı seçimini al"""
         self.ekran_temizle()
         print(f"\n{baslik}\n")
+        if onizleme:
+            print(onizleme + "\033[0m\n")
         
         for i, secenek in enumerate(secenekler, 1):
             print(f"  {i}. {secenek}")
@@ -411,21 +3562,614 @@ class TUI:
                     print("Geçersiz seçim. Lütfen tekrar deneyin.")
             except ValueError:
                 print("Lütfen geçerli bir sayı girin.")
+    
+    def kayit_sec(self, sayfa_al, etiket, baslik: str, sayfa_boyutu: int = 20) -> Dict[str, Any]:
+        """Kayıtları sayfa sayfa göster ve seçilen kaydın kendisini döndür
+        
+        sayfa_al(arama_metni, limit, baslangic) bir sayfa kayıt, etiket(kayit) listede gösterilecek metni döndürür.
+        """
+        arama = ""
+        sayfa = 0
+        while True:
+            # Sonraki sayfanın olup olmadığını anlamak için bir kayıt fazla istenir
+            kayitlar = sayfa_al(arama, sayfa_boyutu + 1, sayfa * sayfa_boyutu)
+            sonraki_var = len(kayitlar) > sayfa_boyutu
+            kayitlar = kayitlar[:sayfa_boyutu]
+            
+            self.ekran_temizle()
+            print(f"\n{baslik}" + (f" (arama: {arama})" if arama else "") + f" - sayfa {sayfa + 1}\n")
+            for i, kayit in enumerate(kayitlar, 1):
+                print(f"  {i}. {etiket(kayit)}")
+            if not kayitlar:
+                print("  Kayıt bulunamadı")
+            
+            print("\n" + "  ".join(
+                komut for komut, gecerli in (
+                    ("s. Sonraki sayfa", sonraki_var),
+                    ("o. Önceki sayfa", sayfa > 0),
+                    ("a. Ara", True),
+                    ("0. Geri dön", True)
+                ) if gecerli
+            ))
+            
+            while True:
+                secim = input("\nBir seçenek seçin: ").strip().lower()
+                if secim == "0":
+                    raise KeyboardInterrupt("Kullanıcı iptal etti")
+                if secim == "s" and sonraki_var:
+                    sayfa += 1
+                elif secim == "o" and sayfa > 0:
+                    sayfa -= 1
+                elif secim == "a":
+                    arama = input("🔍 Aranacak ad (tümü için boş bırakın): ").strip()
+                    sayfa = 0
+                elif secim.isdigit() and 1 <= int(secim) <= len(kayitlar):
+                    return kayitlar[int(secim) - 1]
+                else:
+                    print("Geçersiz seçim. Lütfen tekrar deneyin.")
+                    continue
+                break
+
+class CanliArama:
+    """Yazarken arama: yerel sonuçlar her tuşta, sunucu araması yazma durunca; eski sorguların yanıtları gösterilmez"""
+    
+    def __init__(self, anime_kaynak: AnimeCix, baslik_dizini: BaslikDizini, is_havuzu: ThreadPoolExecutor,
+                 bekleme: float = 0.3, en_kisa: int = 3, limit: int = 20):
+        self.anime_kaynak = anime_kaynak
+        self.baslik_dizini = baslik_dizini
+        self.is_havuzu = is_havuzu
+        self.bekleme = bekleme
+        self.en_kisa = en_kisa
+        # Sunucu bir aramada en fazla bu kadar sonuç döndürür; daha azı önekin tam sonuç kümesidir
+        self.limit = limit
+        self.sorgu = ""
+        self._degisim = 0.0
+        self._kilit = threading.Lock()
+        # Katlanmış sorgu -> sunucu sonuçları; daha uzun sorgular tam sonuçlu öneklerinden süzülür
+        self._sunucu_sonuclari: Dict[str, List[Dict[str, Any]]] = {}
+        self._yoldakiler: Dict[str, Future] = {}
+        # Hata veren sorgular yazarken tekrar denenmez, Enter'da denenir
+        self._hatalilar: set = set()
+        self.sayaclar = {"istek": 0, "onekten": 0, "yok_sayilan": 0}
+    
+    def guncelle(self, sorgu: str) -> None:
+        """Sorguyu değiştir; sunucu araması bekleme süresi kadar ertelenir"""
+        self.sorgu = sorgu
+        self._degisim = time.monotonic()
+        # Henüz başlamamış eski istekler iptal edilir
+        katlanmis = baslik_katla(sorgu)
+        with self._kilit:
+            for anahtar, gelecek in list(self._yoldakiler.items()):
+                if anahtar != katlanmis and gelecek.cancel():
+                    del self._yoldakiler[anahtar]
+    
+    def _sunucu_sonucu(self, katlanmis: str) -> Optional[List[Dict[str, Any]]]:
+        """Sorgunun sunucu sonuçlarını önbellekten ya da tam sonuç dönmüş bir önekten süzerek üret (yoksa None)"""
+        if katlanmis in self._sunucu_sonuclari:
+            return self._sunucu_sonuclari[katlanmis]
+        for uzunluk in range(len(katlanmis) - 1, self.en_kisa - 1, -1):
+            onek_sonuclari = self._sunucu_sonuclari.get(katlanmis[:uzunluk])
+            if onek_sonuclari is not None and len(onek_sonuclari) < self.limit:
+                kelimeler = katlanmis.split()
+                return [anime for anime in onek_sonuclari
+                        if all(kelime in baslik_katla(anime["baslik"]) for kelime in kelimeler)]
+        return None
+    
+    def sonuclar(self) -> tuple:
+        """(gösterilecek sonuçlar, sunucu yanıtı bekleniyor mu); yerel dizin sonuçları önce gelir"""
+        katlanmis = baslik_katla(self.sorgu)
+        if not katlanmis:
+            return [], False
+        try:
+            sonuclar = self.baslik_dizini.ara(self.sorgu)
+        except Exception:
+            sonuclar = []
+        with self._kilit:
+            sunucu = self._sunucu_sonucu(katlanmis)
+        
+        gorulen = {anime["id"] for anime in sonuclar}
+        sonuclar += [anime for anime in sunucu or [] if anime["id"] not in gorulen]
+        return sonuclar, sunucu is None and len(katlanmis) >= self.en_kisa and katlanmis not in self._hatalilar
+    
+    def _baslat(self, katlanmis: str) -> Future:
+        """Sorgu için sunucu aramasını başlat (kilit tutulurken çağrılır)"""
+        gelecek = self._yoldakiler.get(katlanmis)
+        if gelecek is None:
+            self.sayaclar["istek"] += 1
+            gelecek = self.is_havuzu.submit(self.anime_kaynak.arama_verisi_al, self.sorgu)
+            self._yoldakiler[katlanmis] = gelecek
+        return gelecek
+    
+    def tik(self) -> bool:
+        """Biten istekleri topla, yazma durduysa aramayı başlat; o anki sorgu için yeni yanıt geldiyse True"""
+        katlanmis = baslik_katla(self.sorgu)
+        yeni = False
+        with self._kilit:
+            for anahtar, gelecek in list(self._yoldakiler.items()):
+                if not gelecek.done():
+                    continue
+                del self._yoldakiler[anahtar]
+                if gelecek.cancelled():
+                    continue
+                if gelecek.exception() is not None:
+                    self._hatalilar.add(anahtar)
+                    continue
+                # Eski sorgunun yanıtı gösterilmez ama sonraki sorgular için önek olarak saklanır
+                self._sunucu_sonuclari[anahtar] = gelecek.result()
+                if anahtar == katlanmis:
+                    yeni = True
+                else:
+                    self.sayaclar["yok_sayilan"] += 1
+            
+            # Yoldaki bir önek isteği bu sorguyu da yanıtlayabilir; önce onun sonucu beklenir
+            onek_yolda = any(katlanmis.startswith(anahtar) for anahtar in self._yoldakiler)
+            if (len(katlanmis) >= self.en_kisa and time.monotonic() - self._degisim >= self.bekleme
+                    and not onek_yolda and katlanmis not in self._hatalilar
+                    and self._sunucu_sonucu(katlanmis) is None):
+                self._baslat(katlanmis)
+        return yeni
+    
+    def bitir(self, zaman_asimi: float) -> List[Dict[str, Any]]:
+        """Enter'a basıldı: gerekirse beklemeden sunucuda ara ve son sonuçları döndür"""
+        katlanmis = baslik_katla(self.sorgu)
+        with self._kilit:
+            if self._sunucu_sonucu(katlanmis) is None:
+                self._hatalilar.discard(katlanmis)
+                gelecek = self._baslat(katlanmis)
+            else:
+                gelecek = None
+                if katlanmis not in self._sunucu_sonuclari:
+                    self.sayaclar["onekten"] += 1
+        
+        if gelecek is not None:
+            try:
+                sonuc = gelecek.result(timeout=zaman_asimi)
+            except concurrent.futures.TimeoutError:
+                raise Exception("Arama zamanında yanıtlanmadı")
+            finally:
+                with self._kilit:
+                    self._yoldakiler.pop(katlanmis, None)
+            with self._kilit:
+                self._sunucu_sonuclari[katlanmis] = sonuc
+        return self.sonuclar()[0]
+
+def yaris_ozeti(yaris: Dict[str, Any]) -> str:
+    """AnimeCix.istatistikler() çıktısını tek satırlık özet olarak biçimlendir"""
+    ozet = f"yedek istekler: {yaris['yedek_istek']} gönderildi, {yaris['yedek_kazandi']} kazandı, {yaris['butce_asimi']} bütçe aşımı"
+    if yaris["p95"]:
+        ozet += "; p95 " + ", ".join(f"{host} {sure * 1000:.0f} ms" for host, sure in yaris["p95"].items())
+    return ozet
+
+def devre_kesici_ozeti(yaris: Dict[str, Any]) -> List[str]:
+    """Devresi açılmış hostları ve negatif önbelleği gösterim satırlarına çevir; sorunsuz oturumda boş liste"""
+    adlar = {DevreKesici.KAPALI: "kapalı", DevreKesici.ACIK: "açık", DevreKesici.YARI_ACIK: "yarı açık"}
+    satirlar = []
+    for host, durum in yaris["devre_kesici"].items():
+        if durum["durum"] == DevreKesici.KAPALI and not durum["acilma"]:
+            continue
+        satir = f"devre kesici {host}: {adlar[durum['durum']]}, {durum['acilma']} kez açıldı, {durum['reddedilen']} istek reddedildi"
+        if durum["durum"] == DevreKesici.ACIK:
+            satir += f", {durum['kalan']:.0f} sn sonra denenecek"
+        satirlar.append(satir)
+    negatif = yaris["negatif_onbellek"]
+    if negatif["kayit"] or negatif["isabet"]:
+        satirlar.append(f"bozuk adresler: {negatif['kayit']} kayıt, {negatif['isabet']} tekrar deneme engellendi")
+    return satirlar
+
+def anime_kaynagi_olustur(config: Config, onbellek_devre_disi: bool = False,
+                          host_basina_eszamanli: Optional[int] = None,
+                          baslik_dizini: Optional[BaslikDizini] = None,
+                          asenkron: bool = False,
+                          servis: Optional["ServisIstemcisi"] = None) -> Any:
+    """Yapılandırmaya göre önbellekli AnimeCix (asenkron ise çekirdeğin kendisi olan AsenkronAnimeCix, servis varsa
+    UzakAnimeCix) kaynağını oluştur"""
+    onbellek = None
+    if not (onbellek_devre_disi or config.config.get("onbellek_devre_disi", False)):
+        onbellek = YanitOnbellegi(
+            boyut_siniri=int(config.config.get("onbellek_boyut_mb", 50) * 1024 * 1024)
+        )
+    ayarlar = dict(
+        baglanti_zaman_asimi=config.config.get("baglanti_zaman_asimi", 5),
+        okuma_zaman_asimi=config.config.get("okuma_zaman_asimi", 20),
+        yeniden_deneme=config.config.get("yeniden_deneme_sayisi", 2),
+        host_basina_eszamanli=host_basina_eszamanli or config.config.get("host_basina_eszamanli_istek", 4),
+        onbellek=onbellek,
+        baslik_dizini=baslik_dizini,
+        negatif_onbellek=NegatifOnbellek(omur=config.config.get("negatif_onbellek_omru", 120)),
+        devre_kesici=DevreKesici(
+            hata_esigi=config.config.get("devre_kesici_esigi", 3),
+            bekleme=config.config.get("devre_kesici_bekleme", 30)
+        ),
+        bekleme_zaman_asimi=config.config.get("cozumleme_zaman_asimi", 30),
+        arama_butcesi=config.config.get("arama_zaman_asimi", 10),
+        baslik_butcesi=config.config.get("baslik_zaman_asimi", 10),
+        bolum_listesi_butcesi=config.config.get("bolum_listesi_zaman_asimi", 20),
+        oynatma_butcesi=config.config.get("cozumleme_zaman_asimi", 30),
+        yedek_istek=config.config.get("yedek_istek", True)
+    )
+    if servis:
+        return UzakAnimeCix(servis, **ayarlar)
+    return AsenkronAnimeCix(**ayarlar) if asenkron else AnimeCix(**ayarlar)
+
+class ServisIstemcisi:
+    """Çalışan anitr-py servisine Unix soketi üzerinden satır başına bir JSON ile işlem çağıran istemci"""
+    
+    # Servise ulaşılamadıktan bu kadar saniye sonra bir sonraki çağrı servisi yeniden dener
+    YENIDEN_SINAMA = 30.0
+    
+    def __init__(self, soket_yolu: Path = SERVICE_SOCKET, zaman_asimi: float = 120.0):
+        self.soket_yolu = soket_yolu
+        self.zaman_asimi = zaman_asimi
+        # Servise ulaşılamadığında vekil sınıflar YENIDEN_SINAMA süresince süreç içi uygulamaya döner
+        self.kullanilabilir = True
+        self._sinama_zamani = 0.0
+        self._bosta: List[tuple] = []
+        self._kilit = threading.Lock()
+        self.logger = Logger()
+    
+    @classmethod
+    def baglan(cls, soket_yolu: Path = SERVICE_SOCKET) -> Optional["ServisIstemcisi"]:
+        """Servis çalışıyorsa bağlı bir istemci, çalışmıyorsa None döndür"""
+        if not hasattr(socket, "AF_UNIX") or not soket_yolu.exists():
+            return None
+        istemci = cls(soket_yolu)
+        try:
+            istemci._bosta.append(istemci._yeni_baglanti())
+        except OSError:
+            return None
+        return istemci
+    
+    def _yeni_baglanti(self) -> tuple:
+        soket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            soket.settimeout(self.zaman_asimi)
+            soket.connect(str(self.soket_yolu))
+        except OSError:
+            soket.close()
+            raise
+        return soket, soket.makefile("rb")
+    
+    def _gonder(self, baglanti: tuple, istek: bytes) -> bytes:
+        soket, okuyucu = baglanti
+        soket.sendall(istek)
+        satir = okuyucu.readline()
+        if not satir:
+            raise ConnectionResetError("Servis bağlantıyı kapattı")
+        return satir
+    
+    def cagir(self, nesne: str, islem: str, *argumanlar, yerel: Optional[Any] = None) -> Any:
+        """Servisteki nesne.islem(*argumanlar) sonucunu döndür; servise ulaşılamazsa yerel(*argumanlar)'a dön"""
+        if not self.kullanilabilir and yerel is not None and time.monotonic() < self._sinama_zamani:
+            return yerel(*argumanlar)
+        
+        istek = json.dumps({"nesne": nesne, "islem": islem, "argumanlar": list(argumanlar)}).encode("utf-8") + b"\n"
+        with self._kilit:
+            baglanti = self._bosta.pop() if self._bosta else None
+        try:
+            try:
+                if baglanti is None:
+                    baglanti = self._yeni_baglanti()
+                satir = self._gonder(baglanti, istek)
+            except socket.timeout:
+                raise
+            except OSError:
+                # Servis yeniden başlatıldıysa boştaki bağlantılar da kopmuştur; bir kez yeni bağlantıyla denenir
+                if baglanti is not None:
+                    self._baglantiyi_kapat(baglanti)
+                baglanti = None
+                self.kapat()
+                baglanti = self._yeni_baglanti()
+                satir = self._gonder(baglanti, istek)
+        except socket.timeout as e:
+            # Servis çalışıyor ama yanıtı gecikti; çağrı yerelde tekrarlanmaz, servis devre dışı sayılmaz.
+            # Zaman aşımından sonra okuyucu tutarsız kalır; bağlantı havuza dönmez
+            if baglanti is not None:
+                self._baglantiyi_kapat(baglanti)
+            raise Exception(f"Servis yanıt vermedi: {str(e)}")
+        except OSError as e:
+            if baglanti is not None:
+                self._baglantiyi_kapat(baglanti)
+            if yerel is None:
+                raise ConnectionError(f"Servise ulaşılamadı: {str(e)}")
+            if self.kullanilabilir:
+                self.logger.hata_kaydet(Exception(f"Servise ulaşılamadı, süreç içi kipe geçiliyor: {str(e)}"))
+            self.kullanilabilir = False
+            self._sinama_zamani = time.monotonic() + self.YENIDEN_SINAMA
+            return yerel(*argumanlar)
+        
+        if not self.kullanilabilir:
+            self.kullanilabilir = True
+            self.logger.mesaj_kaydet("Servise yeniden bağlanıldı")
+        with self._kilit:
+            self._bosta.append(baglanti)
+        
+        yanit = json.loads(satir)
+        if "hata" in yanit:
+            raise Exception(yanit["hata"])
+        return yanit.get("sonuc")
+    
+    @staticmethod
+    def _baglantiyi_kapat(baglanti: tuple) -> None:
+        soket, okuyucu = baglanti
+        okuyucu.close()
+        soket.close()
+    
+    def kapat(self) -> None:
+        """Boştaki bağlantıları kapat"""
+        with self._kilit:
+            bosta, self._bosta = self._bosta, []
+        for baglanti in bosta:
+            self._baglantiyi_kapat(baglanti)
+
+class UzakAnimeCix(AnimeCix):
+    """Çözümleme çağrılarını servisin ısınmış AnimeCix'ine ileten AnimeCix; video baytları için yerel istemci kullanılır"""
+    
+    def __init__(self, servis: ServisIstemcisi, **kwargs):
+        super().__init__(**kwargs)
+        self.servis = servis
+    
+    def arama_verisi_al(self, sorgu: str) -> List[Dict[str, Any]]:
+        return self.servis.cagir("kaynak", "arama_verisi_al", sorgu, yerel=super().arama_verisi_al)
+    
+    def id_ile_anime_al(self, anime_id: str) -> Dict[str, Any]:
+        return self.servis.cagir("kaynak", "id_ile_anime_al", anime_id, yerel=super().id_ile_anime_al)
+    
+    def bolumler_verisini_al(self, sezon_id: int) -> List[Dict[str, Any]]:
+        return self.servis.cagir("kaynak", "bolumler_verisini_al", sezon_id, yerel=super().bolumler_verisini_al)
+    
+    def izleme_verisini_al(self, bolum_url: str) -> List[Dict[str, str]]:
+        return self.servis.cagir("kaynak", "izleme_verisini_al", bolum_url, yerel=super().izleme_verisini_al)
+    
+    def tr_altyazi_al(self, sezon_indeks: int, bolum_indeks: int, anime_id: int, bolum_url: Optional[str] = None) -> str:
+        return self.servis.cagir(
+            "kaynak", "tr_altyazi_al", sezon_indeks, bolum_indeks, anime_id, bolum_url,
+            yerel=super().tr_altyazi_al
+        )
+
+class UzakGecmisYonetici(GecmisYonetici):
+    """Geçmiş okuma ve yazmalarını servise ileten GecmisYonetici"""
+    
+    def __init__(self, servis: ServisIstemcisi, **kwargs):
+        super().__init__(**kwargs)
+        self.servis = servis
+    
+    def son_izlenenler(self, kaynak: str, limit: int, baslangic: int = 0) -> List[Dict[str, Any]]:
+        return self.servis.cagir("gecmis", "son_izlenenler", kaynak, limit, baslangic, yerel=super().son_izlenenler)
+    
+    def ara(self, kaynak: str, metin: str, limit: int, baslangic: int = 0) -> List[Dict[str, Any]]:
+        return self.servis.cagir("gecmis", "ara", kaynak, metin, limit, baslangic, yerel=super().ara)
+    
+    def anime_id_ile(self, kaynak: str, anime_id: str) -> Optional[Dict[str, Any]]:
+        return self.servis.cagir("gecmis", "anime_id_ile", kaynak, anime_id, yerel=super().anime_id_ile)
+    
+    def gecmis_guncelle(self, kaynak: str, anime_adi: str, bolum_adi: str, anime_id: str, bolum_indeks: int) -> None:
+        try:
+            self.servis.cagir(
+                "gecmis", "gecmis_guncelle", kaynak, anime_adi, bolum_adi, anime_id, bolum_indeks,
+                yerel=super().gecmis_guncelle
+            )
+        except Exception as e:
+            print(f"Geçmiş güncellenemedi: {e}")
+
+class UzakBaslikDizini(BaslikDizini):
+    """Aramaları servisin bellekte hazır tuttuğu başlık dizinine ileten BaslikDizini"""
+    
+    def __init__(self, servis: ServisIstemcisi, **kwargs):
+        super().__init__(**kwargs)
+        self.servis = servis
+    
+    def yukle(self) -> None:
+        # Servisin dizini zaten yüklüdür; yerel dizin yalnızca servise ulaşılamazsa kurulur
+        if not self.servis.kullanilabilir:
+            super().yukle()
+    
+    def ekle(self, animeler: List[Dict[str, Any]]) -> None:
+        self.servis.cagir("dizin", "ekle", animeler, yerel=super().ekle)
+    
+    def ara(self, sorgu: str, limit: int = 20) -> List[Dict[str, Any]]:
+        return self.servis.cagir("dizin", "ara", sorgu, limit, yerel=super().ara)
+
+class Servis:
+    """AnimeCix'i, bağlantı havuzlarını, yanıt önbelleğini, geçmişi ve başlık dizinini ısınmış halde tutan yerel servis"""
+    
+    # Soket üzerinden çağrılabilen metotlar; başka hiçbir öznitelik dışarı açılmaz
+    ISLEMLER = {
+        "kaynak": {"arama_verisi_al", "id_ile_anime_al", "bolumler_verisini_al", "izleme_verisini_al", "tr_altyazi_al"},
+        "gecmis": {"son_izlenenler", "ara", "anime_id_ile", "gecmis_guncelle"},
+        "dizin": {"ara", "ekle"}
+    }
+    
+    def __init__(self, soket_yolu: Path = SERVICE_SOCKET, onbellek_devre_disi: bool = False):
+        self.soket_yolu = soket_yolu
+        self.config = Config()
+        self.gecmis = GecmisYonetici()
+        self.baslik_dizini = BaslikDizini(gecmis=self.gecmis)
+        self.anime_kaynak = anime_kaynagi_olustur(self.config, onbellek_devre_disi, baslik_dizini=self.baslik_dizini)
+        self.nesneler = {"kaynak": self.anime_kaynak, "gecmis": self.gecmis, "dizin": self.baslik_dizini}
+        self.sayaclar = {"baglanti": 0, "istek": 0, "hata": 0}
+        self.baslangic = time.time()
+        self._kilit = threading.Lock()
+        self._sunucu = None
+    
+    def yanitla(self, istek: Dict[str, Any]) -> Dict[str, Any]:
+        """Tek bir isteği çalıştırıp {"sonuc": ...} ya da {"hata": ...} döndür"""
+        nesne, islem = istek.get("nesne"), istek.get("islem")
+        with self._kilit:
+            self.sayaclar["istek"] += 1
+        
+        if nesne == "servis" and islem == "durum":
+            return {"sonuc": self.durum()}
+        if nesne == "servis" and islem == "durdur":
+            # shutdown serve_forever'ı bekler; istek iş parçacığını kilitlememesi için ayrı çalışır
+            threading.Thread(target=self._sunucu.shutdown, daemon=True).start()
+            return {"sonuc": True}
+        if islem not in self.ISLEMLER.get(nesne, ()):
+            return {"hata": f"Bilinmeyen işlem: {nesne}.{islem}"}
+        
+        try:
+            return {"sonuc": getattr(self.nesneler[nesne], islem)(*istek.get("argumanlar", []))}
+        except Exception as e:
+            with self._kilit:
+                self.sayaclar["hata"] += 1
+            return {"hata": str(e)}
+    
+    def durum(self) -> Dict[str, Any]:
+        """Servisin çalışma süresini, sayaçlarını ve havuz/önbellek istatistiklerini döndür"""
+        with self._kilit:
+            sayaclar = dict(self.sayaclar)
+        return {
+            "pid": os.getpid(),
+            "calisma_suresi": time.time() - self.baslangic,
+            **sayaclar,
+            "http": self.anime_kaynak.http_istatistikleri(),
+            "onbellek": self.anime_kaynak.onbellek.istatistikler() if self.anime_kaynak.onbellek else None,
+            "tek_ucus": self.anime_kaynak.tek_ucus.istatistikler(),
+            "yaris": self.anime_kaynak.istatistikler()
+        }
+    
+    def calistir(self) -> int:
+        """Soketi açıp servis durdurulana kadar istekleri yanıtla"""
+        import signal
+        import socketserver
+        
+        if not hasattr(socket, "AF_UNIX"):
+            print("❌ Bu platform Unix soketlerini desteklemiyor; servis kipi kullanılamaz")
+            return 1
+        if ServisIstemcisi.baglan(self.soket_yolu):
+            print(f"❌ Servis zaten çalışıyor: {self.soket_yolu}")
+            return 1
+        
+        servis = self
+        
+        class ServisIsleyici(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                with servis._kilit:
+                    servis.sayaclar["baglanti"] += 1
+                for satir in self.rfile:
+                    try:
+                        yanit = servis.yanitla(json.loads(satir))
+                    except ValueError:
+                        yanit = {"hata": "Geçersiz istek"}
+                    self.wfile.write(json.dumps(yanit, ensure_ascii=False).encode("utf-8") + b"\n")
+        
+        class ServisSunucusu(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+        
+        yapilandirma_dizini_olustur()
+        # Bağlanamadığımız eski soket dosyası önceki servisten kalmıştır
+        with contextlib.suppress(FileNotFoundError):
+            self.soket_yolu.unlink()
+        # Soket yalnızca kullanıcının kendisine açık olsun
+        eski_umask = os.umask(0o077)
+        try:
+            self._sunucu = ServisSunucusu(str(self.soket_yolu), ServisIsleyici)
+        finally:
+            os.umask(eski_umask)
+        
+        signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=self._sunucu.shutdown, daemon=True).start())
+        # Başlık dizini ilk istemciden önce belleğe alınır
+        threading.Thread(target=self.baslik_dizini.yukle, daemon=True).start()
+        print(f"🛰️ anitr-py servisi çalışıyor: {self.soket_yolu} (pid {os.getpid()})")
+        try:
+            self._sunucu.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._sunucu.server_close()
+            with contextlib.suppress(FileNotFoundError):
+                self.soket_yolu.unlink()
+            self.anime_kaynak.kapat()
+            self.baslik_dizini.kapat()
+            self.gecmis.kapat()
+        print("🛰️ anitr-py servisi durdu")
+        return 0
 
 class AnimeCLI:
     """Ana CLI uygulaması"""
     
-    def __init__(self, rpc_devre_disi: bool = False):
+    # Yerel dizinden gelen sonuç listesinin sonunda sunucuda yeniden aramayı seçtiren girdi
+    SUNUCUDA_ARA = "🔄 Sunucuda ara"
+    
+    def __init__(self, rpc_devre_disi: bool = False, onbellek_devre_disi: bool = False,
+                 on_yukleme: bool = False, art_arda: bool = False, akis_vekili: bool = False,
+                 servis_kullan: bool = True):
         self.config = Config()
+        baslangic_olcumu("Config")
         self.logger = Logger()
-        self.gecmis = GecmisYonetici()
-        self.anime_kaynak = AnimeCix()
+        # Servis çalışıyorsa çözümleme, geçmiş ve başlık dizini onun ısınmış örneklerine iletilir
+        self.servis = None
+        if servis_kullan and self.config.config.get("servis_kullan", True):
+            self.servis = ServisIstemcisi.baglan()
+            baslangic_olcumu("servis bağlantısı")
+        if self.servis:
+            self.gecmis = UzakGecmisYonetici(self.servis)
+            self.baslik_dizini = UzakBaslikDizini(self.servis, gecmis=self.gecmis)
+        else:
+            self.gecmis = GecmisYonetici()
+            self.baslik_dizini = BaslikDizini(gecmis=self.gecmis)
+        baslangic_olcumu("GecmisYonetici")
+        self.anime_kaynak = anime_kaynagi_olustur(
+            self.config,
+            onbellek_devre_disi,
+            baslik_dizini=self.baslik_dizini,
+            servis=self.servis
+        )
+        self.onbellek = self.anime_kaynak.onbellek
+        baslangic_olcumu("AnimeCix")
         self.oynatici = MPVOynatici()
+        if akis_vekili or self.config.config.get("akis_vekili", False):
+            baglanti = self.config.config.get("akis_vekili_baglanti", 4)
+            self.oynatici.vekil = AkisVekili(
+                HttpIstemcisi(
+                    baglanti_zaman_asimi=self.config.config.get("baglanti_zaman_asimi", 5),
+                    okuma_zaman_asimi=self.config.config.get("okuma_zaman_asimi", 20),
+                    yeniden_deneme=self.config.config.get("yeniden_deneme_sayisi", 2),
+                    host_basina_baglanti=baglanti
+                ),
+                bellek_siniri=int(self.config.config.get("akis_vekili_bellek_mb", 64) * 1024 * 1024),
+                onde_parca=self.config.config.get("akis_vekili_onde_parca", 4),
+                baglanti=baglanti
+            )
         self.tui = TUI()
+        self.is_havuzu = ThreadPoolExecutor(max_workers=4, thread_name_prefix="anitr-py")
+        self.on_yukleyici = None
+        if on_yukleme or self.config.config.get("on_yukleme", False):
+            self.on_yukleyici = OnYukleyici(
+                self.anime_kaynak,
+                self.is_havuzu,
+                self._kalite_sec,
+                gecerlilik_suresi=self.config.config.get("on_yukleme_gecerlilik", 300),
+                isitma_bayt=int(self.config.config.get("on_yukleme_isitma_kb", 0) * 1024)
+            )
+        self.kaynak_secici = None
+        if self.config.config.get("uyarlanabilir_kalite", True):
+            self.kaynak_secici = KaynakSecici(
+                self.anime_kaynak.istemci,
+                ornek_bayt=int(self.config.config.get("kalite_olcum_kb", 512) * 1024),
+                yari_omur=self.config.config.get("kalite_olcum_omru", 3600),
+                devre_kesici=self.anime_kaynak.devre_kesici
+            )
+        self.posterler = None
+        if self.config.config.get("poster_onizleme", True):
+            self.posterler = PosterOnbellegi(
+                self.anime_kaynak.istemci,
+                boyut_siniri=int(self.config.config.get("poster_onbellek_mb", 20) * 1024 * 1024),
+                taban_url=self.anime_kaynak.base_url
+            )
+        self.canli_arama = CanliArama(
+            self.anime_kaynak,
+            self.baslik_dizini,
+            self.is_havuzu,
+            bekleme=self.config.config.get("canli_arama_bekleme_ms", 300) / 1000
+        )
         self.rpc_devre_disi = rpc_devre_disi or self.config.config.get("rpc_devre_disi", False)
+        self.art_arda = art_arda or self.config.config.get("art_arda_izleme", False)
+        baslangic_olcumu("diğer bileşenler")
     
     def calistir(self) -> None:
         """Ana uygulama döngüsünü çalıştır"""
+        # Kullanıcı ilk sorguyu yazarken başlık dizini arka planda yüklenir
+        self.is_havuzu.submit(self.baslik_dizini.yukle)
         while True:
             try:
                 self.ana_menu()
@@ -453,26 +4197,55 @@ class AnimeCLI:
     def ara_ve_oynat(self) -> None:
         """Anime ara ve seçilen bölümü oynat"""
         try:
-            # Arama sorgusu al
-            sorgu = self.tui.kullanici_girdisi_al("Anime adı girin")
-            if not sorgu:
-                return
-            
-            # Yükleniyor göster
-            self.tui.yukleniyor_goster("Aranıyor...")
-            
-            # Anime ara
-            arama_sonuclari = self.anime_kaynak.arama_verisi_al(sorgu)
-            self.tui.yukleniyor_gizle()
-            
-            if not arama_sonuclari:
-                self.tui.hata_goster("Sonuç bulunamadı")
-                input("Devam etmek için Enter'a basın...")
-                return
+            yerel_sonuclar: List[Dict[str, Any]] = []
+            arama_sonuclari = None
+            if self.config.config.get("canli_arama", True) and self.tui.canli_girdi_destekleniyor():
+                # Sonuçlar yazarken güncellenir; Enter'a basıldığında sunucu yanıtı da alınmıştır
+                sorgu, arama_sonuclari = self._canli_ara()
+                if not sorgu:
+                    return
+            else:
+                # Arama sorgusu al
+                sorgu = self.tui.kullanici_girdisi_al("Anime adı girin")
+                if not sorgu:
+                    return
+                
+                # Önce yerel başlık dizinine bak; orada yoksa ya da kullanıcı isterse sunucuda ara
+                try:
+                    yerel_sonuclar = self.baslik_dizini.ara(sorgu)
+                except Exception as e:
+                    self.logger.hata_kaydet(e)
             
-            # Anime seç
-            anime_basliklari = [anime["baslik"] for anime in arama_sonuclari]
-            secilen_baslik = self.tui.secim_listesi(anime_basliklari, "Anime Seçin")
+            while True:
+                if yerel_sonuclar:
+                    arama_sonuclari = yerel_sonuclar
+                elif arama_sonuclari is None:
+                    # Yükleniyor göster
+                    self.tui.yukleniyor_goster("Aranıyor...")
+                    
+                    # Anime ara
+                    arama_sonuclari = self.anime_kaynak.arama_verisi_al(sorgu)
+                    self.tui.yukleniyor_gizle()
+                
+                if not arama_sonuclari:
+                    self.tui.hata_goster("Sonuç bulunamadı")
+                    input("Devam etmek için Enter'a basın...")
+                    return
+                
+                # Anime seç
+                anime_basliklari = [anime["baslik"] for anime in arama_sonuclari]
+                if yerel_sonuclar:
+                    anime_basliklari.append(self.SUNUCUDA_ARA)
+                onizleme = None
+                if self.posterler:
+                    # Liste beklemeden çizilir; ilk sonucun önizlemesi yalnızca önbellekte ya da hazırsa gösterilir
+                    self.posterler.on_yukle([anime["gorsel_url"] for anime in arama_sonuclari[:10]])
+                    onizleme = self.posterler.onizleme(arama_sonuclari[0]["gorsel_url"])
+                secilen_baslik = self.tui.secim_listesi(anime_basliklari, "Anime Seçin", onizleme=onizleme)
+                if secilen_baslik != self.SUNUCUDA_ARA:
+                    break
+                yerel_sonuclar = []
+                arama_sonuclari = None
             
             # Seçilen animeyi bul
             secilen_anime = None
@@ -513,13 +4286,8 @@ class AnimeCLI:
             if not secilen_bolum:
                 return
             
-            # Bölümü oynat
-            self.bolum_oynat(
-                anime_detaylari,
-                secilen_bolum,
-                secilen_bolum_indeks,
-                len(bolumler)
-            )
+            # Bölümü (ve istenirse sonrakileri) oynat
+            self.bolumleri_oynat(anime_detaylari, bolumler, secilen_bolum_indeks)
             
         except KeyboardInterrupt:
             return
@@ -528,14 +4296,218 @@ class AnimeCLI:
             self.tui.hata_goster(str(e))
             input("Devam etmek için Enter'a basın...")
     
-    def bolum_oynat(self, anime: Dict[str, Any], bolum: Dict[str, Any], bolum_indeks: int, toplam_bolumler: int) -> None:
+    def _canli_ara(self) -> tuple:
+        """Yazarken sonuçları güncelleyen arama istemi; (sorgu, sonuçlar) döndürür, Esc ile boş sorgu"""
+        sorgu = ""
+        poster_surumu = -1
+        self.canli_arama.guncelle(sorgu)
+        with self.tui.ham_girdi():
+            ciz = True
+            while True:
+                if ciz:
+                    sonuclar, bekleniyor = self.canli_arama.sonuclar()
+                    isaretler = onizleme = None
+                    if self.posterler:
+                        # Liste posterleri beklemeden çizilir; posterler geldikçe işaretler ve önizleme dolar
+                        gosterilen = sonuclar[:10]
+                        poster_surumu = self.posterler.surum
+                        self.posterler.on_yukle([anime["gorsel_url"] for anime in gosterilen])
+                        isaretler = [
+                            "▣" if self.posterler.yol(anime["gorsel_url"]) else "□" if anime["gorsel_url"] else "•"
+                            for anime in gosterilen
+                        ]
+                        onizleme = self.posterler.onizleme(gosterilen[0]["gorsel_url"]) if gosterilen else None
+                    self.tui.canli_arama_goster(sorgu, sonuclar, bekleniyor, isaretler=isaretler, onizleme=onizleme)
+                    ciz = False
+                
+                tuslar = self.tui.tus_oku(0.05)
+                if tuslar.startswith("\x1b") and len(tuslar) > 1:
+                    # Ok tuşları gibi kaçış dizileri yok sayılır
+                    tuslar = ""
+                for tus in tuslar:
+                    if tus in ("\r", "\n"):
+                        if sorgu.strip():
+                            self.tui.canli_arama_goster(sorgu, self.canli_arama.sonuclar()[0], True)
+                            return sorgu.strip(), self.canli_arama.bitir(self.config.config.get("cozumleme_zaman_asimi", 30))
+                    elif tus == "\x1b":
+                        return "", []
+                    elif tus in ("\x7f", "\b"):
+                        sorgu = sorgu[:-1]
+                    elif tus == "\x15":
+                        # Ctrl+U satırı temizler
+                        sorgu = ""
+                    elif tus.isprintable():
+                        sorgu += tus
+                    else:
+                        continue
+                    self.canli_arama.guncelle(sorgu)
+                    ciz = True
+                
+                if self.canli_arama.tik():
+                    ciz = True
+                if self.posterler and self.posterler.surum != poster_surumu:
+                    ciz = True
+    
+    def bolumleri_oynat(self, anime: Dict[str, Any], bolumler: List[Dict[str, Any]], bolum_indeks: int) -> None:
+        """Bölümü oynat, bitince sıradaki bölüme geçmeyi teklif et"""
+        if self.art_arda:
+            self.bolumleri_art_arda_oynat(anime, bolumler, bolum_indeks)
+            return
+        
+        while True:
+            self.bolum_oynat(anime, bolumler[bolum_indeks], bolum_indeks, len(bolumler), bolumler)
+            
+            if bolum_indeks + 1 >= len(bolumler):
+                return
+            
+            secim = self.tui.secim_listesi(
+                [f"Sonraki Bölüm: {bolumler[bolum_indeks + 1]['baslik']}", "Ana Menü"],
+                f"{anime['baslik']} - {bolumler[bolum_indeks]['baslik']} bitti"
+            )
+            if secim == "Ana Menü":
+                return
+            bolum_indeks += 1
+    
+    def bolumleri_art_arda_oynat(self, anime: Dict[str, Any], bolumler: List[Dict[str, Any]], bolum_indeks: int) -> None:
+        """Tek bir MPV süreciyle bölümleri art arda oynat; çözümleyici birkaç bölüm önde gider"""
+        try:
+            self.tui.yukleniyor_goster("Oynatılmaya hazırlanıyor...")
+            
+            onde = max(1, self.config.config.get("art_arda_onde", 2))
+            zaman_asimi = self.config.config.get("cozumleme_zaman_asimi", 30)
+            cozumleyici = self.on_yukleyici or OnYukleyici(
+                self.anime_kaynak,
+                self.is_havuzu,
+                self._kalite_sec,
+                gecerlilik_suresi=self.config.config.get("on_yukleme_gecerlilik", 300)
+            )
+            
+            # Oynatma listesindeki konum -> bölüm indeksi ve seçilen kaynak (çözülemeyen bölümler listeye girmez)
+            liste_indeksleri: List[int] = []
+            liste_kaynaklari: List[Dict[str, str]] = []
+            siradaki = bolum_indeks
+            
+            def listeyi_doldur(hedef: int) -> None:
+                nonlocal siradaki
+                hedef = min(hedef, len(bolumler) - 1)
+                for i in range(siradaki, hedef + 1):
+                    cozumleyici.baslat(anime, bolumler[i], i)
+                
+                while siradaki <= hedef:
+                    bolum = bolumler[siradaki]
+                    try:
+                        sonuc = cozumleyici.bekle(anime, bolum, siradaki, zaman_asimi)
+                        if not sonuc["izleme_verisi"]:
+                            raise Exception("Video kaynağı bulunamadı")
+                        secilen_kalite = self._kalite_sec(sonuc["izleme_verisi"])
+                        self.oynatici.listeye_ekle(
+                            secilen_kalite["url"],
+                            sonuc["altyazi_url"],
+                            f"{anime['baslik']} - {bolum['baslik']}"
+                        )
+                        liste_indeksleri.append(siradaki)
+                        liste_kaynaklari.append(secilen_kalite)
+                    except Exception as e:
+                        self.logger.hata_kaydet(Exception(f"{bolum['baslik']} atlandı: {str(e)}"))
+                    siradaki += 1
+            
+            olaylar: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+            telemetri_acik = self.config.config.get("telemetri", True)
+            telemetri: Optional[OynatmaTelemetrisi] = None
+            process = self.oynatici.oturum_baslat()
+            try:
+                self.oynatici.olay_dinleyicisi_ekle(
+                    lambda mesaj: olaylar.put(mesaj)
+                    if mesaj.get("event") == "property-change" and mesaj.get("name") == "playlist-pos"
+                    else None
+                )
+                self.oynatici.ipc.komut("observe_property", 1, "playlist-pos")
+                if telemetri_acik:
+                    # Olaylar o an oynatılan bölümün telemetrisine yönlendirilir
+                    self.oynatici.olay_dinleyicisi_ekle(lambda mesaj: telemetri and telemetri.olay_isle(mesaj))
+                    self.oynatici.ozellikleri_izle(self.oynatici.ipc)
+                
+                listeyi_doldur(bolum_indeks)
+                if not liste_indeksleri:
+                    raise Exception("Video kaynağı bulunamadı")
+                self.tui.yukleniyor_gizle()
+                
+                son_oynatilan = -1
+                while process.poll() is None:
+                    try:
+                        konum = olaylar.get(timeout=0.5).get("data")
+                    except queue.Empty:
+                        continue
+                    
+                    if konum is None or konum < 0:
+                        # Liste bitti; eklenecek bölüm kalmadıysa oturumu kapat
+                        if siradaki >= len(bolumler):
+                            break
+                        listeyi_doldur(siradaki)
+                        continue
+                    
+                    if konum >= len(liste_indeksleri):
+                        continue
+                    oynatilan = liste_indeksleri[konum]
+                    if oynatilan != son_oynatilan:
+                        son_oynatilan = oynatilan
+                        if telemetri_acik:
+                            if telemetri:
+                                telemetri.kaydet()
+                            telemetri = OynatmaTelemetrisi(
+                                anime["baslik"],
+                                bolumler[oynatilan]["baslik"],
+                                liste_kaynaklari[konum]["url"],
+                                liste_kaynaklari[konum]["etiket"]
+                            )
+                        self.gecmis.gecmis_guncelle(
+                            "animecix",
+                            anime["baslik"],
+                            bolumler[oynatilan]["baslik"],
+                            str(anime["id"]),
+                            oynatilan
+                        )
+                    listeyi_doldur(oynatilan + onde)
+            finally:
+                self.oynatici.oturum_kapat(process)
+                if telemetri:
+                    telemetri.kaydet()
+            
+        except Exception as e:
+            self.logger.hata_kaydet(e)
+            self.tui.hata_goster(str(e))
+            input("Devam etmek için Enter'a basın...")
+    
+    def bolum_oynat(self, anime: Dict[str, Any], bolum: Dict[str, Any], bolum_indeks: int, toplam_bolumler: int,
+                    bolumler: Optional[List[Dict[str, Any]]] = None) -> None:
         """Seçilen bölümü oynat"""
         try:
             # Yükleniyor göster
             self.tui.yukleniyor_goster("Oynatılmaya hazırlanıyor...")
             
-            # İzleme verisini al
-            izleme_verisi = self.anime_kaynak.izleme_verisini_al(bolum["id"])
+            son_tarih = time.monotonic() + self.config.config.get("cozumleme_zaman_asimi", 30)
+            on_yuklenen = self.on_yukleyici.al(bolum["id"]) if self.on_yukleyici else None
+            
+            if on_yuklenen:
+                izleme_verisi = on_yuklenen["izleme_verisi"]
+                altyazi_gelecegi = Future()
+                altyazi_gelecegi.set_result(on_yuklenen["altyazi_url"])
+            else:
+                # Video kaynağını ve altyazıyı birbirini beklemeden, ortak bir süre sınırıyla çöz
+                sezon_num = bolum["ekstra"].get("sezon_num", 1)
+                izleme_gelecegi = self.is_havuzu.submit(self.anime_kaynak.izleme_verisini_al, bolum["id"])
+                altyazi_gelecegi = self.is_havuzu.submit(
+                    self.anime_kaynak.tr_altyazi_al,
+                    sezon_num - 1, 
+                    bolum_indeks, 
+                    anime["id"],
+                    bolum["id"]
+                )
+                
+                try:
+                    izleme_verisi = izleme_gelecegi.result(timeout=max(0.0, son_tarih - time.monotonic()))
+                except concurrent.futures.TimeoutError:
+                    raise Exception("Video kaynağı zamanında çözümlenemedi")
             
             if not izleme_verisi:
                 self.tui.yukleniyor_gizle()
@@ -543,29 +4515,33 @@ class AnimeCLI:
                 input("Devam etmek için Enter'a basın...")
                 return
             
-            # Türkçe altyazıyı al (varsa)
-            sezon_num = bolum["ekstra"].get("sezon_num", 1)
-            altyazi_url = self.anime_kaynak.tr_altyazi_al(
-                sezon_num - 1, 
-                bolum_indeks, 
-                anime["id"]
-            )
-            
-            # Kaliteye göre sırala (en yüksek önce)
-            izleme_verisi.sort(key=lambda x: self._kalite_cikar(x["etiket"]), reverse=True)
+            # Altyazı hazırsa doğrudan verilir, değilse oynatma başladıktan sonra eklenir
+            altyazi_url = altyazi_gelecegi.result() if altyazi_gelecegi.done() else None
             
             # Kalite seç (varsayılan olarak en yüksek)
-            secilen_kalite = izleme_verisi[0]
+            secilen_kalite = self._kalite_sec(izleme_verisi)
             
             self.tui.yukleniyor_gizle()
             
             # MPV ile oynat
             baslik = f"{anime['baslik']} - {bolum['baslik']}"
+            telemetri = None
+            if self.config.config.get("telemetri", True):
+                telemetri = OynatmaTelemetrisi(anime["baslik"], bolum["baslik"], secilen_kalite["url"], secilen_kalite["etiket"])
             process = self.oynatici.oynat(
                 secilen_kalite["url"],
                 altyazi_url,
                 baslik
             )
+            if telemetri:
+                self.oynatici.telemetri_izle(telemetri)
+            
+            if not altyazi_gelecegi.done():
+                threading.Thread(
+                    target=self._gec_altyazi_ekle,
+                    args=(altyazi_gelecegi, son_tarih),
+                    daemon=True
+                ).start()
             
             # Geçmişi güncelle
             self.gecmis.gecmis_guncelle(
@@ -576,63 +4552,53 @@ class AnimeCLI:
                 bolum_indeks
             )
             
+            # Oynatma sürerken sıradaki bölümü arka planda çöz
+            if self.on_yukleyici and bolumler and bolum_indeks + 1 < len(bolumler):
+                self.on_yukleyici.baslat(anime, bolumler[bolum_indeks + 1], bolum_indeks + 1)
+            
             # Oynatımın bitmesini bekle
             process.wait()
+            if telemetri:
+                telemetri.kaydet()
             
         except Exception as e:
             self.logger.hata_kaydet(e)
             self.tui.hata_goster(str(e))
             input("Devam etmek için Enter'a basın...")
     
+    def _gec_altyazi_ekle(self, altyazi_gelecegi: Future, son_tarih: float) -> None:
+        """Oynatma başladıktan sonra gelen altyazıyı MPV'ye IPC ile ekle"""
+        try:
+            altyazi_url = altyazi_gelecegi.result(timeout=max(0.0, son_tarih - time.monotonic()))
+            if altyazi_url and altyazi_url.strip():
+                self.oynatici.altyazi_ekle(altyazi_url, max(1.0, son_tarih - time.monotonic()))
+        except Exception as e:
+            self.logger.hata_kaydet(Exception(f"Altyazı sonradan eklenemedi: {str(e)}"))
+    
     def gecmis_goster(self) -> None:
         """İzleme geçmişini göster"""
         try:
-            kaynak_gecmis = self.gecmis.gecmis.get("animecix", {})
-            
-            if not kaynak_gecmis:
+            if not self.gecmis.son_izlenenler("animecix", 1):
                 self.tui.hata_goster("Geçmiş bulunamadı")
                 input("Devam etmek için Enter'a basın...")
                 return
             
-            # Son izlenme zamanına göre sırala
-            sirali_gecmis = sorted(
-                kaynak_gecmis.items(),
-                key=lambda x: x[1].get("son_izlenme", 0),
-                reverse=True
-            )
-            
             # Limiti uygula (yapılandırıldıysa)
             gecmis_limiti = self.config.config.get("gecmis_limiti", 0)
-            if gecmis_limiti > 0:
-                sirali_gecmis = sirali_gecmis[:gecmis_limiti]
-            
-            if not sirali_gecmis:
-                self.tui.hata_goster("Geçmiş bulunamadı")
-                input("Devam etmek için Enter'a basın...")
-                return
-            
-            # Geçmiş girişlerini biçimlendir
-            gecmis_girisleri = []
-            for anime_adi, veri in sirali_gecmis:
-                son_bolum = veri.get("son_bolum_adi", "Bilinmiyor")
-                gecmis_girisleri.append(f"{anime_adi} - {son_bolum}")
-            
-            # Geçmişten seçim yap
-            secilen_giris = self.tui.secim_listesi(gecmis_girisleri, "İzleme Geçmişi")
-            
-            # Seçilen animeyi geçmişte bul
-            secilen_anime_adi = None
-            for anime_adi, veri in sirali_gecmis:
-                son_bolum = veri.get("son_bolum_adi", "Bilinmiyor")
-                if f"{anime_adi} - {son_bolum}" == secilen_giris:
-                    secilen_anime_adi = anime_adi
-                    break
             
-            if not secilen_anime_adi:
-                return
+            def sayfa_al(arama: str, limit: int, baslangic: int) -> List[Dict[str, Any]]:
+                if gecmis_limiti > 0:
+                    limit = min(limit, max(0, gecmis_limiti - baslangic))
+                if arama:
+                    return self.gecmis.ara("animecix", arama, limit, baslangic)
+                return self.gecmis.son_izlenenler("animecix", limit, baslangic)
             
-            # Geçmişten anime detaylarını al
-            anime_veri = kaynak_gecmis[secilen_anime_adi]
+            # Geçmişten seçim yap; sayfalar son izlenme zamanına göre dizinden okunur
+            anime_veri = self.tui.kayit_sec(
+                sayfa_al,
+                lambda kayit: f"{kayit['anime_adi']} - {kayit.get('son_bolum_adi') or 'Bilinmiyor'}",
+                "İzleme Geçmişi"
+            )
             anime_id = anime_veri.get("anime_id")
             
             if not anime_id:
@@ -669,13 +4635,8 @@ class AnimeCLI:
             if not secilen_bolum:
                 return
             
-            # Bölümü oynat
-            self.bolum_oynat(
-                anime_detaylari,
-                secilen_bolum,
-                secilen_bolum_indeks,
-                len(bolumler)
-            )
+            # Bölümü (ve istenirse sonrakileri) oynat
+            self.bolumleri_oynat(anime_detaylari, bolumler, secilen_bolum_indeks)
             
         except KeyboardInterrupt:
             return
@@ -684,7 +4645,77 @@ class AnimeCLI:
             self.tui.hata_goster(str(e))
             input("Devam etmek için Enter'a basın...")
     
-    def _kalite_cikar(self, etiket: str) -> int:
+    def istatistikleri_goster(self) -> None:
+        """Host başına bağlantı havuzu sayaçlarını göster ve kaydet"""
+        if self.servis and self.servis.kullanilabilir:
+            servis = self.servis.cagir("servis", "durum")
+            print(f"\n🛰️ Servis (pid {servis['pid']}, {servis['calisma_suresi'] / 60:.0f} dk): "
+                  f"{servis['baglanti']} bağlantı, {servis['istek']} istek, {servis['hata']} hata")
+            for host, sayac in servis["http"].items():
+                print(f"  {host}: {sayac['istek']} istek, {sayac['yeniden_kullanim']} yeniden kullanım, {sayac['el_sikisma']} el sıkışma")
+            if servis["onbellek"]:
+                onbellek = servis["onbellek"]
+                print(f"  önbellek: {onbellek['isabet']} isabet, {onbellek['iska']} ıska, {onbellek['dogrulama']} doğrulama")
+            tek_ucus = servis["tek_ucus"]
+            print(f"  birleştirilen istekler: {tek_ucus['cagri']} çağrıdan {tek_ucus['birlesen']} ağ isteği kaydedildi")
+            print(f"  {yaris_ozeti(servis['yaris'])}")
+            for satir in devre_kesici_ozeti(servis["yaris"]):
+                print(f"  {satir}")
+        
+        istatistikler = self.anime_kaynak.http_istatistikleri()
+        print("\n📊 Bağlantı istatistikleri:")
+        for host, sayac in istatistikler.items():
+            print(f"  {host}: {sayac['istek']} istek, {sayac['yeniden_kullanim']} yeniden kullanım, {sayac['el_sikisma']} el sıkışma")
+        self.logger.mesaj_kaydet(f"Bağlantı istatistikleri: {json.dumps(istatistikler, ensure_ascii=False)}")
+        
+        if self.onbellek:
+            onbellek = self.onbellek.istatistikler()
+            print(f"  önbellek: {onbellek['isabet']} isabet, {onbellek['iska']} ıska, {onbellek['dogrulama']} doğrulama")
+            self.logger.mesaj_kaydet(f"Önbellek istatistikleri: {json.dumps(onbellek, ensure_ascii=False)}")
+        
+        tek_ucus = self.anime_kaynak.tek_ucus.istatistikler()
+        if tek_ucus["birlesen"]:
+            print(f"  birleştirilen istekler: {tek_ucus['cagri']} çağrıdan {tek_ucus['birlesen']} ağ isteği kaydedildi")
+        
+        yaris = self.anime_kaynak.istatistikler()
+        if yaris["p95"] or yaris["yedek_istek"] or yaris["butce_asimi"]:
+            print(f"  {yaris_ozeti(yaris)}")
+        for satir in devre_kesici_ozeti(yaris):
+            print(f"  {satir}")
+        self.logger.mesaj_kaydet(f"Devre kesici: {json.dumps(yaris['devre_kesici'], ensure_ascii=False)}")
+        
+        if self.kaynak_secici:
+            for host, puan in self.kaynak_secici.istatistikler().items():
+                hiz = f"{puan['hiz'] * 8 / 1_000_000:.1f} Mbit/sn" if puan.get("hiz") else "hız bilinmiyor"
+                ttfb = f"{puan['ttfb'] * 1000:.0f} ms" if puan.get("ttfb") is not None else "-"
+                print(f"  {host} ölçümü: {hiz}, ilk bayt {ttfb}")
+        
+        if self.posterler:
+            poster = self.posterler.istatistikler()
+            print(f"  posterler: {poster['indirilen']} indirilen, {poster['isabet']} önbellekten, {poster['hata']} hata")
+        
+        canli = self.canli_arama.sayaclar
+        if canli["istek"] or canli["onekten"]:
+            print(f"  canlı arama: {canli['istek']} sunucu isteği, {canli['onekten']} önekten yanıt, "
+                  f"{canli['yok_sayilan']} eskimiş yanıt")
+        
+        if self.oynatici.vekil:
+            vekil = self.oynatici.vekil.istatistikler()
+            print(f"  akış vekili: %{vekil['isabet_orani'] * 100:.0f} isabet "
+                  f"({vekil['isabet']} isabet, {vekil['yolda']} yolda, {vekil['iska']} ıska), "
+                  f"{vekil['ust_akis_bayt'] / 1024 / 1024:.1f} MB upstream, {vekil['istemci_bayt'] / 1024 / 1024:.1f} MB mpv'ye")
+            self.logger.mesaj_kaydet(f"Akış vekili istatistikleri: {json.dumps(vekil, ensure_ascii=False)}")
+    
+    def _kalite_sec(self, izleme_verisi: List[Dict[str, str]]) -> Dict[str, str]:
+        """Kaynaklar arasından ölçülen hızın taşıyabildiği, ölçüm kapalıysa en yüksek kaliteliyi seç"""
+        if self.kaynak_secici:
+            return self.kaynak_secici.sec(izleme_verisi)
+        # Kaliteye göre sırala (en yüksek önce)
+        izleme_verisi.sort(key=lambda x: self._kalite_cikar(x["etiket"]), reverse=True)
+        return izleme_verisi[0]
+    
+    @staticmethod
+    def _kalite_cikar(etiket: str) -> int:
         """Etiketten kalite numarasını çıkar (örn: '1080p' -> 1080)"""
         try:
             # 'p'yi kaldır ve int'e çevir
@@ -692,17 +4723,338 @@ class AnimeCLI:
         except ValueError:
             return 0
 
+def metrikleri_goster() -> None:
+    """Kaydedilmiş oynatma metriklerini host ve kaliteye göre özetle"""
+    def bicimle(deger: Optional[float], bicim: str) -> str:
+        return bicim.format(deger) if deger is not None else "-"
+    
+    ozetler = OynatmaTelemetrisi.ozetle()
+    if not ozetler:
+        print("Kaydedilmiş oynatma metriği yok")
+    
+    for ozet in ozetler:
+        hiz = ozet["ortalama_indirme_hizi"]
+        print(
+            f"{ozet['host']} {ozet['kalite']}: {ozet['oynatma']} oynatma, "
+            f"ilk kare {bicimle(ozet['ilk_kare_suresi'], '{:.2f} sn')}, "
+            f"takılma {bicimle(ozet['takilma_sayisi'], '{:.1f}')} kez / {bicimle(ozet['takilma_suresi'], '{:.1f} sn')}, "
+            f"hız {bicimle(hiz / 1024 if hiz is not None else None, '{:.0f} KB/sn')}"
+        )
+    
+    # Devre kesici durumu süreç içinde tutulur; çalışan bir servis varsa onun durumu gösterilir
+    servis = ServisIstemcisi.baglan()
+    if servis is not None:
+        try:
+            for satir in devre_kesici_ozeti(servis.cagir("servis", "durum")["yaris"]):
+                print(satir)
+        except Exception:
+            pass
+        finally:
+            servis.kapat()
+
+def bolum_araligi_coz(metin: str) -> List[int]:
+    """'1-24', '3' veya '1,3,5-7' biçimindeki bölüm numaralarını listeye çevir"""
+    numaralar: List[int] = []
+    for parca in metin.split(","):
+        parca = parca.strip()
+        if not parca:
+            continue
+        try:
+            if "-" in parca:
+                bas, son = (int(x) for x in parca.split("-", 1))
+                if bas > son:
+                    raise ValueError(parca)
+                numaralar.extend(range(bas, son + 1))
+            else:
+                numaralar.append(int(parca))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Geçersiz bölüm aralığı: {parca}")
+    return numaralar
+
+def pozitif_tamsayi(metin: str) -> int:
+    """Argümanı 1 veya daha büyük bir tamsayıya çevir"""
+    try:
+        sayi = int(metin)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz sayı: {metin}")
+    if sayi < 1:
+        raise argparse.ArgumentTypeError(f"1 veya daha büyük olmalı: {metin}")
+    return sayi
+
+def toplu_coz(args: argparse.Namespace) -> int:
+    """Bölüm aralığının video ve altyazı URL'lerini etkileşimsiz olarak çöz ve yazdır"""
+    import asyncio
+    
+    anime_kaynak = anime_kaynagi_olustur(
+        Config(),
+        args.onbellek_yok,
+        host_basina_eszamanli=args.eszamanli,
+        asenkron=True
+    )
+    
+    def yazdir(sonuc: Dict[str, Any]) -> None:
+        if args.json:
+            print(json.dumps(sonuc, ensure_ascii=False), flush=True)
+        elif sonuc.get("hata"):
+            print(f"{sonuc['numara']}\t{sonuc.get('baslik', '')}\tHATA: {sonuc['hata']}", flush=True)
+        else:
+            en_iyi = sonuc["kaynaklar"][0]["url"] if sonuc["kaynaklar"] else ""
+            print(f"{sonuc['numara']}\t{sonuc['baslik']}\t{en_iyi}\t{sonuc['altyazi_url']}", flush=True)
+    
+    async def coz(bolumler: List[Dict[str, Any]], numara: int) -> Dict[str, Any]:
+        indeks = numara - 1
+        if not 0 <= indeks < len(bolumler):
+            raise Exception("Böyle bir bölüm yok")
+        bolum = bolumler[indeks]
+        kaynaklar = await anime_kaynak.izleme_verisini_al(bolum["id"])
+        kaynaklar.sort(key=lambda x: AnimeCLI._kalite_cikar(x["etiket"]), reverse=True)
+        altyazi_url = await anime_kaynak.tr_altyazi_al(
+            bolum["ekstra"].get("sezon_num", 1) - 1,
+            indeks,
+            args.anime_id,
+            bolum["id"]
+        )
+        return {
+            "indeks": indeks,
+            "numara": numara,
+            "baslik": bolum["baslik"],
+            "kaynaklar": kaynaklar,
+            "altyazi_url": altyazi_url,
+            "hata": None
+        }
+    
+    async def hepsini_coz() -> int:
+        try:
+            bolumler = await anime_kaynak.bolumler_verisini_al(args.anime_id)
+        except Exception as e:
+            yazdir({"indeks": None, "numara": None, "hata": str(e)})
+            return 1
+        
+        numaralar = args.bolumler or list(range(1, len(bolumler) + 1))
+        # Tüm bölümler tek iş parçacığında çözülür; aynı anda en fazla args.eszamanli bölüm işlenir
+        sinir = asyncio.Semaphore(args.eszamanli)
+        
+        async def sinirli_coz(numara: int) -> Dict[str, Any]:
+            async with sinir:
+                try:
+                    return await coz(bolumler, numara)
+                except Exception as e:
+                    baslik = bolumler[numara - 1]["baslik"] if 0 < numara <= len(bolumler) else ""
+                    return {"indeks": numara - 1, "numara": numara, "baslik": baslik, "hata": str(e)}
+        
+        # Sonuçlar tamamlandıkça (sırasız) yazılır; her satır kendi indeksini taşır
+        hata_var = False
+        for gelecek in asyncio.as_completed([sinirli_coz(numara) for numara in numaralar]):
+            sonuc = await gelecek
+            hata_var = hata_var or bool(sonuc["hata"])
+            yazdir(sonuc)
+        return 1 if hata_var else 0
+    
+    async def calistir() -> int:
+        try:
+            return await hepsini_coz()
+        finally:
+            await anime_kaynak.kapat()
+    
+    return asyncio.run(calistir())
+
+def dosya_adi_temizle(ad: str) -> str:
+    """Dosya adında kullanılamayan karakterleri kaldır"""
+    return "".join("_" if karakter in '<>:"/\\|?*' or ord(karakter) < 32 else karakter for karakter in ad).strip(" .")
+
+def toplu_indir(args: argparse.Namespace) -> int:
+    """Bölüm aralığını paralel parçalarla VIDEOS_DIR altına indir"""
+    config = Config()
+    anime_kaynak = anime_kaynagi_olustur(config, args.onbellek_yok)
+    try:
+        return _bolumleri_indir(args, config, anime_kaynak)
+    finally:
+        anime_kaynak.kapat()
+
+def _bolumleri_indir(args: argparse.Namespace, config: Config, anime_kaynak: "AnimeCix") -> int:
+    """toplu_indir'in gövdesi: bölümleri çözüp sırayla indir"""
+    baglanti = args.baglanti or config.config.get("indirme_host_basina_baglanti", 4)
+    # İndirme kendi istemcisini kullanır; bağlantı havuzu host başına bağlantı sınırı kadar büyük olmalı,
+    # yoksa fazladan açılan bağlantılar havuza dönemeden atılır
+    indirici = Indirici(
+        HttpIstemcisi(
+            baglanti_zaman_asimi=config.config.get("baglanti_zaman_asimi", 5),
+            okuma_zaman_asimi=config.config.get("okuma_zaman_asimi", 20),
+            yeniden_deneme=config.config.get("yeniden_deneme_sayisi", 2),
+            host_basina_baglanti=baglanti
+        ),
+        host_basina_baglanti=baglanti,
+        bant_genisligi=(args.hiz_siniri if args.hiz_siniri is not None else config.config.get("indirme_hiz_siniri_kb", 0)) * 1024
+    )
+    
+    try:
+        anime = anime_kaynak.id_ile_anime_al(str(args.anime_id))
+        bolumler = anime_kaynak.bolumler_verisini_al(args.anime_id)
+    except Exception as e:
+        print(f"❌ Hata: {e}")
+        return 1
+    
+    dizin = Path(args.dizin) if args.dizin else VIDEOS_DIR / dosya_adi_temizle(anime["baslik"] or str(args.anime_id))
+    numaralar = args.bolumler or list(range(1, len(bolumler) + 1))
+    hata_var = False
+    
+    for numara in numaralar:
+        if not 0 < numara <= len(bolumler):
+            print(f"❌ {numara}. bölüm yok")
+            hata_var = True
+            continue
+        
+        bolum = bolumler[numara - 1]
+        try:
+            kaynaklar = anime_kaynak.izleme_verisini_al(bolum["id"])
+            if not kaynaklar:
+                raise Exception("Video kaynağı bulunamadı")
+            
+            # İstenen kaliteyi aşmayan en yüksek kalite, yoksa en düşüğü
+            kaynaklar.sort(key=lambda x: AnimeCLI._kalite_cikar(x["etiket"]), reverse=True)
+            uygunlar = [k for k in kaynaklar if not args.kalite or AnimeCLI._kalite_cikar(k["etiket"]) <= args.kalite]
+            secilen = uygunlar[0] if uygunlar else kaynaklar[-1]
+            
+            yol = urllib.parse.urlparse(secilen["url"]).path
+            if yol.endswith(".m3u8"):
+                raise Exception("HLS akışları parça parça indirilemiyor")
+            uzanti = os.path.splitext(yol)[1] or ".mp4"
+            hedef = dizin / dosya_adi_temizle(f"{numara:02d} - {bolum['baslik']} [{secilen['etiket']}]{uzanti}")
+            
+            baslangic = time.monotonic()
+            
+            def ilerleme(indirilen: int, toplam: Optional[int]) -> None:
+                yuzde = f"%{indirilen * 100 // toplam}" if toplam else f"{indirilen // (1024 * 1024)} MB"
+                print(f"\r⬇️  {bolum['baslik']}: {yuzde}", end="", flush=True)
+            
+            indirici.indir(secilen["url"], hedef, ilerleme)
+            sure = max(time.monotonic() - baslangic, 0.001)
+            print(f"\r✅ {hedef} ({hedef.stat().st_size / sure / (1024 * 1024):.1f} MB/sn)")
+        except KeyboardInterrupt:
+            print("\n⏸  İndirme durduruldu; tekrar çalıştırıldığında kaldığı yerden devam eder")
+            return 130
+        except Exception as e:
+            print(f"\r❌ {bolum['baslik']}: {e}")
+            hata_var = True
+    
+    return 1 if hata_var else 0
+
+def servis_komutu(args: argparse.Namespace) -> int:
+    """Servisi ön planda çalıştır ya da çalışan servisin durumunu göster veya onu durdur"""
+    if not (args.durum or args.durdur):
+        return Servis(onbellek_devre_disi=args.onbellek_yok).calistir()
+    
+    istemci = ServisIstemcisi.baglan()
+    if istemci is None:
+        print("Servis çalışmıyor")
+        return 1
+    
+    if args.durdur:
+        istemci.cagir("servis", "durdur")
+        print("🛑 Servis durduruluyor")
+        return 0
+    
+    durum = istemci.cagir("servis", "durum")
+    print(f"🛰️ Servis çalışıyor (pid {durum['pid']}, {durum['calisma_suresi'] / 60:.0f} dk): "
+          f"{durum['baglanti']} bağlantı, {durum['istek']} istek, {durum['hata']} hata")
+    for host, sayac in durum["http"].items():
+        print(f"  {host}: {sayac['istek']} istek, {sayac['yeniden_kullanim']} yeniden kullanım")
+    print(f"  birleştirilen istekler: {durum['tek_ucus']['cagri']} çağrıdan {durum['tek_ucus']['birlesen']} ağ isteği kaydedildi")
+    print(f"  {yaris_ozeti(durum['yaris'])}")
+    for satir in devre_kesici_ozeti(durum["yaris"]):
+        print(f"  {satir}")
+    return 0
+
+def komutu_calistir(args: argparse.Namespace) -> None:
+    """Ayrıştırılmış argümanlara göre alt komutu ya da etkileşimli arayüzü çalıştır"""
+    if args.komut == "coz":
+        sys.exit(toplu_coz(args))
+    
+    if args.komut == "indir":
+        sys.exit(toplu_indir(args))
+    
+    if args.komut == "servis":
+        sys.exit(servis_komutu(args))
+    
+    if args.metrikler:
+        metrikleri_goster()
+        return
+    
+    if args.onbellek_temizle:
+        silinen = YanitOnbellegi().temizle()
+        print(f"🧹 Önbellekten {silinen} kayıt silindi")
+        return
+    
+    # CLI uygulamasını oluştur ve çalıştır
+    cli = AnimeCLI(
+        rpc_devre_disi=args.rpc_devre_disi,
+        onbellek_devre_disi=args.onbellek_yok,
+        on_yukleme=args.on_yukle,
+        art_arda=args.art_arda,
+        akis_vekili=args.vekil,
+        servis_kullan=not args.servis_yok
+    )
+    if args.baslangic_profili:
+        baslangic_profilini_yazdir()
+        return
+    
+    try:
+        cli.calistir()
+    finally:
+        if args.istatistik:
+            cli.istatistikleri_goster()
+        if cli.kaynak_secici:
+            cli.kaynak_secici.kapat()
+        cli.anime_kaynak.kapat()
+
 def main():
     """Ana giriş noktası"""
     parser = argparse.ArgumentParser(description="Terminalde Türkçe altyazılı anime arama ve izleme aracı")
     parser.add_argument("--rpc-devre-disi", action="store_true", help="Discord Rich Presence özelliğini kapatır")
+    parser.add_argument("--istatistik", action="store_true", help="Çıkışta bağlantı havuzu istatistiklerini gösterir")
+    parser.add_argument("--on-yukle", action="store_true", help="Oynatma sürerken sıradaki bölümü arka planda hazırlar")
+    parser.add_argument("--art-arda", action="store_true", help="Bölümleri tek bir MPV penceresinde art arda oynatır")
+    parser.add_argument("--vekil", action="store_true", help="Videoyu okuma-önde yapan yerel bir vekil sunucu üzerinden oynatır")
+    parser.add_argument("--metrikler", action="store_true", help="Kaydedilmiş oynatma metriklerini host ve kaliteye göre özetler ve çıkar")
+    parser.add_argument("--onbellek-yok", action="store_true", help="API yanıt önbelleğini kullanmaz")
+    parser.add_argument("--onbellek-temizle", action="store_true", help="API yanıt önbelleğini temizler ve çıkar")
+    parser.add_argument("--baslangic-profili", action="store_true", help="İçe aktarma ve başlatma sürelerini yazdırır ve çıkar")
+    parser.add_argument("--servis-yok", action="store_true", help="Çalışan servis olsa bile her şeyi bu süreçte yapar")
+    parser.add_argument("--profil", action="store_true", help=f"Oturumun zaman çizelgesini Chrome-trace JSON olarak {PROFILE_DIR} dizinine yazar")
     parser.add_argument("--surum", "-v", action="version", version="anitr-py 1.0.0")
     
+    alt_komutlar = parser.add_subparsers(dest="komut")
+    coz_parser = alt_komutlar.add_parser("coz", help="Bölümlerin video ve altyazı URL'lerini etkileşimsiz olarak çözer")
+    coz_parser.add_argument("--anime-id", type=int, required=True, help="Anime kimliği")
+    coz_parser.add_argument("--bolumler", type=bolum_araligi_coz, help="Bölüm numaraları, örn. 1-24 veya 1,3,5-7 (varsayılan: tümü)")
+    coz_parser.add_argument("--eszamanli", type=pozitif_tamsayi, default=8, help="Aynı anda çözülecek bölüm sayısı (varsayılan: 8)")
+    coz_parser.add_argument("--json", action="store_true", help="Her bölüm için bir JSON satırı yazdırır")
+    
+    servis_parser = alt_komutlar.add_parser("servis", help="Önbellekleri ve bağlantıları sıcak tutan yerel servisi ön planda çalıştırır")
+    servis_parser.add_argument("--durum", action="store_true", help="Çalışan servisin durumunu gösterir")
+    servis_parser.add_argument("--durdur", action="store_true", help="Çalışan servisi durdurur")
+    
+    indir_parser = alt_komutlar.add_parser("indir", help="Bölümleri paralel parçalarla video dizinine indirir")
+    indir_parser.add_argument("--anime-id", type=int, required=True, help="Anime kimliği")
+    indir_parser.add_argument("--bolumler", type=bolum_araligi_coz, help="Bölüm numaraları, örn. 1-24 veya 1,3,5-7 (varsayılan: tümü)")
+    indir_parser.add_argument("--kalite", type=int, help="En yüksek kalite, örn. 720 (varsayılan: en yüksek)")
+    indir_parser.add_argument("--baglanti", type=pozitif_tamsayi, help="Bir hosta açılacak en fazla bağlantı sayısı")
+    indir_parser.add_argument("--hiz-siniri", type=int, help="Toplam bant genişliği sınırı, KB/sn (0 = sınırsız)")
+    indir_parser.add_argument("--dizin", help=f"İndirme dizini (varsayılan: {VIDEOS_DIR}/<anime adı>)")
+    
     args = parser.parse_args()
+    baslangic_olcumu("argüman ayrıştırma")
     
-    # CLI uygulamasını oluştur ve çalıştır
-    cli = AnimeCLI(rpc_devre_disi=args.rpc_devre_disi)
-    cli.calistir()
+    if not args.profil:
+        komutu_calistir(args)
+        return
+    
+    PROFILCI.ac()
+    try:
+        komutu_calistir(args)
+    finally:
+        dosya = PROFILCI.yaz(PROFILE_DIR / f"profil-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json")
+        print(f"📈 Profil kaydedildi: {dosya} (chrome://tracing veya ui.perfetto.dev ile açın)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
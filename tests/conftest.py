@@ -0,0 +1,206 @@
+"""
+Testlerin ortak kurulumu: main.py içe aktarılmadan önce ev dizini geçici bir dizine yönlendirilir;
+böylece yapılandırma, geçmiş, önbellek ve günlük dosyaları gerçek ~/.anitr-py'ye yazılmaz.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="anitr-py-test-")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import asyncio
+import re
+import select
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StatikSunucu:
+    """CDN yerine geçen, Range isteklerini destekleyen tek dosyalık yerel HTTP sunucusu"""
+    
+    def __init__(self, veri: bytes, range_destegi: bool = True):
+        self.veri = veri
+        self.range_destegi = range_destegi
+        # Her isteğin Range başlığı (yoksa None)
+        self.istekler = []
+        # Sıfırdan büyükse bu kadar istekten sonra bağlantı yanıt yazılmadan kapatılır
+        self.hata_sonrasi = 0
+        self._kilit = threading.Lock()
+        sunucu = self
+        
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                sunucu._yanitla(self)
+        
+        self.sunucu = ThreadingHTTPServer(("127.0.0.1", 0), Isleyici)
+        self.sunucu.daemon_threads = True
+        threading.Thread(target=self.sunucu.serve_forever, daemon=True).start()
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.sunucu.server_port}/dosya.bin"
+    
+    def _yanitla(self, isleyici):
+        aralik = isleyici.headers.get("Range")
+        with self._kilit:
+            self.istekler.append(aralik)
+            kes = self.hata_sonrasi and len(self.istekler) > self.hata_sonrasi
+        if kes:
+            isleyici.close_connection = True
+            isleyici.connection.shutdown(2)
+            return
+        
+        eslesme = re.fullmatch(r"bytes=(\d+)-(\d*)", aralik or "")
+        if not (self.range_destegi and eslesme):
+            govde = self.veri
+            isleyici.send_response(200)
+        else:
+            bas = int(eslesme.group(1))
+            son = int(eslesme.group(2)) if eslesme.group(2) else len(self.veri) - 1
+            son = min(son, len(self.veri) - 1)
+            govde = self.veri[bas:son + 1]
+            isleyici.send_response(206)
+            isleyici.send_header("Content-Range", f"bytes {bas}-{son}/{len(self.veri)}")
+        isleyici.send_header("Content-Length", str(len(govde)))
+        isleyici.send_header("Accept-Ranges", "bytes")
+        isleyici.end_headers()
+        isleyici.wfile.write(govde)
+    
+    def kapat(self):
+        self.sunucu.shutdown()
+        self.sunucu.server_close()
+
+
+@pytest.fixture
+def statik_sunucu():
+    """Rastgele 1 MB veriyi sunan StatikSunucu"""
+    sunucu = StatikSunucu(os.urandom(1024 * 1024 + 123))
+    yield sunucu
+    sunucu.kapat()
+
+
+class ApiSunucu:
+    """AnimeCix API'si yerine geçen yerel HTTP sunucusu; her yol için (durum, başlıklar, gövde, gecikme) döner"""
+    
+    def __init__(self):
+        # Yol -> (durum, başlıklar, gövde, gecikme sn); bilinmeyen yollar 404 döner
+        self.yollar = {}
+        # Gelen her isteğin (yol, başlıklar) çifti
+        self.istekler = []
+        # Gecikmesini tamamlamadan istemcisi bağlantıyı kapatan isteklerin yolları
+        self.iptaller = []
+        self._kilit = threading.Lock()
+        sunucu = self
+        
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                sunucu._yanitla(self)
+        
+        self.sunucu = ThreadingHTTPServer(("127.0.0.1", 0), Isleyici)
+        self.sunucu.daemon_threads = True
+        threading.Thread(target=self.sunucu.serve_forever, args=(0.05,), daemon=True).start()
+    
+    @property
+    def taban_url(self) -> str:
+        return f"http://127.0.0.1:{self.sunucu.server_port}/"
+    
+    def _yanitla(self, isleyici):
+        with self._kilit:
+            self.istekler.append((isleyici.path, dict(isleyici.headers)))
+        durum, basliklar, govde, gecikme = self.yollar.get(isleyici.path, (404, {}, b"", 0.0))
+        if gecikme:
+            # İstemci beklerken bağlantıyı kapatırsa soket okunabilir olur (EOF)
+            okunabilir, _, _ = select.select([isleyici.connection], [], [], gecikme)
+            if okunabilir:
+                with self._kilit:
+                    self.iptaller.append(isleyici.path)
+                isleyici.close_connection = True
+                return
+        if isinstance(govde, (dict, list)):
+            govde = json.dumps(govde).encode()
+            basliklar = {"Content-Type": "application/json", **basliklar}
+        isleyici.send_response(durum)
+        for ad, deger in basliklar.items():
+            isleyici.send_header(ad, deger)
+        isleyici.send_header("Content-Length", str(len(govde)))
+        isleyici.end_headers()
+        isleyici.wfile.write(govde)
+    
+    def kapat(self):
+        self.sunucu.shutdown()
+        self.sunucu.server_close()
+
+
+@pytest.fixture
+def api_sunucusu():
+    """Gerektiği kadar ApiSunucu oluşturan fabrika; test bitince hepsi kapatılır"""
+    sunucular = []
+    
+    def olustur() -> ApiSunucu:
+        sunucular.append(ApiSunucu())
+        return sunucular[-1]
+    
+    yield olustur
+    for sunucu in sunucular:
+        sunucu.kapat()
+
+
+class CekirdekKurucu:
+    """Yerel API sunucularına bağlanan AsenkronAnimeCix çekirdekleri kurar; işlemleri kendi olay döngüsünde çalıştırır"""
+    
+    ARAMA_YOLU = "/secure/search/x?type=&limit=20"
+    
+    def __init__(self):
+        self.cekirdekler = []
+    
+    def __call__(self, asil: ApiSunucu, ayna: ApiSunucu = None, yedek_gecikmesi: float = None, **kwargs):
+        import main
+        
+        cekirdek = main.AsenkronAnimeCix(yeniden_deneme=0, **kwargs)
+        cekirdek.base_url = asil.taban_url
+        cekirdek.alternative_url = (ayna or asil).taban_url
+        if yedek_gecikmesi is not None:
+            # Ölçüm birikmeden yedek isteğin bu gecikmeyle gönderilmesi için
+            cekirdek.gecikmeler = main.GecikmeOlcer(varsayilan=yedek_gecikmesi)
+        self.cekirdekler.append(cekirdek)
+        return cekirdek
+    
+    @staticmethod
+    def calistir(cekirdek, islem):
+        """Eşyordamı yeni bir olay döngüsünde çalıştır; oturum aynı döngüde kapatılır"""
+        async def senaryo():
+            try:
+                return await islem
+            finally:
+                await cekirdek.kapat()
+        return asyncio.run(senaryo())
+    
+    def kapat(self):
+        for cekirdek in self.cekirdekler:
+            asyncio.run(cekirdek.kapat())
+
+
+@pytest.fixture
+def cekirdek_kur():
+    """api_sunucusu'na bağlı çekirdekler kuran CekirdekKurucu; test bitince hepsi kapatılır"""
+    kurucu = CekirdekKurucu()
+    yield kurucu
+    kurucu.kapat()
@@ -0,0 +1,128 @@
+"""AkisVekili'nin Range yanıtları, parça önbelleği ve kaynak sınırı"""
+
+import requests
+
+import main
+
+
+PARCA = 64 * 1024
+
+
+def vekil_olustur(**ayarlar) -> main.AkisVekili:
+    istemci = main.HttpIstemcisi(yeniden_deneme=0)
+    return main.AkisVekili(istemci, parca_boyutu=PARCA, **ayarlar)
+
+
+def test_range_istegi_dogru_baytlari_206_ile_doner(statik_sunucu):
+    vekil = vekil_olustur()
+    try:
+        adres = vekil.adres(statik_sunucu.url)
+        boyut = len(statik_sunucu.veri)
+        
+        yanit = requests.get(adres, headers={"Range": "bytes=100000-200000"})
+        assert yanit.status_code == 206
+        assert yanit.headers["Content-Range"] == f"bytes 100000-200000/{boyut}"
+        assert yanit.content == statik_sunucu.veri[100000:200001]
+        
+        yanit = requests.get(adres, headers={"Range": "bytes=-500"})
+        assert yanit.status_code == 206
+        assert yanit.content == statik_sunucu.veri[-500:]
+        
+        yanit = requests.get(adres, headers={"Range": f"bytes={boyut - 10}-"})
+        assert yanit.content == statik_sunucu.veri[-10:]
+    finally:
+        vekil.kapat()
+
+
+def test_range_olmayan_istek_tum_dosyayi_200_ile_doner(statik_sunucu):
+    vekil = vekil_olustur()
+    try:
+        yanit = requests.get(vekil.adres(statik_sunucu.url))
+        assert yanit.status_code == 200
+        assert "Content-Range" not in yanit.headers
+        assert yanit.content == statik_sunucu.veri
+    finally:
+        vekil.kapat()
+
+
+def test_anlasilmayan_birim_ve_coklu_aralik_200_ile_yanitlanir(statik_sunucu):
+    vekil = vekil_olustur()
+    try:
+        adres = vekil.adres(statik_sunucu.url)
+        for aralik in ("items=0-10", "bytes=0-1,5-6"):
+            yanit = requests.get(adres, headers={"Range": aralik})
+            assert yanit.status_code == 200, aralik
+            assert "Content-Range" not in yanit.headers
+            assert yanit.content == statik_sunucu.veri
+    finally:
+        vekil.kapat()
+
+
+def test_bozuk_ya_da_karsilanamayan_aralik_416_doner(statik_sunucu):
+    vekil = vekil_olustur()
+    try:
+        adres = vekil.adres(statik_sunucu.url)
+        boyut = len(statik_sunucu.veri)
+        for aralik in ("bytes=abc-", "bytes=-", "bytes=5", "bytes=10-5", "bytes=-0", f"bytes={boyut}-"):
+            yanit = requests.get(adres, headers={"Range": aralik})
+            assert yanit.status_code == 416, aralik
+            assert yanit.headers["Content-Range"] == f"bytes */{boyut}"
+        # Hatalı istekler bağlantıyı ya da sunucuyu bozmaz
+        assert requests.get(adres, headers={"Range": "bytes=0-9"}).content == statik_sunucu.veri[:10]
+    finally:
+        vekil.kapat()
+
+
+def test_geri_sarma_bellekteki_parcadan_yanitlanir(statik_sunucu):
+    vekil = vekil_olustur(onde_parca=0)
+    try:
+        adres = vekil.adres(statik_sunucu.url)
+        requests.get(adres, headers={"Range": "bytes=0-1000"})
+        ust_akis = len(statik_sunucu.istekler)
+        
+        yanit = requests.get(adres, headers={"Range": "bytes=500-1500"})
+        
+        assert yanit.content == statik_sunucu.veri[500:1501]
+        assert len(statik_sunucu.istekler) == ust_akis
+        assert vekil.sayaclar["isabet"] >= 1
+    finally:
+        vekil.kapat()
+
+
+def test_range_desteklemeyen_kaynak_yonlendirilir(statik_sunucu):
+    statik_sunucu.range_destegi = False
+    vekil = vekil_olustur()
+    try:
+        yanit = requests.get(vekil.adres(statik_sunucu.url), allow_redirects=False)
+        assert yanit.status_code == 302
+        assert yanit.headers["Location"] == statik_sunucu.url
+    finally:
+        vekil.kapat()
+
+
+def test_bilinmeyen_kaynak_404_doner(statik_sunucu):
+    vekil = vekil_olustur()
+    try:
+        adres = vekil.adres(statik_sunucu.url)
+        yanit = requests.get(adres.rsplit("/", 2)[0] + "/0000000000000000/x")
+        assert yanit.status_code == 404
+    finally:
+        vekil.kapat()
+
+
+def test_kaynak_kaydi_sinirlidir_ve_atilanin_parcalari_birakilir(statik_sunucu, monkeypatch):
+    monkeypatch.setattr(main.AkisVekili, "EN_FAZLA_KAYNAK", 3)
+    vekil = vekil_olustur(onde_parca=0)
+    try:
+        ilk = vekil.adres(statik_sunucu.url + "?0")
+        requests.get(ilk, headers={"Range": "bytes=0-9"})
+        assert vekil.istatistikler()["bellek_bayt"] > 0
+        
+        for no in range(1, 4):
+            vekil.adres(statik_sunucu.url + f"?{no}")
+        
+        assert len(vekil._kaynaklar) == 3
+        assert vekil.istatistikler()["bellek_bayt"] == 0
+        assert requests.get(ilk).status_code == 404
+    finally:
+        vekil.kapat()
@@ -0,0 +1,186 @@
+"""aiohttp üzerindeki AsenkronHttpIstemcisi ve AnimeCix'in çekirdeğe bağlanan engelleyici cephesi"""
+
+import asyncio
+import socket
+import threading
+import time
+import zlib
+
+import pytest
+
+import main
+
+
+def istek_gonder(istemci: main.AsenkronHttpIstemcisi, url: str) -> main.AsenkronYanit:
+    async def senaryo():
+        try:
+            return await istemci.get(url)
+        finally:
+            await istemci.kapat()
+    return asyncio.run(senaryo())
+
+
+def test_deflate_zlib_ve_ham_govdeleri_acilir(api_sunucusu):
+    sunucu = api_sunucusu()
+    veri = b'{"results": []}' * 50
+    ham = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    sunucu.yollar["/zlib"] = (200, {"Content-Encoding": "deflate"}, zlib.compress(veri), 0.0)
+    sunucu.yollar["/ham"] = (200, {"Content-Encoding": "deflate"}, ham.compress(veri) + ham.flush(), 0.0)
+    
+    assert istek_gonder(main.AsenkronHttpIstemcisi(), sunucu.taban_url + "zlib").content == veri
+    assert istek_gonder(main.AsenkronHttpIstemcisi(), sunucu.taban_url + "ham").content == veri
+
+
+def test_basliklar_buyuk_kucuk_harfe_duyarsizdir(api_sunucusu):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/a"] = (200, {"ETag": '"v1"'}, {"ok": True}, 0.0)
+    yanit = istek_gonder(main.AsenkronHttpIstemcisi(), sunucu.taban_url + "a")
+    assert yanit.headers.get("etag") == yanit.headers.get("ETag") == '"v1"'
+    assert yanit.json() == {"ok": True}
+
+
+def test_vekil_ortam_degiskenlerine_uyulur(api_sunucusu, monkeypatch):
+    vekil = api_sunucusu()
+    vekil.yollar["http://anitr-py.invalid/secure/search/x"] = (200, {}, {"vekilden": True}, 0.0)
+    monkeypatch.setenv("HTTP_PROXY", vekil.taban_url)
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    
+    yanit = istek_gonder(main.AsenkronHttpIstemcisi(), "http://anitr-py.invalid/secure/search/x")
+    assert yanit.json() == {"vekilden": True}
+    
+    # NO_PROXY'deki hosta doğrudan gidilir
+    hedef = api_sunucusu()
+    hedef.yollar["/dogrudan"] = (200, {}, {"dogrudan": True}, 0.0)
+    assert istek_gonder(main.AsenkronHttpIstemcisi(), hedef.taban_url + "dogrudan").json() == {"dogrudan": True}
+    assert [yol for yol, _ in vekil.istekler] == ["http://anitr-py.invalid/secure/search/x"]
+
+
+def test_bozuk_durum_satiri_basarisiz_hatasi_verir():
+    dinleyici = socket.socket()
+    dinleyici.bind(("127.0.0.1", 0))
+    dinleyici.listen()
+    
+    def bozuk_yanitla():
+        baglanti, _ = dinleyici.accept()
+        baglanti.recv(65536)
+        baglanti.sendall(b"HTTP/1.1 abc OK\r\nContent-Length: 0\r\n\r\n")
+        baglanti.close()
+    
+    threading.Thread(target=bozuk_yanitla, daemon=True).start()
+    try:
+        with pytest.raises(Exception, match="isteği başarısız"):
+            istek_gonder(main.AsenkronHttpIstemcisi(yeniden_deneme=0), f"http://127.0.0.1:{dinleyici.getsockname()[1]}/")
+    finally:
+        dinleyici.close()
+
+
+def test_5xx_yanitlari_yeniden_denenir_ve_baglanti_yeniden_kullanilir(api_sunucusu):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/hata"] = (503, {}, b"", 0.0)
+    istemci = main.AsenkronHttpIstemcisi(yeniden_deneme=2, geri_cekilme=0.01)
+    
+    assert istek_gonder(istemci, sunucu.taban_url + "hata").status_code == 503
+    assert len(sunucu.istekler) == 3
+    host = sunucu.taban_url.split("/")[2]
+    assert istemci.istatistikler()[host] == {"istek": 3, "yeniden_kullanim": 2, "el_sikisma": 1}
+
+
+def test_engelleyici_istemci_yalnizca_yeni_baglantilari_el_sikisma_sayar(api_sunucusu):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/a"] = (200, {}, {"ok": True}, 0.0)
+    sunucu.yollar["/kapat"] = (200, {"Connection": "close"}, {"ok": True}, 0.0)
+    istemci = main.HttpIstemcisi()
+    try:
+        for yol in ("a", "a", "a", "kapat", "a"):
+            istemci.get(sunucu.taban_url + yol).content
+    finally:
+        istemci.kapat()
+    # Sunucunun kapattığı bağlantıdan sonraki istek yeni bir bağlantı açar
+    host = sunucu.taban_url.split("/")[2]
+    assert istemci.istatistikler()[host] == {"istek": 5, "yeniden_kullanim": 3, "el_sikisma": 2}
+
+
+def kaynak_olustur(sunucu, **kwargs) -> main.AnimeCix:
+    kaynak = main.AnimeCix(**kwargs)
+    kaynak.cekirdek.base_url = sunucu.taban_url
+    kaynak.cekirdek.alternative_url = sunucu.taban_url
+    return kaynak
+
+
+def test_cephe_cekirdegin_istek_yolunu_kullanir(api_sunucusu):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/secure/search/naruto?type=&limit=20"] = (
+        200, {}, {"results": [{"id": 7, "name": "Naruto", "title_type": "anime"}]}, 0.0
+    )
+    kaynak = kaynak_olustur(sunucu)
+    try:
+        sonuclar = kaynak.arama_verisi_al("naruto")
+        assert [sonuc["id"] for sonuc in sonuclar] == [7]
+        # API başlıkları çekirdeğin koşullu başlıklarıyla gönderilir
+        assert sunucu.istekler[0][1]["x-e-h"] == "=.a"
+        host = sunucu.taban_url.split("/")[2]
+        assert kaynak.http_istatistikleri()[host]["istek"] == 1
+        assert kaynak.istatistikler()["devre_kesici"][host]["ardisik_hata"] == 0
+    finally:
+        kaynak.kapat()
+    assert kaynak._dongu is None
+
+
+def test_cephenin_hatasi_kaynak_hatasi_olarak_iletilir(api_sunucusu):
+    sunucu = api_sunucusu()
+    kaynak = kaynak_olustur(sunucu)
+    try:
+        with pytest.raises(Exception, match="Arama başarısız: 404"):
+            kaynak.arama_verisi_al("yok")
+    finally:
+        kaynak.kapat()
+
+
+class YavasDizin:
+    """ekle'si serbest bırakılana kadar bekleyen başlık dizini"""
+    
+    def __init__(self):
+        self.serbest = threading.Event()
+        self.eklenenler = []
+        self.is_parcaciklari = []
+    
+    def ekle(self, animeler):
+        self.is_parcaciklari.append(threading.current_thread().name)
+        self.serbest.wait(5)
+        self.eklenenler.extend(animeler)
+
+
+class KayitliOnbellek:
+    """Her çağrının hangi iş parçacığında yapıldığını kaydeden önbellek"""
+    
+    def __init__(self):
+        self.is_parcaciklari = []
+    
+    def oku(self, url):
+        self.is_parcaciklari.append(threading.current_thread().name)
+        return None
+    
+    def yaz(self, url, veri, etag=None, son_degisiklik=None):
+        self.is_parcaciklari.append(threading.current_thread().name)
+
+
+def test_dizin_ve_onbellek_isleri_olay_dongusunu_bekletmez(api_sunucusu):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/secure/search/naruto?type=&limit=20"] = (200, {}, {"results": [{"id": 7, "name": "Naruto"}]}, 0.0)
+    dizin, onbellek = YavasDizin(), KayitliOnbellek()
+    kaynak = main.AnimeCix(baslik_dizini=dizin, onbellek=onbellek)
+    kaynak.cekirdek.base_url = kaynak.cekirdek.alternative_url = sunucu.taban_url
+    try:
+        # Dizin eklemesi sürerken arama sonucu döner
+        assert [sonuc["id"] for sonuc in kaynak.arama_verisi_al("naruto")] == [7]
+        assert dizin.eklenenler == []
+        son = time.monotonic() + 2
+        while not dizin.is_parcaciklari and time.monotonic() < son:
+            time.sleep(0.01)
+        assert dizin.is_parcaciklari[0].startswith("anitr-py-dizin")
+        assert onbellek.is_parcaciklari and "anitr-py-ag" not in onbellek.is_parcaciklari
+        dizin.serbest.set()
+    finally:
+        kaynak.kapat()
+    # Kapatma sıradaki eklemelerin bitmesini bekler
+    assert [anime["id"] for anime in dizin.eklenenler] == [7]
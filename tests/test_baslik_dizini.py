@@ -0,0 +1,49 @@
+"""Başlık katlama ve yerel başlık dizininin arama ve hata davranışı"""
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("baslik, beklenen", [
+    ("Şingeki no Kyojin: Final", "singeki no kyojin final"),
+    ("İNUYAŞA", "inuyasa"),
+    ("ISIK ılık", "isik ilik"),
+    ("Pokémon", "pokemon"),
+    ("ÉCOLE", "ecole"),
+    ("Ｆｕｌｌ－ｗｉｄｔｈ", "full width"),
+    ("Straße", "strasse"),
+])
+def test_baslik_katla(baslik, beklenen):
+    assert main.baslik_katla(baslik) == beklenen
+
+
+def test_aksanli_baslik_aksansiz_sorguyla_bulunur(tmp_path):
+    dizin = main.BaslikDizini(tmp_path / "basliklar.db")
+    try:
+        dizin.ekle([
+            {"id": 1, "baslik": "Pokémon"},
+            {"id": 2, "baslik": "Shingeki no Kyojin"},
+        ])
+        assert [sonuc["id"] for sonuc in dizin.ara("pokemon")] == [1]
+        assert [sonuc["id"] for sonuc in dizin.ara("POKÉMON")] == [1]
+        # Yazım hatası tahmini
+        assert [sonuc["id"] for sonuc in dizin.ara("shingeki no kyojn")] == [2]
+    finally:
+        dizin.kapat()
+
+
+def test_ekleme_hatasi_gunluge_yazilir(tmp_path, monkeypatch, capsys):
+    dizin = main.BaslikDizini(tmp_path / "basliklar.db")
+    kayitlar = []
+    monkeypatch.setattr(dizin.logger, "hata_kaydet", kayitlar.append)
+    
+    def bozuk_baglanti():
+        raise OSError("disk dolu")
+    monkeypatch.setattr(dizin, "_baglan", bozuk_baglanti)
+    
+    dizin.ekle([{"id": 1, "baslik": "Pokémon"}])
+    
+    assert capsys.readouterr().out == ""
+    assert len(kayitlar) == 1
+    assert "disk dolu" in str(kayitlar[0])
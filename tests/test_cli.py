@@ -0,0 +1,43 @@
+"""Komut satırı argümanlarının ayrıştırılması"""
+
+import argparse
+import sys
+
+import pytest
+
+import main
+
+
+def test_bolum_araligi_tekil_aralik_ve_liste():
+    assert main.bolum_araligi_coz("3") == [3]
+    assert main.bolum_araligi_coz("1-4") == [1, 2, 3, 4]
+    assert main.bolum_araligi_coz("1,3,5-7") == [1, 3, 5, 6, 7]
+
+
+@pytest.mark.parametrize("metin", ["1-x", "5-3"])
+def test_bolum_araligi_gecersiz(metin):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main.bolum_araligi_coz(metin)
+
+
+@pytest.mark.parametrize("metin", ["0", "-2", "abc", ""])
+def test_pozitif_tamsayi_gecersiz(metin):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main.pozitif_tamsayi(metin)
+
+
+def test_pozitif_tamsayi():
+    assert main.pozitif_tamsayi("8") == 8
+
+
+@pytest.mark.parametrize("argumanlar", [
+    ["coz", "--anime-id", "1", "--eszamanli", "0"],
+    ["coz", "--anime-id", "1", "--eszamanli", "-1"],
+    ["indir", "--anime-id", "1", "--baglanti", "0"]
+])
+def test_sifir_eszamanlilik_reddedilir(monkeypatch, argumanlar):
+    # Semaphore(0) ile toplu_coz sonsuza dek beklerdi; argparse bunu baştan reddetmeli
+    monkeypatch.setattr(sys, "argv", ["anitr-py"] + argumanlar)
+    with pytest.raises(SystemExit) as cikis:
+        main.main()
+    assert cikis.value.code == 2
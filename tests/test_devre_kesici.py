@@ -0,0 +1,120 @@
+"""DevreKesici'nin durum geçişleri ve çekirdeğin hangi hataları host aleyhine saydığı"""
+
+import socket
+import time
+
+import pytest
+
+import main
+
+
+def host_durumu(cekirdek: main.AsenkronAnimeCix, sunucu) -> dict:
+    return cekirdek.devre_kesici.durumlar()[sunucu.taban_url.split("/")[2]]
+
+
+def test_esik_asilinca_devre_acilir_ve_deneme_basariyla_kapanir():
+    devre = main.DevreKesici(hata_esigi=2, bekleme=0.05)
+    devre.hata("h")
+    assert devre.izin_ver("h")
+    devre.hata("h")
+    assert not devre.izin_ver("h")
+    
+    time.sleep(0.06)
+    assert devre.izin_ver("h")
+    # Yarı açıkken yalnızca tek deneme geçer
+    assert not devre.izin_ver("h")
+    devre.basari("h")
+    assert devre.izin_ver("h")
+    assert devre.durumlar()["h"]["acilma"] == 1
+
+
+def test_sonucsuz_deneme_sonraki_istege_yer_acar():
+    devre = main.DevreKesici(hata_esigi=1, bekleme=10.0)
+    devre.hata("h")
+    devre._hostlar["h"]["zaman"] -= 10.0
+    assert devre.izin_ver("h")
+    assert not devre.izin_ver("h")
+    
+    devre.birak("h")
+    assert devre.izin_ver("h")
+    assert devre.durumlar()["h"]["durum"] == main.DevreKesici.YARI_ACIK
+
+
+def test_esik_sifirken_devre_hic_acilmaz():
+    devre = main.DevreKesici(hata_esigi=0)
+    for _ in range(3):
+        devre.hata("h")
+    assert devre.izin_ver("h")
+    assert not devre.acik_mi("h")
+    assert devre.durumlar() == {}
+
+
+def test_saglikli_yavas_host_butce_asimlariyla_acilmaz(api_sunucusu, cekirdek_kur):
+    sunucu = api_sunucusu()
+    sunucu.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": []}, 0.8)
+    cekirdek = cekirdek_kur(sunucu, arama_butcesi=0.3)
+    
+    async def senaryo():
+        for _ in range(5):
+            with pytest.raises(Exception, match="Süre bütçesi doldu"):
+                await cekirdek.arama_verisi_al("x")
+    
+    cekirdek_kur.calistir(cekirdek, senaryo())
+    durum = host_durumu(cekirdek, sunucu)
+    assert (durum["durum"], durum["ardisik_hata"], durum["acilma"]) == (main.DevreKesici.KAPALI, 0, 0)
+
+
+def test_butceyle_kisaltilan_zaman_asimi_sayilmaz(api_sunucusu, cekirdek_kur):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/yavas"] = (200, {}, {}, 0.8)
+    cekirdek = cekirdek_kur(sunucu)
+    
+    with pytest.raises(Exception, match="Süre bütçesi doldu"):
+        cekirdek_kur.calistir(cekirdek, cekirdek._olculu_get(sunucu.taban_url + "yavas", {}, time.monotonic() + 0.2))
+    assert host_durumu(cekirdek, sunucu)["ardisik_hata"] == 0
+    assert cekirdek.sayaclar["butce_asimi"] == 1
+
+
+def test_tam_sure_dolan_zaman_asimi_sayilir(api_sunucusu, cekirdek_kur):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/yavas"] = (200, {}, {}, 0.8)
+    cekirdek = cekirdek_kur(sunucu, okuma_zaman_asimi=0.2)
+    
+    with pytest.raises(Exception, match="isteği başarısız"):
+        cekirdek_kur.calistir(cekirdek, cekirdek._olculu_get(sunucu.taban_url + "yavas", {}, None))
+    assert host_durumu(cekirdek, sunucu)["ardisik_hata"] == 1
+
+
+def test_baglanti_hatasi_ve_5xx_sayilir_4xx_sayilmaz(api_sunucusu, cekirdek_kur):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/hata"] = (502, {}, b"", 0.0)
+    cekirdek = cekirdek_kur(sunucu)
+    kapali = socket.socket()
+    kapali.bind(("127.0.0.1", 0))
+    kapali_url = f"http://127.0.0.1:{kapali.getsockname()[1]}/"
+    kapali.close()
+    
+    async def senaryo():
+        await cekirdek._olculu_get(sunucu.taban_url + "hata", {}, None)
+        assert host_durumu(cekirdek, sunucu)["ardisik_hata"] == 1
+        with pytest.raises(Exception, match="isteği başarısız"):
+            await cekirdek._olculu_get(kapali_url, {}, None)
+        await cekirdek._olculu_get(sunucu.taban_url + "yok", {}, None)
+    
+    cekirdek_kur.calistir(cekirdek, senaryo())
+    durumlar = cekirdek.devre_kesici.durumlar()
+    # 404 hostun yanıt verdiğini gösterir ve önceki 5xx sayacını sıfırlar
+    assert durumlar[sunucu.taban_url.split("/")[2]]["ardisik_hata"] == 0
+    assert durumlar[kapali_url.split("/")[2]]["ardisik_hata"] == 1
+
+
+def test_kaybeden_yedek_istek_sayilmaz(api_sunucusu, cekirdek_kur):
+    asil, ayna = api_sunucusu(), api_sunucusu()
+    asil.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": [{"id": 1}]}, 3.0)
+    ayna.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": [{"id": 2}]}, 0.0)
+    cekirdek = cekirdek_kur(asil, ayna, yedek_gecikmesi=0.05)
+    
+    for _ in range(3):
+        assert [sonuc["id"] for sonuc in cekirdek_kur.calistir(cekirdek, cekirdek.arama_verisi_al("x"))] == [2]
+    assert host_durumu(cekirdek, asil)["ardisik_hata"] == 0
+    assert host_durumu(cekirdek, asil)["acilma"] == 0
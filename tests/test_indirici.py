@@ -0,0 +1,76 @@
+"""Indirici'nin parçalı indirme, devam etme ve bağlantı havuzu davranışı"""
+
+import json
+import logging
+
+import pytest
+
+import main
+
+
+PARCA = 128 * 1024
+
+
+def indirici_olustur(baglanti: int = 4) -> main.Indirici:
+    istemci = main.HttpIstemcisi(yeniden_deneme=0, host_basina_baglanti=baglanti)
+    return main.Indirici(istemci, host_basina_baglanti=baglanti, parca_boyutu=PARCA, yeniden_deneme=0)
+
+
+def test_parcali_indirme_dosyanin_aynisini_yazar(statik_sunucu, tmp_path):
+    hedef = tmp_path / "bolum.mp4"
+    
+    indirici_olustur().indir(statik_sunucu.url, hedef)
+    
+    assert hedef.read_bytes() == statik_sunucu.veri
+    assert not (tmp_path / "bolum.mp4.part").exists()
+    assert not (tmp_path / "bolum.mp4.parca.json").exists()
+    # Boyut sorgusu + her parça için bir istek
+    assert len(statik_sunucu.istekler) == 1 + -(-len(statik_sunucu.veri) // PARCA)
+
+
+def test_range_desteklemeyen_sunucudan_tek_parca_indirilir(tmp_path):
+    from conftest import StatikSunucu
+    sunucu = StatikSunucu(b"x" * 5000, range_destegi=False)
+    try:
+        hedef = tmp_path / "bolum.mp4"
+        indirici_olustur().indir(sunucu.url, hedef)
+        assert hedef.read_bytes() == sunucu.veri
+    finally:
+        sunucu.kapat()
+
+
+def test_kesilen_indirme_tamamlanan_baytlardan_devam_eder(statik_sunucu, tmp_path):
+    hedef = tmp_path / "bolum.mp4"
+    manifest_dosyasi = tmp_path / "bolum.mp4.parca.json"
+    indirici = indirici_olustur(baglanti=1)
+    
+    # Boyut sorgusu ve ilk üç parça geçer, sonrası kesilir
+    statik_sunucu.hata_sonrasi = 4
+    with pytest.raises(Exception):
+        indirici.indir(statik_sunucu.url, hedef)
+    
+    manifest = json.loads(manifest_dosyasi.read_text())
+    gecici = (tmp_path / "bolum.mp4.part").read_bytes()
+    # Manifestin yazıldı dediği her bayt dosyada gerçekten var
+    for no, yazilan in manifest["yazilan"].items():
+        bas = int(no) * PARCA
+        assert gecici[bas:bas + yazilan] == statik_sunucu.veri[bas:bas + yazilan]
+    tamamlanan = {int(no) for no, yazilan in manifest["yazilan"].items() if yazilan == PARCA}
+    assert tamamlanan == {0, 1, 2}
+    
+    statik_sunucu.hata_sonrasi = 0
+    statik_sunucu.istekler.clear()
+    indirici.indir(statik_sunucu.url, hedef)
+    
+    assert hedef.read_bytes() == statik_sunucu.veri
+    # Tamamlanan parçalar yeniden istenmez
+    istenen_baslangiclar = {int(aralik[6:].split("-")[0]) for aralik in statik_sunucu.istekler[1:]}
+    assert not istenen_baslangiclar & {0, PARCA, 2 * PARCA}
+
+
+def test_host_basina_baglanti_havuzdan_tasmaz(statik_sunucu, tmp_path, caplog):
+    # Havuz host sınırından küçük olsaydı urllib3 "Connection pool is full" uyarısı verirdi
+    with caplog.at_level(logging.WARNING, logger="urllib3"):
+        indirici_olustur(baglanti=8).indir(statik_sunucu.url, tmp_path / "bolum.mp4")
+    
+    assert not [kayit for kayit in caplog.records if "pool is full" in kayit.getMessage()]
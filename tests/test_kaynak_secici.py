@@ -0,0 +1,70 @@
+"""KaynakSecici'nin host ölçümlerini oynatma yolunu bekletmeden arka planda yapması"""
+
+import time
+
+import main
+
+
+def secici_olustur(tmp_path) -> main.KaynakSecici:
+    return main.KaynakSecici(main.HttpIstemcisi(), dosya=tmp_path / "hostlar.json", ornek_bayt=64 * 1024)
+
+
+def test_secim_olcumu_beklemez_ve_sonuc_diske_yazilir(api_sunucusu, tmp_path):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/720.mp4"] = (200, {}, b"x" * 64 * 1024, 1.0)
+    sunucu.yollar["/1080.mp4"] = (200, {}, b"x" * 64 * 1024, 1.0)
+    secici = secici_olustur(tmp_path)
+    kaynaklar = [{"etiket": "720p", "url": sunucu.taban_url + "720.mp4"},
+                 {"etiket": "1080p", "url": sunucu.taban_url + "1080.mp4"}]
+    try:
+        baslangic = time.monotonic()
+        # Ölçülmemiş hostun kalitesi sınırlanmaz
+        assert secici.sec(kaynaklar)["etiket"] == "1080p"
+        assert time.monotonic() - baslangic < 0.5
+        
+        olcumler = secici.olcumleri_baslat(kaynaklar)
+        host = sunucu.taban_url.split("/")[2]
+        assert list(olcumler) == [host]
+        olcumler[host].result(timeout=5)
+        # Hosta yalnızca bir ölçüm isteği gider
+        assert len(sunucu.istekler) == 1
+        assert secici.istatistikler()[host]["ttfb"] >= 1.0
+        assert host in main.KaynakSecici(main.HttpIstemcisi(), dosya=tmp_path / "hostlar.json").istatistikler()
+        assert secici.olcumleri_baslat(kaynaklar) == {}
+    finally:
+        secici.kapat()
+
+
+def test_bozuk_dosyada_hostun_diger_urlsi_denenir(api_sunucusu, tmp_path):
+    sunucu = api_sunucusu()
+    sunucu.yollar["/saglam.mp4"] = (200, {}, b"x" * 64 * 1024, 0.0)
+    secici = secici_olustur(tmp_path)
+    kaynaklar = [{"etiket": "1080p", "url": sunucu.taban_url + "bozuk.mp4"},
+                 {"etiket": "720p", "url": sunucu.taban_url + "saglam.mp4"}]
+    try:
+        for olcum in secici.olcumleri_baslat(kaynaklar).values():
+            olcum.result(timeout=5)
+        assert [yol for yol, _ in sunucu.istekler] == ["/bozuk.mp4", "/saglam.mp4"]
+        assert secici.istatistikler()[sunucu.taban_url.split("/")[2]]["hiz"] is not None
+    finally:
+        secici.kapat()
+
+
+def test_olculemeyen_host_devreyi_acar_ve_son_care_olarak_secilir(api_sunucusu, tmp_path):
+    bozuk, saglam = api_sunucusu(), api_sunucusu()
+    saglam.yollar["/720.mp4"] = (200, {}, b"x" * 1024, 0.0)
+    devre = main.DevreKesici(hata_esigi=1, bekleme=30.0)
+    secici = main.KaynakSecici(main.HttpIstemcisi(), dosya=tmp_path / "hostlar.json", devre_kesici=devre)
+    bozuk_host = bozuk.taban_url.split("/")[2]
+    kaynaklar = [{"etiket": "1080p", "url": bozuk.taban_url + "1080.mp4"},
+                 {"etiket": "720p", "url": saglam.taban_url + "720.mp4"}]
+    try:
+        secici.olcumleri_baslat(kaynaklar[:1])[bozuk_host].result(timeout=5)
+        assert devre.acik_mi(bozuk_host)
+        # Açık devreli host yeniden ölçülmez ve daha düşük kaliteli başka host yeğlenir
+        assert bozuk_host not in secici.olcumleri_baslat(kaynaklar)
+        assert secici.sec(kaynaklar)["etiket"] == "720p"
+        assert secici.sec(kaynaklar[:1])["etiket"] == "1080p"
+        assert len(bozuk.istekler) == 1
+    finally:
+        secici.kapat()
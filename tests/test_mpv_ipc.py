@@ -0,0 +1,193 @@
+"""MPVIPCIstemcisi ve art arda izleme akışının sahte bir mpv IPC soketine karşı testleri"""
+
+import json
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+import main
+
+
+class SahteMpv:
+    """mpv'nin JSON IPC soketini taklit eden Unix soket sunucusu; gelen komutları kaydeder"""
+    
+    def __init__(self, yol: str):
+        self.komutlar = []
+        # Komut adı -> (error, data) ya da None (yanıt verme)
+        self.yanitlar = {}
+        self.baglantilar = []
+        sahte = self
+        
+        class Isleyici(socketserver.StreamRequestHandler):
+            def handle(self):
+                sahte.baglantilar.append(self.connection)
+                for satir in self.rfile:
+                    istek = json.loads(satir)
+                    sahte.komutlar.append(istek)
+                    yanit = sahte.yanitlar.get(istek["command"][0], ("success", None))
+                    if yanit is None:
+                        continue
+                    hata, veri = yanit(istek) if callable(yanit) else yanit
+                    sahte.gonder({"request_id": istek["request_id"], "error": hata, "data": veri})
+        
+        self.sunucu = socketserver.ThreadingUnixStreamServer(yol, Isleyici)
+        self.sunucu.daemon_threads = True
+        threading.Thread(target=self.sunucu.serve_forever, daemon=True).start()
+    
+    def gonder(self, mesaj):
+        """Son bağlantıya bir mesaj (yanıt ya da olay) yaz"""
+        self.baglantilar[-1].sendall(json.dumps(mesaj).encode("utf-8") + b"\n")
+    
+    def baglantilari_kes(self):
+        for baglanti in self.baglantilar:
+            baglanti.shutdown(socket.SHUT_RDWR)
+    
+    def kapat(self):
+        self.sunucu.shutdown()
+        self.sunucu.server_close()
+
+
+@pytest.fixture
+def soket_yolu(tmp_path):
+    return str(tmp_path / "mpv.sock")
+
+
+@pytest.fixture
+def mpv(soket_yolu):
+    sahte = SahteMpv(soket_yolu)
+    yield sahte
+    sahte.kapat()
+
+
+@pytest.fixture
+def ipc(mpv, soket_yolu):
+    istemci = main.MPVIPCIstemcisi(soket_yolu)
+    istemci.baglan(zaman_asimi=2)
+    yield istemci
+    istemci.kapat()
+
+
+def bekle(kosul, sure=2.0):
+    son = time.monotonic() + sure
+    while not kosul():
+        assert time.monotonic() < son, "koşul zamanında sağlanmadı"
+        time.sleep(0.01)
+
+
+def test_komut_istek_numarasiyla_gonderilir_ve_data_dondurulur(mpv, ipc):
+    mpv.yanitlar["get_property"] = ("success", 3)
+    
+    assert ipc.komut("get_property", "playlist-pos") == 3
+    assert ipc.komut("get_property", "playlist-pos") == 3
+    
+    assert [k["command"] for k in mpv.komutlar] == [["get_property", "playlist-pos"]] * 2
+    assert mpv.komutlar[0]["request_id"] != mpv.komutlar[1]["request_id"]
+
+
+def test_eszamanli_komutlar_kendi_yanitlarini_alir(mpv, ipc):
+    mpv.yanitlar["get_property"] = lambda istek: ("success", istek["command"][1])
+    sonuclar = {}
+    
+    def calistir(ad):
+        sonuclar[ad] = ipc.komut("get_property", ad)
+    
+    adlar = [f"ozellik-{i}" for i in range(20)]
+    is_parcaciklari = [threading.Thread(target=calistir, args=(ad,)) for ad in adlar]
+    for is_parcacigi in is_parcaciklari:
+        is_parcacigi.start()
+    for is_parcacigi in is_parcaciklari:
+        is_parcacigi.join()
+    
+    assert sonuclar == {ad: ad for ad in adlar}
+
+
+def test_hata_yaniti_istisna_olur(mpv, ipc):
+    mpv.yanitlar["sub-add"] = ("loading failed", None)
+    
+    with pytest.raises(Exception, match="başarısız: loading failed"):
+        ipc.komut("sub-add", "http://ornek/altyazi.vtt", "select")
+
+
+def test_yanit_gelmezse_zaman_asimi(mpv, ipc):
+    mpv.yanitlar["quit"] = None
+    
+    with pytest.raises(Exception, match="yanıt vermedi"):
+        ipc.komut("quit", zaman_asimi=0.2)
+
+
+def test_olaylar_dinleyicilere_iletilir(mpv, ipc):
+    olaylar = []
+    ipc.olay_dinleyicisi_ekle(olaylar.append)
+    ipc.komut("observe_property", 1, "time-pos")
+    
+    mpv.gonder({"event": "property-change", "id": 1, "name": "time-pos", "data": 1.5})
+    
+    bekle(lambda: olaylar)
+    assert olaylar[0]["name"] == "time-pos"
+
+
+def test_baglanti_kapaninca_bekleyen_komut_uyandirilir(mpv, ipc):
+    mpv.yanitlar["quit"] = None
+    threading.Timer(0.1, mpv.baglantilari_kes).start()
+    
+    with pytest.raises(Exception, match="kapandı"):
+        ipc.komut("quit", zaman_asimi=2)
+    assert ipc.kapandi.wait(1)
+
+
+def test_soket_acilana_kadar_baglanti_denenir(soket_yolu):
+    sunucu = []
+    threading.Timer(0.2, lambda: sunucu.append(SahteMpv(soket_yolu))).start()
+    istemci = main.MPVIPCIstemcisi(soket_yolu)
+    try:
+        istemci.baglan(zaman_asimi=2)
+        bekle(lambda: sunucu and sunucu[0].baglantilar)
+    finally:
+        istemci.kapat()
+        if sunucu:
+            sunucu[0].kapat()
+
+
+def test_soket_hic_acilmazsa_baglan_hata_verir(soket_yolu):
+    with pytest.raises(Exception, match="bağlanılamadı"):
+        main.MPVIPCIstemcisi(soket_yolu).baglan(zaman_asimi=0.2)
+
+
+def test_altyazi_ekle_dosya_yuklenene_kadar_tekrar_dener(mpv, soket_yolu):
+    denemeler = []
+    
+    def sub_add(istek):
+        denemeler.append(istek)
+        return ("success", None) if len(denemeler) >= 3 else ("property unavailable", None)
+    
+    mpv.yanitlar["sub-add"] = sub_add
+    oynatici = main.MPVOynatici()
+    oynatici.socket_path = soket_yolu
+    
+    oynatici.altyazi_ekle("http://ornek/altyazi.vtt", zaman_asimi=5)
+    
+    assert len(denemeler) == 3
+    assert denemeler[-1]["command"] == ["sub-add", "http://ornek/altyazi.vtt", "select"]
+
+
+def test_art_arda_izlemede_liste_girdisi_yuklenince_baslik_ve_altyazi_ayarlanir(mpv, ipc):
+    oynatici = main.MPVOynatici()
+    oynatici.ipc = ipc
+    ipc.olay_dinleyicisi_ekle(oynatici._oturum_olayi)
+    mpv.yanitlar["get_property"] = ("success", 1)
+    
+    oynatici.listeye_ekle("http://ornek/1.mp4", "", "Bölüm 1")
+    oynatici.listeye_ekle("http://ornek/2.mp4", "http://ornek/2.vtt", "Bölüm 2")
+    mpv.gonder({"event": "file-loaded"})
+    
+    bekle(lambda: any(k["command"][0] == "sub-add" for k in mpv.komutlar))
+    komutlar = [k["command"] for k in mpv.komutlar]
+    assert komutlar[:2] == [
+        ["loadfile", "http://ornek/1.mp4", "append-play"],
+        ["loadfile", "http://ornek/2.mp4", "append-play"]
+    ]
+    assert ["set_property", "force-media-title", "Bölüm 2"] in komutlar
+    assert komutlar[-1] == ["sub-add", "http://ornek/2.vtt", "select"]
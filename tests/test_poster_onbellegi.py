@@ -0,0 +1,81 @@
+"""PosterOnbellegi'nin önizlemeleri arka planda çizmesi ve önizleme önbelleğinin sınırı"""
+
+import os
+import time
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def yavas_chafa(tmp_path, monkeypatch):
+    """Yarım saniyede çizen sahte chafa"""
+    betik = tmp_path / "bin" / "chafa"
+    betik.parent.mkdir()
+    betik.write_text('#!/bin/sh\nsleep 0.5\necho "onizleme $3"\n')
+    betik.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{betik.parent}{os.pathsep}{os.environ['PATH']}")
+    return betik
+
+
+def poster_olustur(posterler: main.PosterOnbellegi, url: str) -> None:
+    posterler.dizin.mkdir(parents=True, exist_ok=True)
+    posterler._dosya(url).write_bytes(b"resim")
+
+
+def bekle_ki(kosul, sure: float = 5.0) -> None:
+    son = time.monotonic() + sure
+    while not kosul():
+        assert time.monotonic() < son
+        time.sleep(0.01)
+
+
+def test_onizleme_arayuzu_bekletmez_ve_hazir_olunca_surum_artar(tmp_path, yavas_chafa):
+    posterler = main.PosterOnbellegi(main.HttpIstemcisi(), dizin=tmp_path / "posterler")
+    try:
+        poster_olustur(posterler, "/a.jpg")
+        surum = posterler.surum
+        
+        baslangic = time.monotonic()
+        assert posterler.onizleme("/a.jpg") is None
+        assert time.monotonic() - baslangic < 0.2
+        
+        bekle_ki(lambda: posterler.surum != surum)
+        assert posterler.onizleme("/a.jpg").startswith("onizleme")
+    finally:
+        posterler.kapat()
+
+
+def test_bekle_verilirse_onizleme_cizimi_beklenir(tmp_path, yavas_chafa):
+    posterler = main.PosterOnbellegi(main.HttpIstemcisi(), dizin=tmp_path / "posterler")
+    try:
+        poster_olustur(posterler, "/a.jpg")
+        assert posterler.onizleme("/a.jpg", bekle=5).startswith("onizleme")
+    finally:
+        posterler.kapat()
+
+
+def test_onizleme_onbellegi_sinirlidir(tmp_path, yavas_chafa, monkeypatch):
+    monkeypatch.setattr(main.PosterOnbellegi, "EN_FAZLA_ONIZLEME", 2)
+    posterler = main.PosterOnbellegi(main.HttpIstemcisi(), dizin=tmp_path / "posterler")
+    try:
+        for no in range(4):
+            poster_olustur(posterler, f"/{no}.jpg")
+            posterler.onizleme(f"/{no}.jpg", bekle=5)
+        assert len(posterler._onizlemeler) == 2
+        assert not posterler._hazirlanan
+    finally:
+        posterler.kapat()
+
+
+def test_chafa_ya_da_poster_yoksa_onizleme_yok(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    posterler = main.PosterOnbellegi(main.HttpIstemcisi(), dizin=tmp_path / "posterler")
+    try:
+        assert posterler.onizleme("/yok.jpg", bekle=1) is None
+        poster_olustur(posterler, "/a.jpg")
+        assert posterler.onizleme("/a.jpg", bekle=1) is None
+        assert not posterler._hazirlanan
+    finally:
+        posterler.kapat()
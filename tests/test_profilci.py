@@ -0,0 +1,44 @@
+"""Profilci'nin iş parçacığı ve asyncio görevi aralıklarını Chrome-trace izlerine yazması"""
+
+import asyncio
+import json
+
+import main
+
+
+def olaylar_ve_izler(profilci: main.Profilci, dosya):
+    veri = json.loads(profilci.yaz(dosya).read_text(encoding="utf-8"))
+    olaylar = [olay for olay in veri["traceEvents"] if olay["ph"] == "X"]
+    izler = {olay["tid"]: olay["args"]["name"] for olay in veri["traceEvents"] if olay["name"] == "thread_name"}
+    return olaylar, izler
+
+
+def test_eszamanli_gorevlerin_araliklari_ayri_izlere_yazilir(tmp_path, monkeypatch):
+    profilci = main.Profilci()
+    monkeypatch.setattr(main, "PROFILCI", profilci)
+    profilci.ac()
+    
+    @main.asenkron_profille("test")
+    async def bekle(sure):
+        with profilci.aralik("ic", "test"):
+            await asyncio.sleep(sure)
+    
+    async def senaryo():
+        await asyncio.gather(bekle(0.05), bekle(0.02), bekle(0.03))
+    
+    asyncio.run(senaryo())
+    with profilci.aralik("es_zamanli", "test"):
+        pass
+    
+    olaylar, izler = olaylar_ve_izler(profilci, tmp_path / "iz.json")
+    gorev_izleri = {olay["tid"] for olay in olaylar if olay["name"] != "es_zamanli"}
+    assert len(gorev_izleri) == 3
+    assert all(izler[tid].startswith("MainThread Task-") for tid in gorev_izleri)
+    # Her izdeki aralıklar iç içedir: dış aralık içtekini kapsar
+    for tid in gorev_izleri:
+        dis, ic = sorted((olay for olay in olaylar if olay["tid"] == tid), key=lambda olay: olay["dur"], reverse=True)
+        assert dis["ts"] <= ic["ts"] and ic["ts"] + ic["dur"] <= dis["ts"] + dis["dur"]
+    # Görev dışındaki aralık iş parçacığının izine yazılır
+    [es_zamanli] = [olay for olay in olaylar if olay["name"] == "es_zamanli"]
+    assert es_zamanli["tid"] not in gorev_izleri
+    assert izler[es_zamanli["tid"]] == "MainThread"
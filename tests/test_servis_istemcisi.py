@@ -0,0 +1,174 @@
+"""ServisIstemcisi'nin kopan bağlantıda yeniden denemesi, süreç içi kipe geçişi ve servisi yeniden sınaması"""
+
+import json
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import main
+
+
+class SahteServis:
+    """Her isteğe {"sonuc": [nesne, islem, argumanlar]} yanıtı veren Unix soketi sunucusu"""
+    
+    def __init__(self, soket_yolu: Path):
+        self.soket_yolu = soket_yolu
+        self.baglantilar = 0
+        # Sıfırdan büyükse her yanıt bu kadar saniye geciktirilir
+        self.gecikme = 0.0
+        self._acik = []
+        self._sunucu = None
+    
+    def baslat(self):
+        sahte = self
+        
+        class Isleyici(socketserver.StreamRequestHandler):
+            def handle(self):
+                sahte.baglantilar += 1
+                sahte._acik.append(self.connection)
+                for satir in self.rfile:
+                    istek = json.loads(satir)
+                    time.sleep(sahte.gecikme)
+                    yanit = {"sonuc": [istek["nesne"], istek["islem"], istek["argumanlar"]]}
+                    self.wfile.write(json.dumps(yanit).encode("utf-8") + b"\n")
+        
+        class Sunucu(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+        
+        self.soket_yolu.unlink(missing_ok=True)
+        self._sunucu = Sunucu(str(self.soket_yolu), Isleyici)
+        threading.Thread(target=self._sunucu.serve_forever, daemon=True).start()
+    
+    def durdur(self):
+        """Sunucuyu ve açık bağlantıları kapat (servis süreci ölmüş gibi)"""
+        if self._sunucu is None:
+            return
+        self._sunucu.shutdown()
+        self._sunucu.server_close()
+        self._sunucu = None
+        for baglanti in self._acik:
+            try:
+                baglanti.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._acik = []
+        self.soket_yolu.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def soket_yolu():
+    # Unix soket yolları ~100 karakterle sınırlıdır; pytest'in tmp_path'i yerine kısa bir dizin kullanılır
+    return Path(tempfile.mkdtemp(prefix="anitr-")) / "servis.sock"
+
+
+@pytest.fixture
+def servis(soket_yolu):
+    sahte = SahteServis(soket_yolu)
+    sahte.baslat()
+    yield sahte
+    sahte.durdur()
+
+
+@pytest.fixture
+def istemci(servis, soket_yolu, monkeypatch):
+    istemci = main.ServisIstemcisi.baglan(soket_yolu)
+    istemci.hatalar = []
+    monkeypatch.setattr(istemci.logger, "hata_kaydet", istemci.hatalar.append)
+    monkeypatch.setattr(istemci.logger, "mesaj_kaydet", lambda mesaj: None)
+    yield istemci
+    istemci.kapat()
+
+
+def yerel_kaydedici(cagrilar):
+    def yerel(*argumanlar):
+        cagrilar.append(argumanlar)
+        return "yerel"
+    return yerel
+
+
+def test_baglanti_yeniden_kullanilir(servis, istemci):
+    assert istemci.cagir("dizin", "ara", "naruto") == ["dizin", "ara", ["naruto"]]
+    assert istemci.cagir("dizin", "ara", "bleach") == ["dizin", "ara", ["bleach"]]
+    assert servis.baglantilar == 1
+
+
+def test_servis_yeniden_baslatilinca_yeni_baglantiyla_denenir(servis, istemci):
+    servis.durdur()
+    servis.baslat()
+    cagrilar = []
+    
+    sonuc = istemci.cagir("dizin", "ara", "naruto", yerel=yerel_kaydedici(cagrilar))
+    
+    assert sonuc == ["dizin", "ara", ["naruto"]]
+    assert cagrilar == []
+    assert istemci.kullanilabilir
+    assert istemci.hatalar == []
+
+
+def test_servis_yoksa_yerele_doner_ve_gunluge_yazar(servis, istemci, capsys):
+    servis.durdur()
+    cagrilar = []
+    
+    assert istemci.cagir("dizin", "ara", "naruto", yerel=yerel_kaydedici(cagrilar)) == "yerel"
+    
+    assert cagrilar == [("naruto",)]
+    assert not istemci.kullanilabilir
+    assert len(istemci.hatalar) == 1
+    assert capsys.readouterr().out == ""
+    # Yerel karşılığı olmayan çağrı hata verir
+    with pytest.raises(ConnectionError):
+        istemci.cagir("servis", "durum")
+
+
+def test_yavas_servis_yerelde_tekrarlanmaz_ve_devre_disi_sayilmaz(servis, istemci):
+    servis.gecikme = 0.3
+    istemci.zaman_asimi = 0.05
+    istemci.kapat()
+    cagrilar = []
+    
+    with pytest.raises(Exception, match="Servis yanıt vermedi"):
+        istemci.cagir("dizin", "ara", "naruto", yerel=yerel_kaydedici(cagrilar))
+    
+    assert cagrilar == []
+    assert istemci.kullanilabilir
+    assert istemci.hatalar == []
+    # Gecikmeli yanıtın kaldığı bağlantı yeniden kullanılmaz
+    servis.gecikme = 0.0
+    istemci.zaman_asimi = 5.0
+    assert istemci.cagir("dizin", "ara", "bleach") == ["dizin", "ara", ["bleach"]]
+
+
+def test_servis_sure_dolunca_yeniden_sinanir(servis, istemci, monkeypatch):
+    servis.durdur()
+    cagrilar = []
+    istemci.cagir("dizin", "ara", "a", yerel=yerel_kaydedici(cagrilar))
+    
+    # Sınama süresi dolmadan servis geri gelse de yerel kullanılır
+    servis.baslat()
+    baglantilar = servis.baglantilar
+    assert istemci.cagir("dizin", "ara", "b", yerel=yerel_kaydedici(cagrilar)) == "yerel"
+    assert servis.baglantilar == baglantilar
+    
+    istemci._sinama_zamani = 0.0
+    assert istemci.cagir("dizin", "ara", "c", yerel=yerel_kaydedici(cagrilar)) == ["dizin", "ara", ["c"]]
+    assert istemci.kullanilabilir
+    assert cagrilar == [("a",), ("b",)]
+    # Servise ulaşılamama yalnızca bir kez günlüğe yazılır
+    assert len(istemci.hatalar) == 1
+
+
+def test_altyazi_dizini_sinirlidir(monkeypatch):
+    monkeypatch.setattr(main.AsenkronAnimeCix, "EN_FAZLA_ALTYAZI", 3)
+    kaynak = main.AnimeCix()
+    try:
+        for no in range(5):
+            kaynak.cekirdek._altyazilari_kaydet(f"izle/b{no}", [{"language": "tr", "url": f"https://x/{no}.vtt"}])
+        assert list(kaynak.cekirdek._altyazi_dizini) == ["izle/b2", "izle/b3", "izle/b4"]
+        assert kaynak.tr_altyazi_al(0, 4, 1, "izle/b4") == "https://x/4.vtt"
+    finally:
+        kaynak.kapat()
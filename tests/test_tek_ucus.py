@@ -0,0 +1,112 @@
+"""AsenkronTekUcus'un eşzamanlı çağrıları birleştirmesi ve çekirdeğin _json_al'ının paylaşılan yanıtın kopyasını vermesi"""
+
+import asyncio
+
+import pytest
+
+import main
+
+
+def yavas(sonuc, olay: asyncio.Event, cagrilar: list):
+    async def islem():
+        cagrilar.append(1)
+        await olay.wait()
+        return sonuc
+    return islem
+
+
+def test_eszamanli_cagrilar_tek_calistirmada_birlesir():
+    async def senaryo():
+        tek_ucus = main.AsenkronTekUcus()
+        olay = asyncio.Event()
+        cagrilar = []
+        gorevler = [asyncio.ensure_future(tek_ucus.calistir("a", yavas("sonuc", olay, cagrilar))) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        olay.set()
+        sonuclar = await asyncio.gather(*gorevler)
+        
+        assert cagrilar == [1]
+        assert sonuclar == ["sonuc"] * 5
+        assert tek_ucus.istatistikler() == {"cagri": 5, "birlesen": 4}
+        
+        async def yeni():
+            return "yeni"
+        
+        # Uçuş bitince aynı anahtar yeni bir çalıştırma başlatır
+        assert await tek_ucus.calistir("a", yeni) == "yeni"
+    
+    asyncio.run(senaryo())
+
+
+def test_bekleyenin_suresi_dolunca_istisna_verilir_ve_oncu_surer():
+    async def senaryo():
+        tek_ucus = main.AsenkronTekUcus()
+        olay = asyncio.Event()
+        cagrilar = []
+        oncu = asyncio.ensure_future(tek_ucus.calistir("a", yavas("sonuc", olay, cagrilar)))
+        await asyncio.sleep(0.01)
+        
+        with pytest.raises(Exception, match="zaman aşımı"):
+            await tek_ucus.calistir("a", yavas("kullanilmaz", olay, cagrilar), zaman_asimi=0.05)
+        
+        olay.set()
+        assert await oncu == "sonuc"
+        assert cagrilar == [1]
+    
+    asyncio.run(senaryo())
+
+
+def test_oncunun_suresi_dolunca_istisna_verilir_ve_bekleyen_sonucu_alir():
+    async def senaryo():
+        tek_ucus = main.AsenkronTekUcus()
+        olay = asyncio.Event()
+        cagrilar = []
+        oncu = asyncio.ensure_future(tek_ucus.calistir("a", yavas("sonuc", olay, cagrilar), zaman_asimi=0.05))
+        await asyncio.sleep(0.01)
+        bekleyen = asyncio.ensure_future(tek_ucus.calistir("a", yavas("kullanilmaz", olay, cagrilar)))
+        
+        with pytest.raises(Exception, match="zaman aşımı"):
+            await oncu
+        
+        olay.set()
+        assert await bekleyen == "sonuc"
+        assert cagrilar == [1]
+    
+    asyncio.run(senaryo())
+
+
+def test_oncunun_hatasi_bekleyenlere_iletilir():
+    async def senaryo():
+        tek_ucus = main.AsenkronTekUcus()
+        olay = asyncio.Event()
+        
+        async def bozuk():
+            await olay.wait()
+            raise ValueError("bozuk yanıt")
+        
+        gorevler = [asyncio.ensure_future(tek_ucus.calistir("a", bozuk)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        olay.set()
+        sonuclar = await asyncio.gather(*gorevler, return_exceptions=True)
+        assert [str(sonuc) for sonuc in sonuclar] == ["bozuk yanıt"] * 3
+    
+    asyncio.run(senaryo())
+
+
+def test_json_al_her_cagirana_kendi_kopyasini_verir(monkeypatch):
+    kaynak = main.AsenkronAnimeCix()
+    paylasilan = {"results": [{"id": 1, "name": "Naruto"}]}
+    
+    async def json_getir(url):
+        return paylasilan
+    
+    monkeypatch.setattr(kaynak, "_json_getir", json_getir)
+    
+    async def senaryo():
+        ilk = await kaynak._json_al("https://animecix.tv/secure/search/naruto")
+        ilk["results"][0]["name"] = "değişti"
+        ilk["results"].clear()
+        return await kaynak._json_al("https://animecix.tv/secure/search/naruto")
+    
+    assert asyncio.run(senaryo()) == {"results": [{"id": 1, "name": "Naruto"}]}
+    assert paylasilan == {"results": [{"id": 1, "name": "Naruto"}]}
@@ -0,0 +1,79 @@
+"""Çekirdeğin p95 yedek isteği, kaybeden isteğin iptali ve kullanıcı işlemlerinin süre bütçeleri"""
+
+import time
+
+import pytest
+
+
+def iptal_bekle(sunucu, yol: str) -> None:
+    son = time.monotonic() + 2
+    while yol not in sunucu.iptaller and time.monotonic() < son:
+        time.sleep(0.01)
+
+
+def test_yavas_asil_istekte_yedek_kazanir_ve_kaybeden_iptal_edilir(api_sunucusu, cekirdek_kur):
+    asil, ayna = api_sunucusu(), api_sunucusu()
+    asil.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": [{"id": 1}]}, 3.0)
+    ayna.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": [{"id": 2}]}, 0.0)
+    cekirdek = cekirdek_kur(asil, ayna, yedek_gecikmesi=0.05)
+    
+    baslangic = time.monotonic()
+    sonuclar = cekirdek_kur.calistir(cekirdek, cekirdek.arama_verisi_al("x"))
+    
+    assert [sonuc["id"] for sonuc in sonuclar] == [2]
+    assert time.monotonic() - baslangic < 1.0
+    assert {k: cekirdek.sayaclar[k] for k in ("yedek_istek", "yedek_kazandi")} == {"yedek_istek": 1, "yedek_kazandi": 1}
+    # Kaybeden isteğin bağlantısı yanıt beklenmeden kapatılır
+    iptal_bekle(asil, cekirdek_kur.ARAMA_YOLU)
+    assert asil.iptaller == [cekirdek_kur.ARAMA_YOLU]
+
+
+def test_hizli_asil_istekte_yedek_gonderilmez(api_sunucusu, cekirdek_kur):
+    asil, ayna = api_sunucusu(), api_sunucusu()
+    asil.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": [{"id": 1}]}, 0.0)
+    cekirdek = cekirdek_kur(asil, ayna, yedek_gecikmesi=0.05)
+    
+    assert [sonuc["id"] for sonuc in cekirdek_kur.calistir(cekirdek, cekirdek.arama_verisi_al("x"))] == [1]
+    assert cekirdek.sayaclar["yedek_istek"] == 0
+    assert ayna.istekler == []
+
+
+def test_basarisiz_asil_istekte_yedek_hemen_gonderilir(api_sunucusu, cekirdek_kur):
+    asil, ayna = api_sunucusu(), api_sunucusu()
+    asil.yollar[cekirdek_kur.ARAMA_YOLU] = (503, {}, b"", 0.0)
+    ayna.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": [{"id": 2}]}, 0.0)
+    cekirdek = cekirdek_kur(asil, ayna, yedek_gecikmesi=5.0)
+    
+    baslangic = time.monotonic()
+    assert [sonuc["id"] for sonuc in cekirdek_kur.calistir(cekirdek, cekirdek.arama_verisi_al("x"))] == [2]
+    assert time.monotonic() - baslangic < 1.0
+
+
+def test_yedeklenmeyen_istek_yalnizca_asil_hosta_gider(api_sunucusu, cekirdek_kur):
+    asil, ayna = api_sunucusu(), api_sunucusu()
+    asil.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": [{"id": 1}]}, 0.2)
+    cekirdek = cekirdek_kur(asil, ayna, yedek_istek=False)
+    
+    assert [sonuc["id"] for sonuc in cekirdek_kur.calistir(cekirdek, cekirdek.arama_verisi_al("x"))] == [1]
+    assert len(asil.istekler) == 1
+    assert ayna.istekler == []
+
+
+def test_baslik_istegi_baslik_butcesini_kullanir(api_sunucusu, cekirdek_kur):
+    asil, ayna = api_sunucusu(), api_sunucusu()
+    asil.yollar["/secure/titles/7?titleId=7"] = (200, {}, {"title": {"id": 7}}, 2.0)
+    cekirdek = cekirdek_kur(asil, ayna, yedek_istek=False, baslik_butcesi=0.2, bolum_listesi_butcesi=None)
+    
+    baslangic = time.monotonic()
+    with pytest.raises(Exception, match="Anime verisi alınamadı: Süre bütçesi doldu"):
+        cekirdek_kur.calistir(cekirdek, cekirdek.id_ile_anime_al("7"))
+    assert time.monotonic() - baslangic < 1.0
+    assert cekirdek.sayaclar["butce_asimi"] == 1
+
+
+def test_cagrida_verilen_sure_butceyi_gecersiz_kilar(api_sunucusu, cekirdek_kur):
+    asil, ayna = api_sunucusu(), api_sunucusu()
+    asil.yollar[cekirdek_kur.ARAMA_YOLU] = (200, {}, {"results": [{"id": 1}]}, 0.3)
+    cekirdek = cekirdek_kur(asil, ayna, yedek_istek=False, arama_butcesi=0.05)
+    
+    assert [sonuc["id"] for sonuc in cekirdek_kur.calistir(cekirdek, cekirdek.arama_verisi_al("x", zaman_asimi=2.0))] == [1]